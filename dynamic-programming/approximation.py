@@ -0,0 +1,351 @@
+from __future__ import division
+import hashlib
+
+import numpy as np
+
+
+def chebyshev_nodes(n, domain):
+    """
+    Roots of the Chebyshev polynomial of degree n mapped into domain. These
+    are the interpolation nodes used throughout the notebook.
+
+    Arguments:
+
+        n:      (int) Degree of the Chebyshev polynomial whose roots we want.
+        domain: (tuple) Lower and upper bounds of the approximation interval.
+
+    Returns:
+
+        nodes: (array) The n roots in increasing order.
+
+    """
+    basis_coefs = np.zeros(n + 1)
+    basis_coefs[-1] = 1
+    nodes = np.polynomial.Chebyshev(basis_coefs, domain=domain).roots()
+    return np.sort(nodes.real)
+
+
+class ChebyshevBasis(object):
+    """
+    Chebyshev polynomial basis of fixed degree on a fixed set of nodes.
+
+    The basis matrix at the nodes, its least squares pseudo-inverse and the
+    basis matrices at any evaluation points are built once and then reused,
+    so that fitting a function from its values at the nodes, and evaluating
+    an approximation on a fixed grid, are each a single matrix product.
+
+    The default domain is [-1, 1] which matches chebfit and the Chebyshev
+    class as used in the notebook. Any other domain should contain every
+    point at which the approximation will be evaluated (e.g., all feasible
+    values of next period's capital) and not just the nodes: high degree
+    polynomials are explosive outside of their domain.
+
+    Attributes:
+
+        nodes:        (array) Interpolation nodes.
+        deg:          (int) Degree of the Chebyshev polynomial.
+        domain:       (tuple) Approximation interval.
+        basis_matrix: (array) Basis functions evaluated at the nodes.
+
+    """
+
+    def __init__(self, nodes, deg, domain=(-1, 1)):
+        self.nodes = np.asarray(nodes, dtype=float)
+        self.deg = deg
+        self.domain = tuple(domain)
+
+        if self.nodes.size < deg + 1:
+            raise ValueError("Need at least deg + 1 nodes to fit the basis.")
+
+        self.basis_matrix = self.vandermonde(self.nodes)
+
+        # least squares fit via the pseudo-inverse of the (column scaled)
+        # basis matrix, truncating small singular values like chebfit does
+        scale = np.sqrt(np.sum(self.basis_matrix**2, axis=0))
+        rcond = self.nodes.size * np.finfo(float).eps
+        pinv = np.linalg.pinv(self.basis_matrix / scale, rcond)
+        self.fit_matrix = pinv / scale[:, np.newaxis]
+
+        self._eval_matrices = {}
+
+    def _map(self, x):
+        """Map points from the domain into [-1, 1]."""
+        lower, upper = self.domain
+        return (2 * np.asarray(x, dtype=float) - (lower + upper)) / (upper - lower)
+
+    def vandermonde(self, x):
+        """
+        Basis functions evaluated at x.
+
+        Arguments:
+
+            x: (array) Points in the domain.
+
+        Returns:
+
+            B: (array) Array of shape x.shape + (deg + 1,).
+
+        """
+        return np.polynomial.chebyshev.chebvander(self._map(x), self.deg)
+
+    def eval_matrix(self, x):
+        """
+        Cached basis matrix at the points x. Repeated calls with an array
+        holding the same values return the matrix built on the first call.
+
+        """
+        x = np.ascontiguousarray(x, dtype=float)
+        key = (x.shape, hashlib.sha1(x).hexdigest())
+        try:
+            B = self._eval_matrices[key]
+        except KeyError:
+            B = self.vandermonde(x)
+            self._eval_matrices[key] = B
+        return B
+
+    def fit(self, vals):
+        """
+        Least squares Chebyshev coefficients given values at the nodes.
+
+        Arguments:
+
+            vals: (array) Function values at the nodes. May have trailing
+                  dimensions in which case one fit is done per column.
+
+        Returns:
+
+            coefs: (array) Chebyshev coefficients.
+
+        """
+        return self.fit_matrix.dot(vals)
+
+    def evaluate(self, coefs, x=None):
+        """
+        Evaluate the approximation with coefficients coefs at x (default is
+        the nodes) using cached basis matrices.
+
+        """
+        if x is None:
+            B = self.basis_matrix
+        else:
+            B = self.eval_matrix(x)
+        return B.dot(coefs)
+
+    def polynomial(self, coefs):
+        """Wrap coefs in a callable instance of the Chebyshev class."""
+        return np.polynomial.Chebyshev(coefs, domain=self.domain)
+
+    def approximate(self, vals, slopes=None):
+        """
+        Least squares approximation given values at the nodes. Slopes are
+        not used by a Chebyshev basis and are accepted only so that all
+        approximation schemes share the same interface.
+
+        """
+        return self.polynomial(self.fit(vals))
+
+    def sup_distance(self, v, w, pts):
+        """
+        Supremum norm distance between two approximations on pts, computed
+        as a single product with the cached basis matrix at pts when both
+        are Chebyshev polynomials of this basis. Anything else (e.g., a
+        callable initial guess) is evaluated at pts instead.
+
+        """
+        if self._compatible(v) and self._compatible(w):
+            B = self.eval_matrix(pts)
+            return np.max(np.abs(B.dot(v.coef - w.coef)))
+        return np.max(np.abs(v(pts) - w(pts)))
+
+    def _compatible(self, v):
+        """Is v a Chebyshev polynomial with the degree and domain of the basis?"""
+        return (isinstance(v, np.polynomial.Chebyshev) and v.coef.size == self.deg + 1 and
+                np.allclose(v.domain, self.domain))
+
+
+def estimate_slopes(x, y):
+    """
+    Estimate slopes at the nodes from function values using the shape
+    preserving formulas of Schumaker (1983) given in Judd (1998), p. 233.
+
+    Arguments:
+
+        x: (array) Strictly increasing nodes.
+        y: (array) Function values at the nodes.
+
+    Returns:
+
+        s: (array) Slope estimates at the nodes.
+
+    """
+    dx = np.diff(x)
+    dy = np.diff(y)
+    delta = dy / dx
+    L = np.sqrt(dx**2 + dy**2)
+
+    s = np.empty(x.size)
+
+    # interior slopes are zero wherever the secants change sign
+    s[1:-1] = np.where(delta[:-1] * delta[1:] > 0,
+                       (L[:-1] * delta[:-1] + L[1:] * delta[1:]) / (L[:-1] + L[1:]),
+                       0.0)
+
+    # end point slopes
+    s[0] = (3 * delta[0] - s[1]) / 2
+    s[-1] = (3 * delta[-1] - s[-2]) / 2
+
+    return s
+
+
+class SchumakerSpline(object):
+    """
+    Schumaker (1983) shape-preserving quadratic spline. Each interval
+    between consecutive nodes is split at a knot into two quadratic pieces
+    so that the spline interpolates the values and slopes at the nodes
+    while preserving monotonicity and concavity of the data.
+
+    If slopes are supplied (e.g., from the envelope condition) the spline
+    uses the Hermite data; otherwise slopes are estimated from the values.
+    Construction and evaluation are vectorized over all intervals.
+
+    Attributes:
+
+        x: (array) Nodes.
+        y: (array) Function values at the nodes.
+        s: (array) Slopes at the nodes.
+
+    """
+
+    def __init__(self, x, y, s=None):
+        self.x = np.asarray(x, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+
+        if s is None:
+            s = estimate_slopes(self.x, self.y)
+        self.s = np.asarray(s, dtype=float)
+
+        self._build()
+
+    def _build(self):
+        """Compute the knots and the coefficients of the quadratic pieces."""
+        x, y, s = self.x, self.y, self.s
+        z1, z2 = x[:-1], x[1:]
+        s1, s2 = s[:-1], s[1:]
+        h = z2 - z1
+        delta = (y[1:] - y[:-1]) / h
+
+        # location of the additional knot in each interval
+        with np.errstate(divide='ignore', invalid='ignore'):
+            left = z1 + h * (s2 - delta) / (s2 - s1)
+            right = z2 + h * (s1 - delta) / (s2 - s1)
+
+        xi = np.where(np.abs(s2 - delta) < np.abs(s1 - delta),
+                      (z1 + left) / 2, (z2 + right) / 2)
+        xi = np.where((s1 - delta) * (s2 - delta) >= 0, (z1 + z2) / 2, xi)
+
+        alpha = xi - z1
+        beta = z2 - xi
+
+        # slope and value of the spline at the knot
+        s_bar = (2 * (y[1:] - y[:-1]) - (alpha * s1 + beta * s2)) / h
+        y_bar = y[:-1] + alpha * (s1 + s_bar) / 2
+
+        self.xi = xi
+        self._left = (y[:-1], s1, (s_bar - s1) / (2 * alpha))
+        self._right = (y_bar, s_bar, (s2 - s_bar) / (2 * beta))
+
+    def __call__(self, pts):
+        """Evaluate the spline (extrapolating with the end pieces)."""
+        pts = np.asarray(pts, dtype=float)
+        idx = np.clip(np.searchsorted(self.x, pts) - 1, 0, self.x.size - 2)
+
+        on_left = pts < self.xi[idx]
+        origin = np.where(on_left, self.x[idx], self.xi[idx])
+        c0, c1, c2 = [np.where(on_left, l[idx], r[idx]) for l, r in zip(self._left, self._right)]
+
+        dx = pts - origin
+        return c0 + c1 * dx + c2 * dx**2
+
+
+class HermiteSpline(object):
+    """
+    Piecewise cubic Hermite interpolation given values and slopes at the
+    nodes. Evaluation is vectorized over arbitrary arrays of points.
+
+    Attributes:
+
+        x: (array) Nodes.
+        y: (array) Function values at the nodes.
+        s: (array) Slopes at the nodes.
+
+    """
+
+    def __init__(self, x, y, s):
+        self.x = np.asarray(x, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+        self.s = np.asarray(s, dtype=float)
+
+    def __call__(self, pts):
+        """
+        Evaluate the spline, extrapolating linearly with the value and slope
+        at the nearest end node (the end cubics can turn sharply, and even
+        overflow, away from the nodes).
+
+        """
+        pts = np.asarray(pts, dtype=float)
+        idx = np.clip(np.searchsorted(self.x, pts) - 1, 0, self.x.size - 2)
+
+        inside = np.clip(pts, self.x[0], self.x[-1])
+        h = self.x[idx + 1] - self.x[idx]
+        t = (inside - self.x[idx]) / h
+
+        # cubic Hermite basis functions
+        h00 = (1 + 2 * t) * (1 - t)**2
+        h10 = t * (1 - t)**2
+        h01 = t**2 * (3 - 2 * t)
+        h11 = t**2 * (t - 1)
+
+        vals = (h00 * self.y[idx] + h10 * h * self.s[idx] +
+                h01 * self.y[idx + 1] + h11 * h * self.s[idx + 1])
+
+        # linear extrapolation beyond the end nodes
+        vals = vals + np.where(pts < self.x[0], self.s[0] * (pts - self.x[0]), 0.0)
+        vals = vals + np.where(pts > self.x[-1], self.s[-1] * (pts - self.x[-1]), 0.0)
+        return vals
+
+
+class SplineBasis(object):
+    """
+    Interpolation on a fixed grid using a shape-preserving Schumaker spline
+    or a cubic Hermite spline. Shares the interface of ChebyshevBasis so it
+    can be passed to the Bellman operators in place of a Chebyshev basis.
+
+    Attributes:
+
+        nodes: (array) Interpolation nodes.
+        kind:  (str) Either 'schumaker' or 'hermite'.
+
+    """
+
+    def __init__(self, nodes, kind='schumaker'):
+        if kind not in ('schumaker', 'hermite'):
+            raise ValueError("kind must be either 'schumaker' or 'hermite'.")
+        self.nodes = np.sort(np.asarray(nodes, dtype=float))
+        self.kind = kind
+
+    def approximate(self, vals, slopes=None):
+        """
+        Interpolate values (and slopes, if known) at the nodes. Without
+        slopes (e.g., when approximating a policy function) both kinds use
+        the shape-preserving slope estimates of estimate_slopes.
+
+        """
+        if self.kind == 'schumaker':
+            return SchumakerSpline(self.nodes, vals, slopes)
+        if slopes is None:
+            slopes = estimate_slopes(self.nodes, np.asarray(vals, dtype=float))
+        return HermiteSpline(self.nodes, vals, slopes)
+
+    def sup_distance(self, v, w, pts):
+        """Supremum norm distance between two approximations on pts."""
+        return np.max(np.abs(v(pts) - w(pts)))
@@ -0,0 +1,310 @@
+from __future__ import division
+import hashlib
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+try:
+    import h5py
+except ImportError:
+    h5py = None
+
+
+# evaluate function shared by the worker processes of solve_backward
+_worker_evaluate = None
+
+
+def _replace(src, dst):
+    getattr(os, 'replace', os.rename)(src, dst)
+
+
+def _atomic_write(filename, write):
+    """Call write(f) on a temporary file, then rename it to filename."""
+    directory = os.path.dirname(os.path.abspath(filename))
+    fd, tmp_file = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            write(f)
+        _replace(tmp_file, filename)
+    except Exception:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        raise
+
+
+def save_iterate(filename, n_iter, vals):
+    """
+    Atomically save the values of an iterate at the nodes together with the
+    iteration count (written to a temporary file and renamed into place, so
+    an interruption never leaves a partial checkpoint).
+
+    """
+    _atomic_write(filename, lambda f: np.save(f, np.append(float(n_iter), vals)))
+
+
+def load_iterate(filename):
+    """
+    Iteration count and values at the nodes saved by save_iterate, or
+    (0, None) if there is no checkpoint.
+
+    """
+    try:
+        data = np.load(filename)
+    except (IOError, OSError, ValueError):
+        return 0, None
+    return int(data[0]), data[1:]
+
+
+class CheckpointStore(object):
+    """
+    On-disk arrays for the results of a finite horizon DP solved backwards
+    over n_steps time steps: for every name in arrays, an array with shape
+    (n_steps,) + shape, plus a flag per time step that is set only after
+    the step's results are on disk. Arrays are memory mapped .npy files
+    (or datasets of one HDF5 file with backend='hdf5', which needs h5py),
+    so only the time steps being read or written are held in memory.
+
+    The number of steps, the shapes and the key are recorded in the store.
+    Opening a store on a directory that already holds one with the same
+    record resumes it: completed steps are kept, and writes made after the
+    last commit are ignored. A directory holding a different store raises
+    ValueError rather than mixing results of two problems. If any array
+    is missing or damaged, every step is marked as not completed.
+
+    Arguments:
+
+        directory: (str) Directory holding the store (created if needed).
+        n_steps:   (int) Number of time steps.
+        arrays:    (dict) Shape of the results of one time step by name.
+        backend:   (str) Either 'npy' or 'hdf5'.
+        key:       (str) Identifies the problem whose results are stored
+                   (e.g., a hash of its inputs).
+
+    """
+
+    def __init__(self, directory, n_steps, arrays, backend='npy', key=None):
+        if backend not in ('npy', 'hdf5'):
+            raise ValueError("backend must be 'npy' or 'hdf5'.")
+        if backend == 'hdf5' and h5py is None:
+            raise ImportError("backend='hdf5' requires h5py.")
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        self.directory = directory
+        self.n_steps = n_steps
+        self.backend = backend
+        self.arrays = {}
+
+        record = {'n_steps': int(n_steps), 'key': key,
+                  'arrays': dict((name, [int(n) for n in shape]) for name, shape in arrays.items())}
+        if backend == 'hdf5':
+            self._file = h5py.File(os.path.join(directory, 'checkpoint.h5'), 'a')
+        stored = self._read_record()
+        if stored is not None and stored != record:
+            if backend == 'hdf5':
+                self._file.close()
+            raise ValueError("%s holds the checkpoint of a different problem (%r, expected %r)."
+                             % (directory, stored, record))
+
+        # without a record nothing on disk can be trusted
+        fresh = stored is None
+        for name, shape in arrays.items():
+            self.arrays[name], created = self._open(name, (n_steps,) + tuple(shape), float, fresh)
+            fresh = fresh or created
+        self.done, _ = self._open('done', (n_steps,), bool, fresh)
+        if stored is None:
+            self._write_record(record)
+
+    def _read_record(self):
+        try:
+            if self.backend == 'npy':
+                with open(os.path.join(self.directory, 'checkpoint.json')) as f:
+                    return json.load(f)
+            return json.loads(self._file.attrs['checkpoint'])
+        except (IOError, OSError, KeyError, ValueError):
+            return None
+
+    def _write_record(self, record):
+        text = json.dumps(record, sort_keys=True)
+        if self.backend == 'npy':
+            _atomic_write(os.path.join(self.directory, 'checkpoint.json'),
+                          lambda f: f.write(text.encode('utf-8')))
+        else:
+            self._file.attrs['checkpoint'] = text
+            self._file.flush()
+
+    def _open(self, name, shape, dtype, fresh):
+        """Array name (created filled with zeros if fresh) and whether it was created."""
+        if self.backend == 'npy':
+            filename = os.path.join(self.directory, name + '.npy')
+            if not fresh and os.path.exists(filename):
+                try:
+                    array = np.lib.format.open_memmap(filename, mode='r+')
+                except ValueError:
+                    array = None
+                if array is not None and array.shape == shape and array.dtype == dtype:
+                    return array, False
+                del array
+            array = np.lib.format.open_memmap(filename, mode='w+', dtype=dtype, shape=shape)
+            return array, True
+
+        if name in self._file:
+            dataset = self._file[name]
+            if not fresh and dataset.shape == shape and dataset.dtype == dtype:
+                return dataset, False
+            del self._file[name]
+        return self._file.create_dataset(name, shape, dtype=dtype, fillvalue=0), True
+
+    def __getitem__(self, name):
+        return self.arrays[name]
+
+    def completed(self):
+        """Boolean array flagging the time steps whose results are on disk."""
+        return np.array(self.done[...], dtype=bool)
+
+    def write(self, step, **results):
+        """Write the results of a time step (not durable until commit)."""
+        for name, value in results.items():
+            self.arrays[name][step] = value
+
+    def read(self, step):
+        """Results of a time step as a dict of arrays."""
+        return dict((name, np.array(array[step])) for name, array in self.arrays.items())
+
+    def flush(self):
+        if self.backend == 'npy':
+            for array in self.arrays.values():
+                array.flush()
+            self.done.flush()
+        else:
+            self._file.flush()
+
+    def commit(self, steps):
+        """
+        Make the results of steps durable: the arrays are flushed before
+        the steps are flagged as completed, so a flag never refers to
+        results that are not on disk.
+
+        """
+        self.flush()
+        for step in np.atleast_1d(steps):
+            self.done[step] = True
+        self.flush()
+
+    def close(self):
+        self.flush()
+        if self.backend == 'hdf5':
+            self._file.close()
+
+
+def _init_worker(evaluate):
+    global _worker_evaluate
+    _worker_evaluate = evaluate
+
+
+def _evaluate_slice(args):
+    t, coefs, nodes = args
+    return _worker_evaluate(t, coefs, nodes)
+
+
+def solve_backward(evaluate, fit, terminal_coefs, n_steps, n_nodes, directory,
+                   interval=1, processes=1, n_slices=None, backend='npy', mesg=False):
+    """
+    Solve a finite horizon DP (e.g., a DSICE-style climate model with one
+    value function per period) backwards from period n_steps - 1 to 0,
+    checkpointing the value function and policy coefficients of each
+    period in a CheckpointStore. Calling again with the same directory
+    resumes after the last committed period. The store is keyed by the
+    shapes of the results and by terminal_coefs, so a directory left by a
+    different problem raises ValueError; evaluate and fit cannot be
+    compared, so use one directory per model.
+
+    The nodes of each period are split into n_slices slices which are
+    evaluated in parallel by a pool of worker processes; the coefficients
+    of the period are then fit from the values at all the nodes.
+
+    Arguments:
+
+        evaluate:       (callable) evaluate(t, coefs, nodes) returns the
+                        values (shape (len(nodes),)) and policies (shape
+                        (len(nodes), n_controls)) of period t at the nodes
+                        with the given indices, given the value function
+                        coefficients coefs of period t + 1. Must be a module
+                        level function if processes > 1.
+        fit:            (callable) fit(values, policies) returns the value
+                        function and policy coefficients of a period.
+        terminal_coefs: (array) Value function coefficients of period
+                        n_steps (the terminal value).
+        n_steps:        (int) Number of periods to solve.
+        n_nodes:        (int) Number of nodes.
+        directory:      (str) Directory of the checkpoint store.
+        interval:       (int) Number of periods between commits.
+        processes:      (int) Number of worker processes.
+        n_slices:       (int) Number of slices of the nodes. Default is
+                        processes.
+        backend:        (str) Storage backend, see CheckpointStore.
+        mesg:           (boolean) Print progress.
+
+    Returns:
+
+        store: (object) The CheckpointStore with arrays 'value_coefs',
+               'policy_coefs', 'values' and 'policies' (index t).
+
+    """
+    if n_slices is None:
+        n_slices = processes
+    slices = np.array_split(np.arange(n_nodes), n_slices)
+    terminal_coefs = np.asarray(terminal_coefs, dtype=float)
+
+    # the shapes of the results are those of the last period
+    values, policies = evaluate(n_steps - 1, terminal_coefs, slices[0][:1])
+    value_coefs, policy_coefs = fit(np.zeros(n_nodes),
+                                    np.zeros((n_nodes,) + np.shape(policies)[1:]))
+    store = CheckpointStore(directory, n_steps,
+                            {'value_coefs': np.shape(value_coefs),
+                             'policy_coefs': np.shape(policy_coefs),
+                             'values': (n_nodes,),
+                             'policies': (n_nodes,) + np.shape(policies)[1:]},
+                            backend, hashlib.sha1(np.ascontiguousarray(terminal_coefs)).hexdigest())
+
+    completed = store.completed()
+    pool = None
+    if processes > 1:
+        pool = multiprocessing.Pool(processes, _init_worker, (evaluate,))
+    try:
+        coefs = terminal_coefs
+        pending = []
+        for t in range(n_steps - 1, -1, -1):
+            if completed[t]:
+                coefs = np.array(store['value_coefs'][t])
+                continue
+
+            tasks = [(t, coefs, nodes) for nodes in slices]
+            if pool is not None:
+                results = pool.map(_evaluate_slice, tasks)
+            else:
+                results = [evaluate(*task) for task in tasks]
+            values = np.concatenate([result[0] for result in results])
+            policies = np.concatenate([result[1] for result in results])
+
+            coefs, policy_coefs = fit(values, policies)
+            store.write(t, value_coefs=coefs, policy_coefs=policy_coefs,
+                        values=values, policies=policies)
+            pending.append(t)
+
+            if len(pending) == interval or t == 0:
+                store.commit(pending)
+                pending = []
+                if mesg:
+                    sys.stdout.write("Checkpointed period %i\n" % t)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        store.flush()
+
+    return store
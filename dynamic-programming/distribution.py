@@ -0,0 +1,192 @@
+from __future__ import division
+import sys
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse import linalg
+
+import lifecycle_egm
+
+
+def lottery(grid, aplus):
+    """
+    Histogram (lottery) method of Young (2010): an agent choosing aplus
+    between grid[j] and grid[j + 1] moves to grid[j] with probability
+    (grid[j + 1] - aplus) / (grid[j + 1] - grid[j]) and to grid[j + 1]
+    otherwise, so that the mean of assets is preserved. Choices outside the
+    grid are moved to its end points.
+
+    Returns:
+
+        lower:  (array) Index j of the lower grid point, shape of aplus.
+        weight: (array) Probability of moving to grid[j].
+
+    """
+    aplus = np.clip(aplus, grid[0], grid[-1])
+    lower = np.clip(np.searchsorted(grid, aplus, side='right') - 1, 0, grid.size - 2)
+    weight = (grid[lower + 1] - aplus) / (grid[lower + 1] - grid[lower])
+    return lower, weight
+
+
+class LotteryTransition(object):
+    """
+    Transition matrix of the cross-sectional distribution on the grid of
+    (shock, assets) pairs, with state index s * n_assets + i, given a
+    savings policy aplus[s, i] and the Markov chain of the shocks.
+
+    Every agent moves to two adjacent asset points in each of the S shock
+    states, so every row has 2 S entries stored in the same order for every
+    policy: (s', lower), (s', lower + 1) for s' = 0, ..., S - 1, already
+    sorted by column. The row pointers and the shock probabilities are
+    built once, and updating the matrix for a new policy (e.g., after
+    re-solving the household problem for a new interest rate) only
+    recomputes the lottery and the column indices, which go straight into
+    a CSR matrix with no sorting. Stationary distributions start from the
+    previous one, which saves iterations only when the policy has changed
+    little.
+
+    Arguments:
+
+        grid:       (array) Strictly increasing asset grid, shape (n,).
+        transition: (array) Transition matrix of the shocks, shape (S, S).
+
+    """
+
+    def __init__(self, grid, transition):
+        self.grid = np.asarray(grid, dtype=float)
+        self.transition = np.asarray(transition, dtype=float)
+        S, n = self.transition.shape[0], self.grid.size
+        self.shape = (S * n, S * n)
+
+        # entry (s, i, s', k) moves agent (s, i) to shock s' and the k-th
+        # of its two asset points
+        s, i, splus, k = np.meshgrid(np.arange(S), np.arange(n), np.arange(S), np.arange(2),
+                                     indexing='ij')
+        self._indptr = np.arange(0, 2 * S * S * n + 1, 2 * S)
+        self._col_base = (splus * n + k).ravel()
+        self._probs = self.transition[s, splus].ravel()
+        self._lottery_side = k.ravel()
+
+        self.matrix = None
+        self.distribution = None
+
+    def update(self, aplus):
+        """
+        Transition matrix (scipy.sparse.csr_matrix) for the savings policy
+        aplus with shape (S, n).
+
+        """
+        lower, weight = lottery(self.grid, np.asarray(aplus, dtype=float))
+        S, n = lower.shape
+        lower = np.broadcast_to(lower[:, :, np.newaxis, np.newaxis], (S, n, S, 2)).ravel()
+        weight = np.broadcast_to(weight[:, :, np.newaxis, np.newaxis], (S, n, S, 2)).ravel()
+
+        cols = self._col_base + lower
+        values = self._probs * np.where(self._lottery_side == 0, weight, 1 - weight)
+        self.matrix = sparse.csr_matrix((values, cols, self._indptr), shape=self.shape)
+        return self.matrix
+
+    def stationary(self, aplus=None, method='power', tol=1e-12, max_iter=100000,
+                   mesg=False):
+        """
+        Stationary distribution of the transition matrix for the savings
+        policy aplus (default is the last one passed to update), starting
+        from the previous stationary distribution if there is one.
+
+        Arguments:
+
+            aplus:    (array) Savings policy with shape (S, n).
+            method:   (str) 'power' (iterate the distribution forward) or
+                      'arnoldi' (scipy.sparse.linalg.eigs for the unit
+                      eigenvalue).
+            tol:      (float) Convergence criterion on the sup norm change
+                      of the distribution (power method).
+            max_iter: (int) Maximum number of iterations.
+            mesg:     (boolean) Print the number of iterations.
+
+        Returns:
+
+            distribution: (array) Mass at each (shock, asset) pair, shape
+                          (S, n), summing to one.
+
+        """
+        if aplus is not None:
+            self.update(aplus)
+        QT = self.matrix.T.tocsr()
+        S, n = self.transition.shape[0], self.grid.size
+
+        if self.distribution is None:
+            x = np.full(S * n, 1 / (S * n))
+        else:
+            x = self.distribution.ravel()
+
+        if method == 'power':
+            for n_iter in range(1, max_iter + 1):
+                new_x = QT.dot(x)
+                change = np.max(np.abs(new_x - x))
+                x = new_x
+                if change < tol:
+                    break
+            else:
+                raise RuntimeError("Stationary distribution failed to converge after %i iterations." % max_iter)
+            if mesg:
+                sys.stdout.write("Stationary distribution after %i iterations\n" % n_iter)
+        elif method == 'arnoldi':
+            _, vectors = linalg.eigs(QT, k=1, which='LM', v0=x, tol=tol, maxiter=max_iter)
+            x = np.abs(np.real(vectors[:, 0]))
+        else:
+            raise ValueError("Unknown method %r." % method)
+
+        self.distribution = (x / x.sum()).reshape(S, n)
+        return self.distribution
+
+
+def aggregate_assets(grid, distribution):
+    """Mean assets of a distribution on the (shock, asset) grid."""
+    return np.sum(distribution * grid)
+
+
+def lifecycle_distribution(model, assets, consumption, grid, A0=0.0):
+    """
+    Distributions of assets by age for a cohort of the stochastic lifecycle
+    model, iterated forward with the lottery method from initial assets A0
+    (placed on the grid by the lottery as well) and the stationary
+    distribution of the shocks.
+
+    Arguments:
+
+        model:               (object) An instance of
+                             lifecycle_egm.StochasticLifecycleModel.
+        assets, consumption: (array) Output of lifecycle_egm.solve_lifecycle.
+        grid:                (array) Asset grid of the distribution.
+        A0:                  (float) Initial assets.
+
+    Returns:
+
+        distributions: (array) Mass at each (shock, asset) pair at the start
+                       of each period, shape (T + 2, S, n). The cross
+                       section of a population with equal cohorts is the
+                       mean over periods 0, ..., T.
+
+    """
+    grid = np.asarray(grid, dtype=float)
+    P = model.transition
+    S, n, T = P.shape[0], grid.size, model.T
+
+    eigvals, eigvecs = np.linalg.eig(P.T)
+    shocks = np.abs(np.real(eigvecs[:, np.argmin(np.abs(eigvals - 1))]))
+    shocks /= shocks.sum()
+
+    lower, weight = lottery(grid, np.array([A0]))
+    distributions = np.zeros((T + 2, S, n))
+    distributions[0, :, lower[0]] = shocks * weight[0]
+    distributions[0, :, lower[0] + 1] += shocks * (1 - weight[0])
+
+    transition = LotteryTransition(grid, P)
+    states = np.arange(S)[:, np.newaxis]
+    for t in range(T + 1):
+        _, _, aplus = lifecycle_egm.policies(model, assets, consumption, t, grid, states)
+        Q = transition.update(aplus)
+        distributions[t + 1] = Q.T.dot(distributions[t].ravel()).reshape(S, n)
+
+    return distributions
@@ -0,0 +1,141 @@
+from __future__ import division
+import sys
+
+import numpy as np
+
+
+def linear_interp(x, xp, fp):
+    """
+    Piecewise linear interpolation of the data (xp, fp) at x. Unlike
+    np.interp, points outside [xp[0], xp[-1]] are linearly extrapolated
+    using the end segments.
+
+    Arguments:
+
+        x:  (array) Points at which to interpolate.
+        xp: (array) Strictly increasing data points.
+        fp: (array) Data values.
+
+    Returns:
+
+        f: (array) Interpolated values.
+
+    """
+    idx = np.clip(np.searchsorted(xp, x) - 1, 0, xp.size - 2)
+    slope = (fp[idx + 1] - fp[idx]) / (xp[idx + 1] - xp[idx])
+    return fp[idx] + slope * (x - xp[idx])
+
+
+def egm_operator(model, grid, cplus):
+    """
+    One step of the endogenous grid method. Given consumption next period
+    at each point of the grid for next period's capital, the Euler equation
+
+        u'(c) = beta * u'(c') * (f'(k') + 1 - delta)
+
+    is inverted analytically for current consumption, and the budget
+    constraint gives the current resources, f(k) + (1 - delta) * k, that
+    make each choice of k' optimal. No root-finding is required.
+
+    Arguments:
+
+        model: (object) An instance of the OptimalGrowthModel class.
+        grid:  (array) Grid of values for next period's capital.
+        cplus: (array) Next period's consumption at each point of grid.
+
+    Returns:
+
+        resources:   (array) Endogenous grid of current resources.
+        consumption: (array) Optimal consumption at resources.
+
+    """
+    # extract parameters
+    beta = model.beta
+    theta = model.theta
+    delta = model.delta
+
+    # invert the Euler equation
+    gross_return = model.ces_mpk(grid) + 1 - delta
+    consumption = (beta * model.crra_marginal_utility(cplus) * gross_return)**(-1 / theta)
+
+    # endogenous grid of current resources
+    resources = consumption + grid
+
+    return resources, consumption
+
+
+def solve_EGM(model, grid, tol=1e-8, max_iter=10000, mesg=False):
+    """
+    Solve the deterministic optimal savings model using the endogenous grid
+    method (Carroll, 2006). The consumption policy is represented as a
+    function of current resources, f(k) + (1 - delta) * k, on the
+    endogenous grid, so every iteration is a handful of array operations.
+
+    Arguments:
+
+        model:    (object) An instance of the OptimalGrowthModel class.
+        grid:     (array) Strictly increasing grid of values for next
+                  period's capital.
+        tol:      (float) Convergence criterion. Algorithm will terminate
+                  when the supremum norm distance between successive
+                  consumption policies is less than tol.
+        max_iter: (int) Maximum number of iterations.
+        mesg:     (boolean) Should messages be printed detailing convergence
+                  progress? Default is False.
+
+    Returns:
+
+        resources:   (array) Endogenous grid of current resources.
+        consumption: (array) Optimal consumption at resources.
+
+    """
+    grid = np.asarray(grid, dtype=float)
+
+    # next period's resources are fixed by the exogenous grid
+    resources_plus = model.Gamma(grid)
+
+    # initial guess is to consume all resources (i.e., the last period!)
+    cplus = resources_plus
+
+    for n_iter in range(1, max_iter + 1):
+        resources, consumption = egm_operator(model, grid, cplus)
+
+        # next period's consumption on the fixed grid of next period's resources
+        next_cplus = linear_interp(resources_plus, resources, consumption)
+        change = np.max(np.abs(next_cplus - cplus))
+        cplus = next_cplus
+
+        if change < tol:
+            if mesg:
+                sys.stdout.write("After %i iterations, the final change is %g\n" % (n_iter, change))
+            break
+
+        if n_iter % 100 == 0 and mesg:
+            sys.stdout.write("After %i iterations, the change is %g\n" % (n_iter, change))
+    else:
+        raise RuntimeError("EGM failed to converge after %i iterations." % max_iter)
+
+    return resources, consumption
+
+
+def egm_policy(model, resources, consumption):
+    """
+    Consumption policy as a function of capital given the solution of
+    solve_EGM.
+
+    Arguments:
+
+        model:       (object) An instance of the OptimalGrowthModel class.
+        resources:   (array) Endogenous grid of current resources.
+        consumption: (array) Optimal consumption at resources.
+
+    Returns:
+
+        cpol: (callable) Consumption policy function c(k, z=0.0).
+
+    """
+    def cpol(k, z=0.0):
+        """Optimal consumption given capital and productivity."""
+        return linear_interp(model.Gamma(k, z), resources, consumption)
+
+    return cpol
@@ -0,0 +1,308 @@
+from __future__ import division
+import numpy as np
+
+
+def _nest(rho, cobb_douglas, ces):
+    """
+    Evaluate cobb_douglas() where rho == 0 and ces(rho) elsewhere. With an
+    array of calibrations both branches are evaluated and combined with
+    np.where (rho is replaced by one in the unused CES branch to avoid
+    dividing by zero).
+
+    """
+    if np.ndim(rho) == 0:
+        return cobb_douglas() if rho == 0 else ces(rho)
+    cd = rho == 0
+    return np.where(cd, cobb_douglas(), ces(np.where(cd, 1.0, rho)))
+
+
+class OptimalGrowthModel(object):
+    """
+    Primitives of the optimal savings (growth) model with inelastic labor
+    supply used in the dynamic programming notebook. The notebook keeps the
+    parameters in global variables; here they are attributes of the model so
+    that several calibrations can live side by side. Parameters may also be
+    arrays (of a common shape) holding many calibrations at once, in which
+    case the methods evaluate all of them elementwise.
+
+    Attributes:
+
+        alpha:   (float) Capital's share of output.
+        sigma:   (float) Elasticity of substitution between capital and labor.
+        delta:   (float) Depreciation rate of capital.
+        beta:    (float) Discount factor.
+        theta:   (float) Coefficient of relative risk aversion.
+        rho_z:   (float) Persistence of the productivity process.
+        sigma_z: (float) Standard deviation of the productivity shock.
+
+    """
+
+    def __init__(self, alpha=0.33, sigma=1.0, delta=1.0, beta=0.96, theta=1.0,
+                 rho_z=0.95, sigma_z=0.01):
+        self.alpha = alpha
+        self.sigma = sigma
+        self.delta = delta
+        self.beta = beta
+        self.theta = theta
+        self.rho_z = rho_z
+        self.sigma_z = sigma_z
+
+    def select(self, idx):
+        """
+        Model with the calibrations idx of a model whose parameters are
+        arrays (scalar parameters are shared).
+
+        """
+        params = {}
+        for name in ('alpha', 'sigma', 'delta', 'beta', 'theta', 'rho_z', 'sigma_z'):
+            value = getattr(self, name)
+            params[name] = np.asarray(value)[idx] if np.ndim(value) > 0 else value
+        return OptimalGrowthModel(**params)
+
+    @property
+    def rho(self):
+        """Substitution parameter of the CES production function."""
+        return (self.sigma - 1) / self.sigma
+
+    # equation 1.1
+    def ces_output(self, k, z=0.0):
+        """
+        Output is generated by a CES production function. Note that output is a
+        function of state variables (i.e., capital and possibly a productivity
+        shock).
+
+        Arguments:
+
+            k: (array) Current value of capital. Inherited from previous period!
+            z: (array) Current value of the productivity shock.
+
+        Returns:
+
+            y: (array) Output produced from k and z
+
+        """
+        # extract parameters
+        alpha = self.alpha
+        rho = self.rho
+
+        # nest Cobb-Douglas output as special case
+        y = _nest(rho, lambda: np.exp(z) * k**alpha,
+                  lambda rho: np.exp(z) * (alpha * k**rho + (1 - alpha))**(1 / rho))
+
+        return y
+
+    # equation 1.2
+    def productivity_motion(self, z, eps):
+        """
+        Equation of motion for total factor productivity.
+
+        Arguments:
+
+            z:   (array) Current value of the total factor productivity.
+            eps: (array) Productivity shock.
+
+        Returns:
+
+            zplus: (array) Next period's value of productivity.
+
+        """
+        zplus = self.rho_z * z + eps
+        return zplus
+
+    # equation 1.3
+    def ces_mpk(self, k, z=0.0):
+        """
+        Marginal product of capital for the CES production function.
+
+        Arguments:
+
+            k: (array) Current value of capital. Inherited from previous period!
+            z: (array) Current value of the productivity shock.
+
+        Returns:
+
+            mpk: (array) Marginal product of capital.
+
+        """
+        # extract parameters
+        alpha = self.alpha
+        rho = self.rho
+
+        # nest Cobb-Douglas output as special case
+        y = self.ces_output(k, z)
+        mpk = _nest(rho, lambda: alpha * (y / k),
+                    lambda rho: (alpha * k**(rho - 1) / (alpha * k**rho + (1 - alpha))) * y)
+
+        return mpk
+
+    def ces_mpk_derivative(self, k, z=0.0):
+        """
+        Derivative of the marginal product of capital with respect to capital
+        for the CES production function.
+
+        Arguments:
+
+            k: (array) Current value of capital. Inherited from previous period!
+            z: (array) Current value of the productivity shock.
+
+        Returns:
+
+            dmpk: (array) Second derivative of output with respect to k.
+
+        """
+        # extract parameters
+        alpha = self.alpha
+        rho = self.rho
+
+        # nest Cobb-Douglas output as special case
+        dmpk = _nest(rho, lambda: alpha * (alpha - 1) * (self.ces_output(k, z) / k**2),
+                     lambda rho: (np.exp(z) * alpha * (rho - 1) * (1 - alpha) * k**(rho - 2) *
+                                  (alpha * k**rho + (1 - alpha))**(1 / rho - 2)))
+
+        return dmpk
+
+    # equation 1.6
+    def crra_utility(self, c):
+        """
+        Agent has CRRA preferences over consumption.
+
+        Arguments:
+
+            c: (array) Current value of consumption.
+
+        Returns:
+
+            utility: (array) Utility from consumption.
+
+        """
+        theta = self.theta
+
+        # nest log utility as a special case
+        if theta == 1:
+            utility = np.log(c)
+        else:
+            utility = (c**(1 - theta) - 1) / (1 - theta)
+
+        return utility
+
+    def crra_marginal_utility(self, c):
+        """
+        Marginal utility of consumption for CRRA preferences.
+
+        Arguments:
+
+            c: (array) Current value of consumption.
+
+        Returns:
+
+            mu: (array) Marginal utility of consumption.
+
+        """
+        mu = c**-self.theta
+        return mu
+
+    # equation 1.11
+    def capital_motion(self, k, z, c):
+        """
+        Equation of motion for capital.
+
+        Arguments:
+
+            k: (array) Current value of capital. Inherited from previous period!
+            z: (array) Current value of the productivity shock.
+            c: (array) Current value of consumption.
+
+        Returns:
+
+            kplus: (array) Next period's value of capital.
+
+        """
+        kplus = self.ces_output(k, z) + (1 - self.delta) * k - c
+        return kplus
+
+    # equation 1.14
+    def Gamma(self, k, z=0.0):
+        """
+        The correspondence of feasible controls given current state.
+
+        Arguments:
+
+            k: (array) Current value of capital. Inherited from previous period!
+            z: (array) Current value of the productivity shock.
+
+        Returns:
+
+            c_upper: (array) The upper bound on the correspondence of feasible
+                     controls given current state.
+
+        """
+        # note that we are allowing capital to be eaten!
+        c_upper = self.ces_output(k, z) + (1 - self.delta) * k
+        return c_upper
+
+    def k_star(self):
+        """Deterministic steady state value of capital."""
+        # extract parameters
+        alpha = self.alpha
+        beta = self.beta
+        delta = self.delta
+        rho = self.rho
+
+        # nest Cobb-Douglas as special case
+        kss = _nest(rho, lambda: ((alpha * beta) / (1 - beta * (1 - delta)))**(1 / (1 - alpha)),
+                    lambda rho: ((1 / (1 - alpha)) * (((alpha * beta) / (1 - beta * (1 - delta)))**(rho / (rho - 1)) - alpha))**(-1 / rho))
+
+        return kss
+
+    def c_star(self):
+        """Deterministic steady state value of consumption."""
+        css = self.ces_output(self.k_star()) - self.delta * self.k_star()
+        return css
+
+    def k_star_isfinite(self):
+        """Returns true if steady state capital is finite."""
+        # extract parameters
+        alpha = self.alpha
+        beta = self.beta
+        delta = self.delta
+        sigma = self.sigma
+        rho = self.rho
+
+        if np.ndim(rho) > 0:
+            sigma = np.where(rho == 0, 2.0, sigma)
+            bound = 1 / (alpha**(sigma / (sigma - 1)) + (1 - delta))
+            return (rho == 0) | ((rho > 0) & (beta < bound)) | ((rho < 0) & (beta > bound))
+
+        if rho == 0:
+            finite = True
+        elif rho > 0:
+            finite = beta < (1 / (alpha**(sigma / (sigma - 1)) + (1 - delta)))
+        else:
+            finite = beta > (1 / (alpha**(sigma / (sigma - 1)) + (1 - delta)))
+
+        return finite
+
+    def analytic_w(self, k, z=0.0):
+        """
+        Analytic solution for the value function with Cobb-Douglas production,
+        logarithmic preferences and full depreciation.
+
+        """
+        # extract parameters
+        alpha = self.alpha
+        beta = self.beta
+        rho_z = self.rho_z
+
+        A = ((alpha * beta) / (1 - alpha * beta)) * np.log(alpha * beta) + np.log(1 - alpha * beta)
+        B = (alpha * (1 - beta)) / (1 - alpha * beta)
+        C = ((1 - beta) / (1 - beta * rho_z)) + ((alpha * beta * (1 - beta)) / (1 - alpha * beta))
+
+        return A + B * np.log(k) + C * z
+
+    def analytic_c(self, k, z=0.0):
+        """
+        Analytic solution for the optimal consumption policy function with
+        Cobb-Douglas production, logarithmic preferences and full depreciation.
+
+        """
+        return (1 - self.alpha * self.beta) * np.exp(z) * k**self.alpha
@@ -0,0 +1,288 @@
+from __future__ import division
+import sys
+import time
+
+import numpy as np
+from scipy import optimize
+from scipy import sparse
+
+from quadrature import gauss_hermite_rule, monomial_rule
+
+
+def monomial_powers(deg):
+    """
+    Exponents of the complete set of ordinary polynomials in (k, z) of total
+    degree at most deg, ordered by total degree.
+
+    """
+    return [(i, d - i) for d in range(deg + 1) for i in range(d, -1, -1)]
+
+
+def polynomial_basis(model, k, z, deg):
+    """
+    Complete ordinary polynomial basis in capital and productivity. Both
+    variables are scaled (capital relative to its steady state, productivity
+    relative to its unconditional standard deviation) to keep the regression
+    well conditioned.
+
+    Arguments:
+
+        model: (object) An instance of the OptimalGrowthModel class.
+        k:     (array) Values of capital.
+        z:     (array) Values of productivity (same shape as k).
+        deg:   (int) Total degree of the polynomial.
+
+    Returns:
+
+        X: (array) Basis functions with shape k.shape + (n_terms,).
+
+    """
+    x1 = k / model.k_star() - 1
+    x2 = z * np.sqrt(1 - model.rho_z**2) / model.sigma_z
+    return np.stack([x1**i * x2**j for i, j in monomial_powers(deg)], axis=-1)
+
+
+def simulate_productivity(model, T, N, seed=None):
+    """
+    Simulate a panel of N independent productivity series of length T,
+    starting from z = 0, using the productivity_motion equation.
+
+    Returns:
+
+        z: (array) Productivity with shape (T, N).
+
+    """
+    prng = np.random.RandomState(seed)
+    eps = model.sigma_z * prng.randn(T, N)
+
+    z = np.empty((T, N))
+    z[0] = 0.0
+    for t in range(T - 1):
+        z[t + 1] = model.productivity_motion(z[t], eps[t + 1])
+
+    return z
+
+
+def simulate_capital(model, coefs, deg, z, k0=None):
+    """
+    Simulate capital given the policy k' = X(k, z) . coefs, vectorized
+    across the panel dimension of z. The terms involving productivity are
+    evaluated for the whole panel up front so that each period only needs
+    a Horner evaluation of a polynomial in capital.
+
+    Arguments:
+
+        model: (object) An instance of the OptimalGrowthModel class.
+        coefs: (array) Coefficients of the capital policy.
+        deg:   (int) Total degree of the polynomial.
+        z:     (array) Productivity panel with shape (T, N).
+        k0:    (array) Initial capital. Default is the steady state.
+
+    Returns:
+
+        k: (array) Capital panel with shape (T + 1, N).
+
+    """
+    T, N = z.shape
+    kss = model.k_star()
+    x2 = z * np.sqrt(1 - model.rho_z**2) / model.sigma_z
+
+    # coefficients on each power of scaled capital, per period and series
+    P = np.zeros((deg + 1, T, N))
+    for (i, j), b in zip(monomial_powers(deg), coefs):
+        P[i] += b * x2**j
+
+    k = np.empty((T + 1, N))
+    k[0] = kss if k0 is None else k0
+    for t in range(T):
+        x1 = k[t] / kss - 1
+        kplus = P[deg, t]
+        for i in range(deg - 1, -1, -1):
+            kplus = kplus * x1 + P[i, t]
+        k[t + 1] = kplus
+
+    return k
+
+
+def regress(X, y, method='ls-svd', penalty=-7):
+    """
+    Fit coefficients of the policy function by (regularized) least squares
+    or least absolute deviations.
+
+    Arguments:
+
+        X:       (array) Regressors with shape (n_obs, n_terms).
+        y:       (array) Regressand with shape (n_obs,).
+        method:  (str) One of 'ls-svd' (least squares via the SVD),
+                 'rls-tikhonov' (ridge regression), 'rls-tsvd' (truncated
+                 SVD) or 'lad' (least absolute deviations, solved as a
+                 linear program).
+        penalty: (int) log10 of the regularization parameter for
+                 'rls-tikhonov' or of the smallest admissible ratio of
+                 singular values for 'rls-tsvd'.
+
+    Returns:
+
+        coefs: (array) Estimated coefficients.
+
+    """
+    if method == 'ls-svd':
+        coefs = np.linalg.lstsq(X, y, rcond=None)[0]
+
+    elif method == 'rls-tikhonov':
+        n_obs, n_terms = X.shape
+        eta = n_obs / n_terms * 10.0**penalty
+        coefs = np.linalg.solve(X.T.dot(X) + eta * np.eye(n_terms), X.T.dot(y))
+
+    elif method == 'rls-tsvd':
+        U, s, Vt = np.linalg.svd(X, full_matrices=False)
+        keep = s / s[0] > 10.0**penalty
+        coefs = Vt[keep].T.dot(U[:, keep].T.dot(y) / s[keep])
+
+    elif method == 'lad':
+        # min 1'(u + v) subject to X b + u - v = y and u, v >= 0
+        n_obs, n_terms = X.shape
+        c = np.concatenate((np.zeros(n_terms), np.ones(2 * n_obs)))
+        A_eq = sparse.hstack((X, sparse.eye(n_obs), -sparse.eye(n_obs)), format='csc')
+        bounds = [(None, None)] * n_terms + [(0, None)] * (2 * n_obs)
+        res = optimize.linprog(c, A_eq=A_eq, b_eq=y, bounds=bounds, method='highs')
+        if not res.success:
+            raise RuntimeError("LAD regression failed: %s" % res.message)
+        coefs = res.x[:n_terms]
+
+    else:
+        raise ValueError("Unknown regression method %r." % method)
+
+    return coefs
+
+
+def euler_expectation(model, coefs, deg, k, z, nodes, weights):
+    """
+    Conditional expectation that defines the fixed point of GSSA,
+
+        y_t = E_t[beta * (c_{t+1} / c_t)^(-theta) * (f'(k_{t+1}) + 1 - delta)] k_{t+1}
+
+    computed for all periods and series at once with the quadrature rule
+    (nodes, weights) over next period's shock.
+
+    Arguments:
+
+        model:   (object) An instance of the OptimalGrowthModel class.
+        coefs:   (array) Coefficients of the capital policy.
+        deg:     (int) Total degree of the polynomial.
+        k:       (array) Simulated capital with shape (T + 1, N).
+        z:       (array) Simulated productivity with shape (T, N).
+        nodes:   (array) Quadrature nodes for the shock.
+        weights: (array) Quadrature weights.
+
+    Returns:
+
+        y: (array) Regressand with shape (T, N).
+
+    """
+    # extract parameters
+    beta = model.beta
+    delta = model.delta
+
+    kt, kplus = k[:-1], k[1:]
+    ct = model.Gamma(kt, z) - kplus
+
+    # next period's productivity and consumption at each quadrature node
+    zplus = model.productivity_motion(z[..., np.newaxis], nodes)
+    kplus_j = kplus[..., np.newaxis]
+    kplusplus = polynomial_basis(model, np.broadcast_to(kplus_j, zplus.shape), zplus, deg).dot(coefs)
+    cplus = model.Gamma(kplus_j, zplus) - kplusplus
+
+    gross_return = model.ces_mpk(kplus_j, zplus) + 1 - delta
+    ratio = model.crra_marginal_utility(cplus) / model.crra_marginal_utility(ct)[..., np.newaxis]
+
+    y = (beta * ratio * gross_return).dot(weights) * kplus
+    return y
+
+
+def solve_GSSA(model, deg=2, T=10000, N=1, method='ls-svd', penalty=-7,
+               integration='gauss-hermite', n_nodes=5, damping=0.1, tol=1e-7,
+               max_iter=2000, init_coefs=None, seed=42, mesg=False):
+    """
+    Generalized stochastic simulation algorithm of Judd, Maliar and Maliar
+    (2011) for the stochastic optimal growth model. The capital policy is
+    a complete polynomial in (k, z); each iteration simulates the panel,
+    evaluates the Euler equation expectation by quadrature and updates
+    the coefficients by regression with damping.
+
+    Arguments:
+
+        model:       (object) An instance of the OptimalGrowthModel class.
+        deg:         (int) Total degree of the polynomial policy.
+        T:           (int) Length of each simulated series.
+        N:           (int) Number of independent series in the panel.
+        method:      (str) Regression method (see regress).
+        penalty:     (int) Regularization parameter (see regress).
+        integration: (str) Either 'gauss-hermite' or 'monomial'.
+        n_nodes:     (int) Number of Gauss-Hermite nodes.
+        damping:     (float) Weight on the new coefficients in each update.
+        tol:         (float) Convergence criterion on the mean relative
+                     change in the simulated capital series.
+        max_iter:    (int) Maximum number of iterations.
+        init_coefs:  (array) Initial guess for the coefficients. Default is
+                     k' = k_ss + 0.9 (k - k_ss).
+        seed:        (int) Seed for the simulated shocks.
+        mesg:        (boolean) Should messages be printed detailing
+                     convergence progress? Default is False.
+
+    Returns:
+
+        coefs:   (array) Coefficients of the capital policy.
+        timings: (dict) Seconds spent in simulation, integration and
+                 regression.
+
+    """
+    timings = {'simulation': 0.0, 'integration': 0.0, 'regression': 0.0}
+
+    if integration == 'gauss-hermite':
+        nodes, weights = gauss_hermite_rule(n_nodes, model.sigma_z)
+    elif integration == 'monomial':
+        nodes, weights = monomial_rule(model.sigma_z)
+    else:
+        raise ValueError("Unknown integration method %r." % integration)
+
+    if init_coefs is None:
+        init_coefs = np.zeros(len(monomial_powers(deg)))
+        init_coefs[0] = model.k_star()
+        init_coefs[1] = 0.9 * model.k_star()
+    coefs = np.asarray(init_coefs, dtype=float)
+
+    start = time.time()
+    z = simulate_productivity(model, T, N, seed)
+    k = simulate_capital(model, coefs, deg, z)
+    timings['simulation'] += time.time() - start
+
+    for n_iter in range(1, max_iter + 1):
+        start = time.time()
+        y = euler_expectation(model, coefs, deg, k, z, nodes, weights)
+        timings['integration'] += time.time() - start
+
+        start = time.time()
+        X = polynomial_basis(model, k[:-1], z, deg)
+        new_coefs = regress(X.reshape(-1, coefs.size), y.ravel(), method, penalty)
+        coefs = (1 - damping) * coefs + damping * new_coefs
+        timings['regression'] += time.time() - start
+
+        start = time.time()
+        new_k = simulate_capital(model, coefs, deg, z)
+        timings['simulation'] += time.time() - start
+
+        change = np.mean(np.abs(1 - new_k / k))
+        k = new_k
+
+        if change < tol:
+            if mesg:
+                sys.stdout.write("After %i iterations, the final change is %g\n" % (n_iter, change))
+            break
+
+        if n_iter % 50 == 0 and mesg:
+            sys.stdout.write("After %i iterations, the change is %g\n" % (n_iter, change))
+    else:
+        raise RuntimeError("GSSA failed to converge after %i iterations." % max_iter)
+
+    return coefs, timings
@@ -0,0 +1,331 @@
+from __future__ import division
+
+import numpy as np
+
+
+def rouwenhorst(n, rho, sigma):
+    """
+    Rouwenhorst discretization of the AR(1) process
+
+        s' = rho * s + eps, eps ~ N(0, sigma**2)
+
+    with n equally spaced states spanning +/- sqrt(n - 1) unconditional
+    standard deviations.
+
+    Returns:
+
+        states:     (array) Values of s.
+        transition: (array) transition[i, j] = Prob(s' = states[j] | s = states[i]).
+
+    """
+    p = (1 + rho) / 2
+    P = np.array([[p, 1 - p], [1 - p, p]])
+    for m in range(3, n + 1):
+        Q = np.zeros((m, m))
+        Q[:-1, :-1] += p * P
+        Q[:-1, 1:] += (1 - p) * P
+        Q[1:, :-1] += (1 - p) * P
+        Q[1:, 1:] += p * P
+        Q[1:-1] /= 2
+        P = Q
+    if n == 1:
+        return np.zeros(1), np.ones((1, 1))
+    width = np.sqrt(n - 1) * sigma / np.sqrt(1 - rho**2)
+    return np.linspace(-width, width, n), P
+
+
+def interp_rows(x, xp, fp, rows=None):
+    """
+    Piecewise linear interpolation (with linear extrapolation, as
+    egm.linear_interp) of many functions at once. Function i has data
+    (xp[i], fp[i]); each point of x is interpolated with the function in
+    the corresponding entry of rows. A single searchsorted locates all
+    points by shifting the rows of xp into disjoint ranges.
+
+    Arguments:
+
+        x:    (array) Points at which to interpolate.
+        xp:   (array) Strictly increasing data points, shape (S, n).
+        fp:   (array) Data values, shape (S, n).
+        rows: (array) Row of xp for each point of x (broadcast with x).
+              Default is np.arange(S)[:, np.newaxis], i.e., x has S rows.
+
+    Returns:
+
+        f: (array) Interpolated values with the shape of x.
+
+    """
+    S, n = xp.shape
+    if rows is None:
+        rows = np.arange(S)[:, np.newaxis]
+    x, rows = np.broadcast_arrays(np.asarray(x, dtype=float), rows)
+
+    lower, upper = min(xp.min(), x.min()), max(xp.max(), x.max())
+    offsets = (upper - lower + 1) * np.arange(S)
+    shifted = (xp - lower + offsets[:, np.newaxis]).ravel()
+    idx = np.searchsorted(shifted, x - lower + offsets[rows]) - rows * n - 1
+    idx = np.clip(idx, 0, n - 2)
+
+    x0, x1 = xp[rows, idx], xp[rows, idx + 1]
+    f0, f1 = fp[rows, idx], fp[rows, idx + 1]
+    return f0 + (f1 - f0) / (x1 - x0) * (x - x0)
+
+
+class StochasticLifecycleModel(object):
+    """
+    Lifecycle model with labor supply of lifecycle_with_labor.py with
+    idiosyncratic wage risk: the wage in period t is w_t * e, where w_t is
+    the wage schedule (retirement at R) and the productivity e follows a
+    Markov chain. Assets must stay above minimum_assets and the agent leaves
+    no bequests.
+
+    Attributes:
+
+        T:              (int) Time horizon (periods 0, ..., T).
+        R:              (int) Retirement age.
+        beta:           (float) Discount factor.
+        theta:          (float) Inverse of elasticity of substitution for
+                        consumption.
+        eta:            (float) Frisch elasticity of substitution for labor.
+        r:              (float) Net interest rate.
+        minimum_assets: (float) Lower bound on assets.
+        productivity:   (array) Productivity in each Markov state. Default is
+                        a single state with e = 1 (no risk).
+        transition:     (array) Transition matrix of the Markov chain.
+
+    """
+
+    def __init__(self, T=100, R=65, beta=0.95, theta=2.0, eta=2.0, r=0.05,
+                 minimum_assets=-10.0, productivity=None, transition=None):
+        self.T = T
+        self.R = R
+        self.beta = beta
+        self.theta = theta
+        self.eta = eta
+        self.r = r
+        self.minimum_assets = minimum_assets
+        self.productivity = np.ones(1) if productivity is None else np.asarray(productivity, dtype=float)
+        self.transition = np.ones((1, 1)) if transition is None else np.asarray(transition, dtype=float)
+
+    def wage_schedule(self, t):
+        """Defines the path of wages (as wage_schedule in lifecycle_with_labor.py)."""
+        t = np.asarray(t)
+        return np.where(t < self.R, t / self.R, 0.0)
+
+    def wages(self):
+        """Wage in each period and Markov state, shape (T + 1, S)."""
+        return np.outer(self.wage_schedule(np.arange(self.T + 1)), self.productivity)
+
+    def flow_utility(self, c, l):
+        """Flow utility function for the agent."""
+        # extract parameters
+        theta = self.theta
+        eta = self.eta
+
+        # agent likes to eat...
+        utility_consumption = c**(1 - theta) / (1 - theta)
+
+        # ...but doesn't like to work!
+        disutility_labor = l**(1 + eta) / (1 + eta)
+
+        return utility_consumption - disutility_labor
+
+    def labor_supply(self, c, w):
+        """Optimal labor supply given consumption and the wage, l**eta = w c**(-theta)."""
+        return (w * c**(-self.theta))**(1 / self.eta)
+
+
+def _borrowing_limits(model, wages):
+    """
+    Lower bound on end of period assets in each period: minimum_assets, or
+    zero once no wages will be earned again (the natural borrowing limit,
+    nudged above zero so that next period's consumption is positive).
+
+    """
+    working = wages.max(axis=1) > 0
+    retired = np.append(np.cumsum(working[::-1])[::-1][1:], 0) == 0
+    limits = np.full(model.T + 1, float(model.minimum_assets))
+    if model.minimum_assets <= 0:
+        limits[retired] = 1e-10
+    return limits
+
+
+def solve_lifecycle(model, grid, n_constrained=20):
+    """
+    Solve the stochastic lifecycle model by backward induction with the
+    endogenous grid method. In period t < T, for every end of period asset
+    level a' on the grid and every Markov state, the Euler equation
+
+        c**(-theta) = beta (1 + r) E[c'(a', e')**(-theta) | e]
+
+    gives consumption, the intratemporal condition gives labor supply and
+    the budget constraint gives the current assets that make a' optimal.
+    Where the borrowing constraint binds (and in period T, where a' = 0),
+    consumption is taken on a grid instead and the budget constraint with a'
+    fixed gives current assets, so no equation is ever solved numerically:
+    each period is a few array operations over (states, grid).
+
+    Arguments:
+
+        model:         (object) An instance of StochasticLifecycleModel.
+        grid:          (array) Strictly increasing grid of end of period
+                       assets. It is rescaled in each period to start at
+                       that period's borrowing limit.
+        n_constrained: (int) Number of points on the constrained segment.
+
+    Returns:
+
+        assets:      (array) Endogenous grids of current assets, shape
+                     (T + 1, S, n_constrained + grid.size).
+        consumption: (array) Optimal consumption at assets.
+
+    """
+    # extract parameters
+    beta = model.beta
+    theta = model.theta
+    r = model.r
+    T = model.T
+    P = model.transition
+
+    grid = np.asarray(grid, dtype=float)
+    wages = model.wages()
+    limits = _borrowing_limits(model, wages)
+    S, N = wages.shape[1], grid.size + n_constrained
+
+    assets = np.empty((T + 1, S, N))
+    consumption = np.empty((T + 1, S, N))
+
+    # last period: consume all resources, a' = 0
+    w = wages[T][:, np.newaxis]
+    c_all = (1 + r) * max(grid[-1], 1.0)
+    c_top = c_all + w * model.labor_supply(c_all, w)
+    c = c_top * np.geomspace(1e-4, 1, N)
+    consumption[T] = c
+    assets[T] = (c - w * model.labor_supply(c, w)) / (1 + r)
+
+    fractions = np.geomspace(1e-4, 1, n_constrained + 1)[:-1]
+    for t in range(T - 1, -1, -1):
+        w = wages[t][:, np.newaxis]
+        agrid = limits[t] + (grid - grid[0]) * (grid[-1] - limits[t]) / (grid[-1] - grid[0])
+
+        # expected marginal utility of next period's consumption
+        cplus = interp_rows(np.broadcast_to(agrid, (S, grid.size)), assets[t + 1], consumption[t + 1])
+        cplus = np.maximum(cplus, 1e-12)
+        expected = P.dot(cplus**(-theta))
+
+        # invert the Euler equation, then the budget constraint
+        c = (beta * (1 + r) * expected)**(-1 / theta)
+        A = (c + agrid - w * model.labor_supply(c, w)) / (1 + r)
+
+        # constrained segment: a' = agrid[0] and c below the kink
+        c_con = c[:, :1] * fractions
+        A_con = (c_con + agrid[0] - w * model.labor_supply(c_con, w)) / (1 + r)
+
+        consumption[t] = np.hstack((c_con, c))
+        assets[t] = np.hstack((A_con, A))
+
+    return assets, consumption
+
+
+def _constrained_consumption(model, resources, w, c, tol=1e-12, max_iter=50):
+    """
+    Consumption c that satisfies the budget constraint with end of period
+    assets at the borrowing limit, c - w l(c) = resources, by Newton's
+    method from the initial guesses c (the left hand side is increasing
+    and concave in c, so iterates to the left of the root stay there).
+
+    """
+    for _ in range(max_iter):
+        l = model.labor_supply(c, w)
+        gap = c - w * l - resources
+        slope = 1 + model.theta / model.eta * w * l / c
+        c = np.maximum(c - gap / slope, c / 10)
+        if np.all(np.abs(gap) < tol * np.maximum(1, np.abs(resources))):
+            break
+    return c
+
+
+def policies(model, assets, consumption, t, A, s):
+    """
+    Optimal choices in period t given current assets A and Markov states s
+    (arrays that broadcast together).
+
+    Consumption is interpolated on the endogenous grid, which is only
+    piecewise linear on the constrained segment. Where the implied end of
+    period assets fall below the borrowing limit, they are set to the limit
+    and consumption solves the budget constraint there instead, so that
+    simulated assets never violate the limit.
+
+    Returns:
+
+        c:     (array) Consumption.
+        l:     (array) Labor supply.
+        Aplus: (array) End of period assets.
+
+    """
+    A, s = np.broadcast_arrays(np.asarray(A, dtype=float), np.asarray(s))
+    c = interp_rows(A, assets[t], consumption[t], s)
+    w = model.wage_schedule(t) * model.productivity[s]
+    l = model.labor_supply(c, w)
+    Aplus = (1 + model.r) * A + w * l - c
+
+    # no bequests in the last period
+    limit = 0.0 if t == model.T else _borrowing_limits(model, model.wages())[t]
+    binding = Aplus < limit
+    if np.any(binding):
+        c, w = c.copy(), np.broadcast_to(w, c.shape)
+        c[binding] = _constrained_consumption(model, (1 + model.r) * A[binding] - limit,
+                                              w[binding], c[binding])
+        l = model.labor_supply(c, w)
+        Aplus = np.where(binding, limit, Aplus)
+
+    return c, l, Aplus
+
+
+def simulate_lifecycle(model, assets, consumption, n_agents, A0=0.0, s0=None, seed=None):
+    """
+    Simulate a cohort of agents from period 0 to T with the policies of
+    solve_lifecycle.
+
+    Arguments:
+
+        model:             (object) An instance of StochasticLifecycleModel.
+        assets, consumption: (array) Output of solve_lifecycle.
+        n_agents:          (int) Number of agents.
+        A0:                (float) Initial assets.
+        s0:                (array) Initial Markov states. Default is draws
+                           from the stationary distribution of the chain.
+        seed:              (int) Seed for the simulated shocks.
+
+    Returns:
+
+        c, l, A, s: (array) Consumption, labor supply, assets (including
+                    A_{T+1}) and Markov states of each agent, shape
+                    (T + 1, n_agents) or (T + 2, n_agents) for A.
+
+    """
+    prng = np.random.RandomState(seed)
+    P = model.transition
+    S = P.shape[0]
+    T = model.T
+
+    if s0 is None:
+        eigvals, eigvecs = np.linalg.eig(P.T)
+        stationary = np.real(eigvecs[:, np.argmin(np.abs(eigvals - 1))])
+        s0 = np.searchsorted(np.cumsum(stationary / stationary.sum()), prng.uniform(size=n_agents))
+        s0 = np.minimum(s0, S - 1)
+
+    c = np.empty((T + 1, n_agents))
+    l = np.empty((T + 1, n_agents))
+    A = np.empty((T + 2, n_agents))
+    s = np.empty((T + 1, n_agents), dtype=int)
+    A[0], s[0] = A0, s0
+
+    cumulative = np.cumsum(P, axis=1)
+    for t in range(T + 1):
+        c[t], l[t], A[t + 1] = policies(model, assets, consumption, t, A[t], s[t])
+        if t < T:
+            draws = prng.uniform(size=n_agents)
+            s[t + 1] = np.minimum((draws[:, np.newaxis] > cumulative[s[t]]).sum(axis=1), S - 1)
+
+    return c, l, A, s
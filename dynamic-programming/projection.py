@@ -0,0 +1,137 @@
+from __future__ import division
+import sys
+
+import numpy as np
+
+
+def euler_residuals(model, basis, coefs):
+    """
+    Euler equation residuals at the collocation nodes, and their Jacobian
+    with respect to the Chebyshev coefficients, for the deterministic
+    optimal savings model. The consumption policy is
+
+        c(k) = sum_j coefs[j] * T_j(k)
+
+    and the residual at each node is
+
+        R(k) = u'(c(k)) - beta * u'(c(k')) * (f'(k') + 1 - delta)
+
+    where k' = f(k) + (1 - delta) * k - c(k).
+
+    Arguments:
+
+        model: (object) An instance of the OptimalGrowthModel class.
+        basis: (object) An instance of the ChebyshevBasis class whose nodes
+               are the collocation nodes.
+        coefs: (array) Chebyshev coefficients of the consumption policy.
+
+    Returns:
+
+        resid: (array) Euler residuals at the nodes.
+        jac:   (array) Jacobian of resid with respect to coefs.
+
+    """
+    # extract parameters
+    beta = model.beta
+    theta = model.theta
+    delta = model.delta
+
+    # current consumption and next period's capital
+    B = basis.basis_matrix
+    c = B.dot(coefs)
+    kplus = model.capital_motion(basis.nodes, 0, c)
+
+    # next period's consumption and its slope
+    Bplus = basis.vandermonde(kplus)
+    cplus = Bplus.dot(coefs)
+    dcplus = basis.polynomial(coefs).deriv()(kplus)
+
+    gross_return = model.ces_mpk(kplus) + 1 - delta
+    mu = model.crra_marginal_utility(c)
+    muplus = model.crra_marginal_utility(cplus)
+
+    resid = mu - beta * muplus * gross_return
+
+    # derivatives of c, k' and c' with respect to the coefficients
+    dc = B
+    dkplus = -B
+    dcplus_total = Bplus + dcplus[:, np.newaxis] * dkplus
+
+    dmu = (-theta * mu / c)[:, np.newaxis] * dc
+    dmuplus = (-theta * muplus / cplus)[:, np.newaxis] * dcplus_total
+    dreturn = model.ces_mpk_derivative(kplus)[:, np.newaxis] * dkplus
+
+    jac = dmu - beta * (dmuplus * gross_return[:, np.newaxis] +
+                        muplus[:, np.newaxis] * dreturn)
+
+    return resid, jac
+
+
+def solve_projection(model, basis, init_coefs=None, tol=1e-10, max_iter=50,
+                     mesg=False):
+    """
+    Solve the deterministic optimal savings model by Chebyshev collocation
+    on the Euler equation. Newton's method with the analytic Jacobian from
+    euler_residuals typically converges in a handful of steps; a step is
+    halved whenever it fails to reduce the norm of the residuals.
+
+    Arguments:
+
+        model:      (object) An instance of the OptimalGrowthModel class.
+        basis:      (object) An instance of the ChebyshevBasis class with as
+                    many nodes as coefficients (i.e., deg + 1 nodes).
+        init_coefs: (array) Initial guess for the coefficients. Passing the
+                    solution for a nearby calibration makes re-solves
+                    cheap. Default is the Solow consumption rule that
+                    consumes a constant fraction of output.
+        tol:        (float) Convergence criterion on the supremum norm of
+                    the Euler residuals.
+        max_iter:   (int) Maximum number of Newton steps.
+        mesg:       (boolean) Should messages be printed detailing
+                    convergence progress? Default is False.
+
+    Returns:
+
+        cpol: (object) An instance of the Chebyshev class representing the
+              consumption policy.
+
+    """
+    if basis.nodes.size != basis.deg + 1:
+        raise ValueError("Collocation requires exactly deg + 1 nodes.")
+
+    if init_coefs is None:
+        s = 1 - (model.c_star() / model.ces_output(model.k_star()))
+        init_coefs = basis.fit((1 - s) * model.ces_output(basis.nodes))
+
+    coefs = np.asarray(init_coefs, dtype=float)
+    resid, jac = euler_residuals(model, basis, coefs)
+
+    for n_iter in range(1, max_iter + 1):
+        step = np.linalg.solve(jac, -resid)
+
+        # backtrack until the residuals fall
+        norm = np.max(np.abs(resid))
+        size = 1.0
+        while True:
+            with np.errstate(invalid='ignore'):
+                new_resid, new_jac = euler_residuals(model, basis, coefs + size * step)
+            new_norm = np.max(np.abs(new_resid))
+            if new_norm < norm:
+                break
+            size /= 2
+            if size < 1e-8:
+                raise RuntimeError("Newton failed to converge: no step reduces the Euler residuals "
+                                   "(max residual %g after %i steps)." % (norm, n_iter - 1))
+
+        coefs = coefs + size * step
+        resid, jac = new_resid, new_jac
+
+        if mesg:
+            sys.stdout.write("Newton step %i, max Euler residual is %g\n" % (n_iter, new_norm))
+
+        if new_norm < tol:
+            break
+    else:
+        raise RuntimeError("Newton failed to converge after %i steps." % max_iter)
+
+    return basis.polynomial(coefs)
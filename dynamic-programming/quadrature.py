@@ -0,0 +1,229 @@
+from __future__ import division
+import collections
+import itertools
+
+import numpy as np
+from scipy import stats
+from scipy.stats import qmc
+
+
+# memoized rules, least recently used first
+_rules = collections.OrderedDict()
+_max_rules = 128
+
+
+def set_cache_size(n):
+    """Keep at most n rules in the cache (least recently used are evicted)."""
+    global _max_rules
+    _max_rules = n
+    while len(_rules) > _max_rules:
+        _rules.popitem(last=False)
+
+
+def clear_cache():
+    """Remove all memoized rules."""
+    _rules.clear()
+
+
+def _readonly(a):
+    a = np.ascontiguousarray(a, dtype=float)
+    a.setflags(write=False)
+    return a
+
+
+def _memoize(key, build):
+    """Rule for key from the cache, building (and caching) it if needed."""
+    try:
+        rule = _rules.pop(key)
+    except KeyError:
+        nodes, weights = build()
+        rule = _readonly(nodes), _readonly(weights)
+    _rules[key] = rule
+    while len(_rules) > _max_rules:
+        _rules.popitem(last=False)
+    return rule
+
+
+def _scale_key(sigma, d):
+    """Hashable form of a standard deviation or covariance matrix."""
+    if sigma is None:
+        return None
+    sigma = np.asarray(sigma, dtype=float)
+    if sigma.ndim == 2 and sigma.shape != (d, d):
+        raise ValueError("Covariance matrix must have shape (%i, %i)." % (d, d))
+    return sigma.shape, sigma.tobytes()
+
+
+def _scale(nodes, sigma):
+    """Nodes of a standard normal rule scaled to N(0, sigma)."""
+    if sigma is None:
+        return nodes
+    sigma = np.asarray(sigma, dtype=float)
+    if sigma.ndim == 2:
+        return nodes.dot(np.linalg.cholesky(sigma).T)
+    return nodes * sigma
+
+
+def _build_gauss_hermite(n, d):
+    x, w = np.polynomial.hermite.hermgauss(n)
+    x, w = np.sqrt(2) * x, w / np.sqrt(np.pi)
+    nodes = np.array(list(itertools.product(x, repeat=d)))
+    weights = np.prod(np.array(list(itertools.product(w, repeat=d))), axis=1)
+    return nodes.reshape(-1, d), weights
+
+
+def _build_monomial(degree, d):
+    eye = np.eye(d)
+    if degree == 1:
+        nodes = np.sqrt(d) * np.vstack((eye, -eye))
+        weights = np.full(2 * d, 1 / (2 * d))
+    elif degree == 2:
+        pairs = [eye[i] + s * eye[j] for i in range(d) for j in range(i + 1, d)
+                 for s in (1, -1)]
+        pairs = np.vstack(pairs + [-p for p in pairs]) if pairs else np.zeros((0, d))
+        nodes = np.vstack((np.zeros((1, d)),
+                           np.sqrt(d + 2) * np.vstack((eye, -eye)),
+                           np.sqrt((d + 2) / 2) * pairs))
+        weights = np.concatenate(([2 / (d + 2)],
+                                  np.full(2 * d, (4 - d) / (2 * (d + 2)**2)),
+                                  np.full(len(pairs), 1 / (d + 2)**2)))
+    else:
+        raise ValueError("Monomial rules are available for degree 1 or 2.")
+    return nodes, weights
+
+
+def _build_qmc(kind, n, d, seed):
+    if kind == 'sobol':
+        engine = qmc.Sobol(d, scramble=True, seed=seed)
+    else:
+        engine = qmc.Halton(d, scramble=True, seed=seed)
+    nodes = stats.norm.ppf(engine.random(n))
+    return nodes, np.full(n, 1 / n)
+
+
+# rules for a standard normal random vector
+_builders = {'gauss-hermite': lambda d, level, seed: _build_gauss_hermite(level, d),
+             'monomial': lambda d, level, seed: _build_monomial(level, d),
+             'sobol': lambda d, level, seed: _build_qmc('sobol', level, d, seed),
+             'halton': lambda d, level, seed: _build_qmc('halton', level, d, seed)}
+
+
+def _rule(kind, d, level, sigma, seed=None):
+    """Memoized rule; scaled rules are built from the memoized standard one."""
+    standard = lambda: _memoize((kind, d, level, seed, None),
+                                lambda: _builders[kind](d, level, seed))
+    if sigma is None:
+        return standard()
+
+    def build():
+        nodes, weights = standard()
+        return _scale(nodes, sigma), weights
+
+    return _memoize((kind, d, level, seed, _scale_key(sigma, d)), build)
+
+
+def gauss_hermite(n, d=1, sigma=None):
+    """
+    Tensor product Gauss-Hermite rule for expectations over a d dimensional
+    normal random vector with mean zero.
+
+    Arguments:
+
+        n:     (int) Number of nodes in each dimension.
+        d:     (int) Number of dimensions.
+        sigma: (float or array) Standard deviation (scalar or one per
+               dimension) or covariance matrix. Default is the identity.
+
+    Returns:
+
+        nodes:   (array) Read only nodes with shape (n**d, d).
+        weights: (array) Read only weights (sum to one), shape (n**d,).
+
+    """
+    return _rule('gauss-hermite', d, n, sigma)
+
+
+def monomial(degree, d=1, sigma=None):
+    """
+    Monomial rules M1 (degree=1, 2d nodes) and M2 (degree=2, 2d**2 + 1
+    nodes) of Judd, Maliar and Maliar (2011), which grow polynomially rather
+    than exponentially with d. Arguments and returns as in gauss_hermite.
+
+    """
+    return _rule('monomial', d, degree, sigma)
+
+
+def sobol(n, d=1, sigma=None, seed=0):
+    """
+    Quasi-Monte Carlo rule from n points of a scrambled Sobol sequence
+    (n should be a power of 2), mapped to the normal distribution by the
+    inverse CDF, with equal weights. Arguments and returns as in
+    gauss_hermite.
+
+    """
+    return _rule('sobol', d, n, sigma, seed)
+
+
+def halton(n, d=1, sigma=None, seed=0):
+    """Quasi-Monte Carlo rule from a scrambled Halton sequence, as sobol."""
+    return _rule('halton', d, n, sigma, seed)
+
+
+def rule(kind, d=1, level=None, sigma=None, seed=0):
+    """
+    Quadrature rule by name.
+
+    Arguments:
+
+        kind:  (str) 'gauss-hermite', 'monomial', 'sobol' or 'halton'.
+        d:     (int) Number of dimensions.
+        level: (int) Nodes per dimension (gauss-hermite), degree (monomial)
+               or number of points (sobol and halton).
+        sigma: (float or array) See gauss_hermite.
+        seed:  (int) Seed of the scrambling (sobol and halton).
+
+    Returns:
+
+        nodes, weights: see gauss_hermite.
+
+    """
+    if kind == 'gauss-hermite':
+        return gauss_hermite(level, d, sigma)
+    elif kind == 'monomial':
+        return monomial(level, d, sigma)
+    elif kind == 'sobol':
+        return sobol(level, d, sigma, seed)
+    elif kind == 'halton':
+        return halton(level, d, sigma, seed)
+    raise ValueError("Unknown quadrature rule %r." % kind)
+
+
+def gauss_hermite_rule(n, sigma):
+    """
+    Gauss-Hermite quadrature rule for expectations of functions of a normal
+    random variable with mean zero and standard deviation sigma.
+
+    Arguments:
+
+        n:     (int) Number of quadrature nodes.
+        sigma: (float) Standard deviation of the shock.
+
+    Returns:
+
+        nodes:   (array) Values of the shock.
+        weights: (array) Quadrature weights (sum to one).
+
+    """
+    nodes, weights = gauss_hermite(n, 1, sigma)
+    return nodes[:, 0], weights
+
+
+def monomial_rule(sigma):
+    """
+    Monomial rule M1 of Judd, Maliar and Maliar (2011) for a single normal
+    shock with mean zero and standard deviation sigma: two nodes at plus
+    and minus sigma with equal weights.
+
+    """
+    nodes, weights = monomial(1, 1, sigma)
+    return nodes[:, 0], weights
@@ -0,0 +1,232 @@
+from __future__ import division
+import sys
+
+import numpy as np
+
+from growth import OptimalGrowthModel
+
+
+def _as_systems(x):
+    """View of x as a stack of systems with shape (n, m)."""
+    x = np.array(x, dtype=float)
+    return x.reshape(x.shape[0], -1)
+
+
+def _solvable(F, J):
+    """
+    Mask of the systems with finite residuals F and a finite, nonsingular
+    Jacobian J, i.e., those that have a well defined step.
+
+    """
+    with np.errstate(invalid='ignore', over='ignore'):
+        return (np.all(np.isfinite(F), axis=1) & np.all(np.isfinite(J), axis=(1, 2)) &
+                (np.abs(np.linalg.det(J)) > 0))
+
+
+def newton(fun, x0, mask=None, tol=1e-10, max_iter=50, max_step=None, mesg=False):
+    """
+    Newton's method for many independent systems of equations at once,
+    e.g., one system per calibration. Each iteration evaluates the residuals
+    and Jacobians of the systems that have not converged yet and solves all
+    the Newton steps with one batched linear solve; converged systems drop
+    out of the computation.
+
+    Arguments:
+
+        fun:      (callable) fun(x, idx) returns the residuals (shape (n, m),
+                  or (n,) for scalar equations) and Jacobians (shape
+                  (n, m, m), or (n,)) of the systems idx at x, where x holds
+                  their current values.
+        x0:       (array) Initial guesses with shape (N, m) or (N,).
+        mask:     (array) Boolean mask of the systems to solve. Default is
+                  all of them; the others are returned unchanged.
+        tol:      (float) Convergence criterion on the largest absolute
+                  residual (and step) of each system.
+        max_iter: (int) Maximum number of iterations.
+        max_step: (float) Largest absolute change of any unknown in one
+                  iteration; longer steps are scaled down. Default is no
+                  limit.
+        mesg:     (boolean) Should messages be printed detailing
+                  convergence progress? Default is False.
+
+    Returns:
+
+        x:         (array) Solutions, with the shape of x0.
+        converged: (array) Boolean mask of the systems that converged.
+
+    Systems whose Jacobian is singular (or whose residuals are not
+    finite) are dropped without converging, instead of failing the whole
+    batch.
+
+    """
+    x0 = np.asarray(x0, dtype=float)
+    x = _as_systems(x0)
+    active = np.ones(x.shape[0], dtype=bool) if mask is None else np.array(mask, dtype=bool)
+    converged = np.zeros(x.shape[0], dtype=bool)
+
+    for n_iter in range(1, max_iter + 1):
+        idx = np.flatnonzero(active)
+        if idx.size == 0:
+            break
+
+        F, J = fun(x[idx].reshape((-1,) + x0.shape[1:]), idx)
+        F = F.reshape(idx.size, -1)
+        J = J.reshape(idx.size, F.shape[1], F.shape[1])
+
+        # drop the systems that have no well defined Newton step
+        solvable = _solvable(F, J)
+        active[idx[~solvable]] = False
+        idx, F, J = idx[solvable], F[solvable], J[solvable]
+
+        step = np.linalg.solve(J, F[..., np.newaxis])[..., 0]
+        if max_step is not None:
+            longest = np.max(np.abs(step), axis=1, initial=0)
+            step *= np.minimum(1, max_step / np.maximum(longest, np.finfo(float).tiny))[:, np.newaxis]
+        x[idx] -= step
+
+        done = (np.max(np.abs(F), axis=1) < tol) | (np.max(np.abs(step), axis=1) < tol)
+        converged[idx[done]] = True
+        active[idx[done]] = False
+
+        if mesg:
+            sys.stdout.write("After %i iterations, %i systems remain\n" % (n_iter, active.sum()))
+
+    return x.reshape(x0.shape), converged
+
+
+def broyden(fun, x0, jac=None, mask=None, tol=1e-10, max_iter=100, step=1e-7, mesg=False):
+    """
+    Broyden's (good) method for many independent systems of equations at
+    once. The Jacobian of each system is computed once at x0 (analytically
+    by jac, or by forward differences) and then updated by rank one
+    corrections, so that each iteration costs one evaluation of the
+    residuals of the remaining systems.
+
+    Arguments:
+
+        fun:  (callable) fun(x, idx) returns the residuals of the systems
+              idx at x (see newton).
+        jac:  (callable) jac(x, idx) returns their Jacobians. Default is
+              forward differences with step size step.
+        Other arguments and returns as in newton (systems whose Jacobian
+        approximation becomes singular are dropped without converging).
+
+    """
+    x0 = np.asarray(x0, dtype=float)
+    shape = x0.shape[1:]
+    x = _as_systems(x0)
+    N, m = x.shape
+    active = np.ones(N, dtype=bool) if mask is None else np.array(mask, dtype=bool)
+    converged = np.zeros(N, dtype=bool)
+
+    def residuals(values, idx):
+        return np.asarray(fun(values.reshape((-1,) + shape), idx), dtype=float).reshape(idx.size, m)
+
+    idx = np.flatnonzero(active)
+    F = np.zeros((N, m))
+    B = np.zeros((N, m, m))
+    F[idx] = residuals(x[idx], idx)
+    if jac is not None:
+        B[idx] = np.asarray(jac(x[idx].reshape((-1,) + shape), idx)).reshape(idx.size, m, m)
+    else:
+        for j in range(m):
+            h = step * np.maximum(1, np.abs(x[idx, j]))
+            shifted = x[idx].copy()
+            shifted[:, j] += h
+            B[idx, :, j] = (residuals(shifted, idx) - F[idx]) / h[:, np.newaxis]
+
+    for n_iter in range(1, max_iter + 1):
+        idx = np.flatnonzero(active)
+        if idx.size == 0:
+            break
+
+        solvable = _solvable(F[idx], B[idx])
+        active[idx[~solvable]] = False
+        idx = idx[solvable]
+
+        dx = -np.linalg.solve(B[idx], F[idx][..., np.newaxis])[..., 0]
+        x[idx] += dx
+        F_new = residuals(x[idx], idx)
+
+        # rank one updates B += (dF - B dx) dx' / dx'dx
+        dF = F_new - F[idx]
+        Bdx = np.einsum('nij,nj->ni', B[idx], dx)
+        denom = np.maximum(np.sum(dx**2, axis=1), np.finfo(float).tiny)
+        B[idx] += np.einsum('ni,nj->nij', dF - Bdx, dx) / denom[:, np.newaxis, np.newaxis]
+        F[idx] = F_new
+
+        done = (np.max(np.abs(F_new), axis=1) < tol) | (np.max(np.abs(dx), axis=1) < tol)
+        converged[idx[done]] = True
+        active[idx[done]] = False
+
+        if mesg:
+            sys.stdout.write("After %i iterations, %i systems remain\n" % (n_iter, active.sum()))
+
+    return x.reshape(x0.shape), converged
+
+
+def euler_residual(model, k):
+    """
+    Steady state Euler equation beta (f'(k) + 1 - delta) - 1 and its
+    derivative with respect to log(k), for every calibration of model.
+
+    """
+    mpk = model.ces_mpk(k)
+    resid = model.beta * (mpk + 1 - model.delta) - 1
+    slope = model.beta * model.ces_mpk_derivative(k) * k
+    return resid, slope
+
+
+def steady_states(model, k0=None, method='newton', mask=None, tol=1e-12, max_iter=100,
+                  max_step=1.0, mesg=False):
+    """
+    Deterministic steady states of an OptimalGrowthModel whose parameters
+    are arrays of calibrations, found by root finding on the Euler equation
+    (in log capital, which keeps capital positive) rather than the closed
+    form of k_star, with the analytic derivative from ces_mpk_derivative.
+
+    Arguments:
+
+        model:    (object) An instance of the OptimalGrowthModel class with
+                  array parameters of common shape (N,).
+        k0:       (array) Initial guesses for capital. Default is one.
+        method:   (str) Either 'newton' or 'broyden'.
+        mask:     (array) Boolean mask of the calibrations to solve (e.g.,
+                  those with model.k_star_isfinite()).
+        tol:      (float) Convergence criterion.
+        max_iter: (int) Maximum number of iterations.
+        max_step: (float) Largest Newton step in log capital (method
+                  'newton'), which keeps a flat residual from throwing
+                  capital to zero or infinity.
+        mesg:     (boolean) Print convergence progress.
+
+    Returns:
+
+        k:         (array) Steady state capital.
+        c:         (array) Steady state consumption.
+        converged: (array) Boolean mask of the converged calibrations.
+
+    """
+    params = np.broadcast_arrays(*[getattr(model, name) for name in
+                                   ('alpha', 'sigma', 'delta', 'beta')])
+    N = params[0].size
+    if k0 is None:
+        k0 = np.ones(N)
+    x0 = np.log(np.broadcast_to(np.asarray(k0, dtype=float), (N,)))
+
+    full = OptimalGrowthModel(*[p.ravel() for p in params])
+
+    def fun(x, idx):
+        return euler_residual(full.select(idx), np.exp(x))
+
+    if method == 'newton':
+        x, converged = newton(fun, x0, mask, tol, max_iter, max_step, mesg)
+    elif method == 'broyden':
+        x, converged = broyden(lambda x, idx: fun(x, idx)[0], x0,
+                               lambda x, idx: fun(x, idx)[1], mask, tol, max_iter, mesg=mesg)
+    else:
+        raise ValueError("Unknown method %r." % method)
+
+    k = np.exp(x)
+    c = full.ces_output(k) - full.delta * k
+    return k, c, converged
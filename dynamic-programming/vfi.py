@@ -0,0 +1,216 @@
+from __future__ import division
+import os
+import sys
+
+import numpy as np
+from scipy import optimize
+
+import checkpoint as checkpoint_module
+
+
+def maximize(w, lower, upper):
+    """
+    Wraps fminbound to find the value the minimizes -w on the closed interval
+    [lower, upper] using Brent's method.
+
+    Arguments:
+
+        w:     (callable) A function representing the current value function
+               iterate.
+        lower: (scalar) Lower bound on the correspondence of feasible controls.
+        upper: (scalar) Upper bound on the correspondence of feasbile controls.
+
+    Returns:
+
+        pol: Value of the control that maximizes the function w.
+
+    """
+    pol = optimize.fminbound(lambda x: -w(x), lower, upper)
+    return pol
+
+
+def _maximize_bellman(model, w, grid):
+    """Solve the inner maximization of the Bellman equation at each state."""
+    vals = np.empty(grid.size)
+    pols = np.empty(grid.size)
+
+    # loop over each state and...
+    for i, k in enumerate(grid):
+
+        def obj(c):
+            """Current value function."""
+            # next period's value of capital (don't forget to set z=0)
+            kplus = model.capital_motion(k, 0, c)
+
+            # compute the value function
+            tmp_w = (1 - model.beta) * model.crra_utility(c) + model.beta * w(kplus)
+
+            return tmp_w
+
+        # compute the maximizer
+        pols[i] = maximize(obj, 0, model.Gamma(k))
+
+        # store the new value
+        vals[i] = obj(pols[i])
+
+    return vals, pols
+
+
+def envelope_slopes(model, k, c):
+    """
+    Derivative of the value function implied by the envelope condition.
+    Combining the envelope condition with the first-order condition for
+    consumption gives Tw'(k) = (1 - beta) u'(c) (f'(k) + 1 - delta).
+
+    Arguments:
+
+        model: (object) An instance of the OptimalGrowthModel class.
+        k:     (array) Values of capital.
+        c:     (array) Optimal consumption at k.
+
+    Returns:
+
+        slopes: (array) Slopes of the value function at k.
+
+    """
+    gross_return = model.ces_mpk(k) + 1 - model.delta
+    slopes = (1 - model.beta) * model.crra_marginal_utility(c) * gross_return
+    return slopes
+
+
+def deterministic_bellman_operator(w, basis, model):
+    """
+    Bellman operator for the optimal savings model with inelastic labor
+    supply.
+
+    The new value function iterate is built by basis.approximate from the
+    values at the nodes and the slopes given by the envelope condition.
+    With a ChebyshevBasis this is a least squares fit using the cached
+    pseudo-inverse; with a SplineBasis this is shape-preserving Schumaker
+    or Hermite interpolation, which keeps the iterates concave so that the
+    inner maximization stays well behaved.
+
+    Arguments:
+
+        w:     (callable) Current value function iterate.
+        basis: (object) An instance of ChebyshevBasis or SplineBasis whose
+               nodes are the grid of values for capital.
+        model: (object) An instance of the OptimalGrowthModel class.
+
+    Returns:
+
+        Tw: (callable) New value function iterate.
+
+    """
+    vals, pols = _maximize_bellman(model, w, basis.nodes)
+    Tw = basis.approximate(vals, envelope_slopes(model, basis.nodes, pols))
+    return Tw
+
+
+def deterministic_greedy_operator(w, basis, model):
+    """
+    Greedy operator for the optimal savings model with inelastic labor
+    supply. The policy function is approximated by basis.approximate from
+    the optimal consumption choices at the nodes.
+
+    Arguments:
+
+        w:     (callable) Current value function iterate.
+        basis: (object) An instance of ChebyshevBasis or SplineBasis.
+        model: (object) An instance of the OptimalGrowthModel class.
+
+    Returns:
+
+        greedy_policy: (callable) Consumption policy function.
+
+    """
+    _, pols = _maximize_bellman(model, w, basis.nodes)
+    greedy_policy = basis.approximate(pols)
+    return greedy_policy
+
+
+def solve_VFI(init_v, T, tol, pts, basis, mesg=False, checkpoint=None,
+              checkpoint_interval=10, **kwargs):
+    """
+    Basic implementation of Value Iteration Algorithm.
+
+    Arguments:
+
+        init_v: Initial guess of the true value function. A good initial
+                guess can save a substantial amount of computational time.
+
+        T:      A pre-defined Bellman operator with signature
+                T(w, basis, **kwargs).
+
+        tol:    Convergence criterion. Algorithm will terminate when
+                the supremum norm distance between successive value
+                function iterates is less than tol.
+
+        pts:    Grid of points over which to compare value function iterates.
+
+        basis:  (object) An instance of ChebyshevBasis or SplineBasis. With
+                a Chebyshev basis the basis matrix at pts is built once so
+                that each convergence check is a single matrix-vector
+                product.
+
+        mesg:   Should messages be printed detailing convergence progress?
+                Default is False.
+
+        checkpoint: (str) Optional .npy file. Every checkpoint_interval
+                iterations the values of the current iterate at the
+                nodes are saved there, and if the file exists when
+                solve_VFI is called the iteration resumes from it
+                (init_v is then ignored). The file must hold one value
+                per node of basis, else ValueError is raised, and it is
+                removed once the iteration converges.
+
+        checkpoint_interval: (int) Number of iterations between
+                checkpoints.
+
+    Returns:
+
+        final_v: (object) Callable object representing the value function.
+
+    """
+    # keep track of number of iterations
+    n_iter = 0
+
+    ##### Value iteration algorithm #####
+    current_v = init_v
+
+    if checkpoint is not None:
+        saved_iter, vals = checkpoint_module.load_iterate(checkpoint)
+        if vals is not None:
+            if vals.size != basis.nodes.size:
+                raise ValueError("Checkpoint %s holds %i values but the basis has %i nodes."
+                                 % (checkpoint, vals.size, basis.nodes.size))
+            n_iter, current_v = saved_iter, basis.approximate(vals)
+
+    while True:
+        next_v = T(current_v, basis, **kwargs)
+        # supremum norm convergence criterion
+        change = basis.sup_distance(next_v, current_v, pts)
+        n_iter += 1
+
+        if not np.isfinite(change):
+            raise ValueError("Value function iteration diverged: the change after %i iterations is %g." % (n_iter, change))
+
+        # check for convergence
+        if change < tol:
+            if mesg:
+                sys.stdout.write("After %i iterations, the final change is %g\n" % (n_iter, change))
+            final_v = next_v
+            if checkpoint is not None and os.path.exists(checkpoint):
+                os.remove(checkpoint)
+            break
+
+        # print progress every 10 iterations
+        if n_iter % 10 == 0 and mesg:
+            sys.stdout.write("After %i iterations, the change is %g\n" % (n_iter, change))
+
+        current_v = next_v
+
+        if checkpoint is not None and n_iter % checkpoint_interval == 0:
+            checkpoint_module.save_iterate(checkpoint, n_iter, current_v(basis.nodes))
+
+    return final_v
@@ -0,0 +1,451 @@
+from __future__ import division
+import types
+
+from coopr import pyomo
+
+import ampl_params
+
+
+class UnsupportedRuleError(ValueError):
+    """Raised when a rule cannot be written as a single indexed AMPL statement."""
+    pass
+
+
+# precedence of AMPL operators (higher binds tighter)
+_RELATION, _SUM, _PRODUCT, _NEGATION, _POWER, _ATOM = range(6)
+
+# AMPL domains of the Pyomo virtual sets
+_domains = {'Reals': '',
+            'PositiveReals': '>= 0',
+            'NonNegativeReals': '>= 0',
+            'NegativeReals': '<= 0',
+            'NonPositiveReals': '<= 0',
+            'Integers': 'integer',
+            'PositiveIntegers': 'integer >= 1',
+            'NonNegativeIntegers': 'integer >= 0',
+            'NegativeIntegers': 'integer <= -1',
+            'NonPositiveIntegers': 'integer <= 0',
+            'Boolean': 'binary',
+            'Binary': 'binary'}
+
+
+def _number(value):
+    """AMPL literal for a number (unbounded values become Infinity)."""
+    value = float(value)
+    if value != value:
+        raise ValueError("AMPL has no literal for nan.")
+    if value in (float('inf'), float('-inf')):
+        return 'Infinity' if value > 0 else '-Infinity'
+    if value == int(value) and abs(value) < 1e15:
+        return '%d' % value
+    return repr(value)
+
+
+def _literal(value):
+    """AMPL literal for a set member or an index."""
+    if isinstance(value, str):
+        return "'%s'" % value
+    return _number(value)
+
+
+def _expression(value):
+    """Wrap numbers as AmplExpression objects."""
+    if isinstance(value, AmplExpression):
+        return value
+    return AmplExpression(_number(value), _ATOM)
+
+
+class AmplExpression(object):
+    """
+    Symbolic stand-in for the Pyomo expressions built by the rules of a
+    model. Arithmetic on instances of this class produces AMPL source text
+    instead of expanded Pyomo expression trees, so that a rule evaluated once
+    at a symbolic index describes every row of an indexed constraint.
+
+    """
+
+    def __init__(self, text, precedence=_ATOM):
+        self.text = text
+        self.precedence = precedence
+
+    def __str__(self):
+        return self.text
+
+    def __repr__(self):
+        return 'AmplExpression(%r)' % self.text
+
+    def _wrap(self, precedence):
+        """Text of self as an operand of an operator with given precedence."""
+        if self.precedence < precedence:
+            return '(%s)' % self.text
+        return self.text
+
+    def _binary(self, other, operator, precedence, reflected=False):
+        left, right = self, _expression(other)
+        if reflected:
+            left, right = right, left
+        if operator == '^':
+            # exponentiation is right associative
+            text = '%s^%s' % (left._wrap(precedence + 1), right._wrap(precedence))
+        else:
+            text = '%s %s %s' % (left._wrap(precedence), operator, right._wrap(precedence + 1))
+        return AmplExpression(text, precedence)
+
+    def __add__(self, other):
+        if not isinstance(other, AmplExpression) and other == 0:
+            return self
+        return self._binary(other, '+', _SUM)
+
+    def __radd__(self, other):
+        if not isinstance(other, AmplExpression) and other == 0:
+            return self
+        return self._binary(other, '+', _SUM, reflected=True)
+
+    def __sub__(self, other):
+        return self._binary(other, '-', _SUM)
+
+    def __rsub__(self, other):
+        return self._binary(other, '-', _SUM, reflected=True)
+
+    def __mul__(self, other):
+        return self._binary(other, '*', _PRODUCT)
+
+    def __rmul__(self, other):
+        return self._binary(other, '*', _PRODUCT, reflected=True)
+
+    def __truediv__(self, other):
+        return self._binary(other, '/', _PRODUCT)
+
+    def __rtruediv__(self, other):
+        return self._binary(other, '/', _PRODUCT, reflected=True)
+
+    __div__ = __truediv__
+    __rdiv__ = __rtruediv__
+
+    def __pow__(self, other):
+        return self._binary(other, '^', _POWER)
+
+    def __rpow__(self, other):
+        return self._binary(other, '^', _POWER, reflected=True)
+
+    def __neg__(self):
+        return AmplExpression('-%s' % self._wrap(_NEGATION), _NEGATION)
+
+    def __pos__(self):
+        return self
+
+    def _relation(self, other, operator):
+        text = '%s %s %s' % (self.text, operator, _expression(other).text)
+        return AmplExpression(text, _RELATION)
+
+    def __eq__(self, other):
+        return self._relation(other, '=')
+
+    def __ge__(self, other):
+        return self._relation(other, '>=')
+
+    def __le__(self, other):
+        return self._relation(other, '<=')
+
+    __hash__ = None
+
+    def __bool__(self):
+        raise UnsupportedRuleError("rule branches on the symbolic value %r" % self.text)
+
+    __nonzero__ = __bool__
+
+
+class _IndexedSymbol(object):
+    """Symbolic stand-in for an indexed param or var."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __getitem__(self, index):
+        if not isinstance(index, tuple):
+            index = (index,)
+        text = ', '.join(_expression(i).text if not isinstance(i, str) else _literal(i)
+                         for i in index)
+        return AmplExpression('%s[%s]' % (self.name, text))
+
+
+class _SymbolicSet(object):
+    """
+    Symbolic stand-in for a set. Iterating over it yields a single dummy
+    index, which _symbolic_sum turns into an AMPL iterated sum.
+
+    """
+
+    def __init__(self, text, translator):
+        self.text = text
+        self.translator = translator
+
+    def __iter__(self):
+        index = self.translator.new_index()
+        self.translator.iterated.append((index, self.text))
+        yield index
+
+
+class _SymbolicModel(object):
+    """Stand-in for an instance that is passed to the rules in place of it."""
+
+    def __init__(self, translator):
+        self.__dict__['_translator'] = translator
+
+    def __getattr__(self, name):
+        return self._translator.symbol(name)
+
+
+class _Translator(object):
+    """Translates the rules of a constructed instance into AMPL source text."""
+
+    def __init__(self, instance):
+        self.instance = instance
+        self.iterated = []
+        self.n_indices = 0
+        self.model = _SymbolicModel(self)
+
+        # named sets are declared in the model, anonymous ones are inlined
+        self.sets = sorted(instance.active_components(pyomo.Set).items())
+        self.set_names = dict((id(s), name) for name, s in self.sets)
+
+    def new_index(self):
+        """Fresh dummy index (t, t1, t2, ...)."""
+        index = 't' if self.n_indices == 0 else 't%d' % self.n_indices
+        self.n_indices += 1
+        return AmplExpression(index)
+
+    def set_text(self, s):
+        """AMPL expression for the set s."""
+        if id(s) in self.set_names:
+            return self.set_names[id(s)]
+        return set_literal(s)
+
+    def symbol(self, name):
+        """Symbolic value of the component name of the instance."""
+        component = getattr(self.instance, name)
+        if isinstance(component, pyomo.Set):
+            return _SymbolicSet(self.set_text(component), self)
+        if isinstance(component, (pyomo.Param, pyomo.Var)):
+            if component.dim() == 0:
+                return AmplExpression(name)
+            return _IndexedSymbol(name)
+        raise UnsupportedRuleError("rule uses the component %s" % name)
+
+    def _symbolic_sum(self, iterable, start=0):
+        """Replacement for the builtin sum inside rules."""
+        depth = len(self.iterated)
+        terms = list(iterable)
+        if len(self.iterated) == depth:
+            return sum(terms, start)
+        index, set_text = self.iterated.pop()
+        term = terms[0]
+        text = 'sum {%s in %s} %s' % (index, set_text, _expression(term)._wrap(_PRODUCT))
+        return start + AmplExpression(text, _SUM)
+
+    def evaluate(self, rule, *args):
+        """Call rule on the symbolic model with sum replaced by _symbolic_sum."""
+        namespace = dict(rule.__globals__)
+        namespace['sum'] = self._symbolic_sum
+        symbolic_rule = types.FunctionType(rule.__code__, namespace, rule.__name__,
+                                           rule.__defaults__, rule.__closure__)
+        return symbolic_rule(self.model, *args)
+
+
+def set_literal(s):
+    """Members of a concrete one dimensional set as an AMPL set expression."""
+    members = sorted(s)
+    if members and all(isinstance(m, int) for m in members):
+        if members == list(range(members[0], members[-1] + 1)):
+            return '%d..%d' % (members[0], members[-1])
+    return '{%s}' % ', '.join(_literal(m) for m in members)
+
+
+def _domain(component):
+    """AMPL domain restriction matching the domain of a param or var."""
+    domain = getattr(component, 'domain', None)
+    return _domains.get(getattr(domain, 'name', None), '')
+
+
+def _declaration(keyword, name, indexing, *attributes):
+    """Join the pieces of an AMPL declaration."""
+    pieces = [keyword, name]
+    if indexing:
+        pieces.append('{%s}' % indexing)
+    attributes = [a for a in attributes if a]
+    if attributes:
+        pieces.append(', '.join(attributes))
+    return ' '.join(pieces) + ';'
+
+
+def _initial_value(var):
+    """Common initial value of the elements of var, if there is one."""
+    values = set(var[key].value for key in var.keys())
+    if len(values) == 1:
+        value = values.pop()
+        if value is not None:
+            return ':= %s' % _number(value)
+    return ''
+
+
+def _constraint_body(translator, rule, index=None):
+    """AMPL text of the relation returned by a constraint rule."""
+    args = () if index is None else (index,)
+    body = translator.evaluate(rule, *args)
+    if isinstance(body, tuple):
+        lower, expr, upper = body
+        pieces = [_expression(expr).text]
+        if lower is not None:
+            pieces.insert(0, '%s <=' % _expression(lower).text)
+        if upper is not None:
+            pieces.append('<= %s' % _expression(upper).text)
+        return ' '.join(pieces)
+    if not isinstance(body, AmplExpression) or body.precedence != _RELATION:
+        raise UnsupportedRuleError("rule %s does not return a relation" % rule.__name__)
+    return body.text
+
+
+def ampl_model(instance):
+    """
+    Compact AMPL model for a constructed instance of one of the lifecycle
+    models. Indexed constraints are written once, as a single AMPL statement
+    indexed over their set, by evaluating their rules at a symbolic index;
+    the size of the model therefore does not grow with the time horizon.
+    Param values (and var initial values that differ across periods) go in
+    the data section, see ampl_data.
+
+    Rules may use arithmetic, ** and sum over the sets of the model, but may
+    not branch on the values of params or vars; initialize rules are never
+    translated because the values they produced are sent as data.
+
+    Arguments:
+
+        instance: (object) A constructed (concrete) instance of the model.
+
+    Returns:
+
+        model: (str) AMPL model section.
+
+    """
+    translator = _Translator(instance)
+    lines = []
+
+    for name, s in translator.sets:
+        lines.append('set %s := %s;' % (name, set_literal(s)))
+
+    for name, param in sorted(instance.active_components(pyomo.Param).items()):
+        indexing = None if param.dim() == 0 else translator.set_text(param._index)
+        lines.append(_declaration('param', name, indexing, _domain(param)))
+
+    for name, var in sorted(instance.active_components(pyomo.Var).items()):
+        indexing = None if var.dim() == 0 else translator.set_text(var._index)
+        lines.append(_declaration('var', name, indexing, _domain(var), _initial_value(var)))
+
+    for name, objective in sorted(instance.active_components(pyomo.Objective).items()):
+        sense = 'maximize' if objective.sense == pyomo.maximize else 'minimize'
+        translator.n_indices = 0
+        expr = _expression(translator.evaluate(objective.rule))
+        lines.append('%s %s: %s;' % (sense, name, expr.text))
+
+    for name, constraint in sorted(instance.active_components(pyomo.Constraint).items()):
+        translator.n_indices = 0
+        if constraint.dim() == 0:
+            body = _constraint_body(translator, constraint.rule)
+            lines.append('subject to %s: %s;' % (name, body))
+        else:
+            index = translator.new_index()
+            body = _constraint_body(translator, constraint.rule, index)
+            indexing = '%s in %s' % (index, translator.set_text(constraint._index))
+            lines.append('subject to %s {%s}: %s;' % (name, indexing, body))
+
+    return '\n'.join(lines) + '\n'
+
+
+def _format_param(name, param):
+    """AMPL data statement for a param."""
+    if param.dim() == 0:
+        return ampl_params.format_scalar(name, pyomo.value(param))
+    keys = sorted(param.keys())
+    return ampl_params.format_table(name, keys, [pyomo.value(param[key]) for key in keys])
+
+
+def _format_var(name, var):
+    """AMPL data statement setting the initial values of an indexed var."""
+    keys = [key for key in sorted(var.keys()) if var[key].value is not None]
+    statement = ampl_params.format_table(name, keys, [var[key].value for key in keys])
+    return 'var' + statement[len('param'):]
+
+
+def ampl_data(instance):
+    """
+    AMPL data section holding the values of every param of the instance and
+    the initial values of the vars that do not share a common initial value
+    (those that do are set in the model, see ampl_model).
+
+    Arguments:
+
+        instance: (object) A constructed (concrete) instance of the model.
+
+    Returns:
+
+        data: (str) AMPL data section.
+
+    """
+    statements = []
+
+    for name, param in sorted(instance.active_components(pyomo.Param).items()):
+        statements.append(_format_param(name, param))
+
+    for name, var in sorted(instance.active_components(pyomo.Var).items()):
+        if var.dim() > 0 and not _initial_value(var):
+            statements.append(_format_var(name, var))
+
+    return ''.join(statements)
+
+
+def ampl_commands(instance):
+    """AMPL commands that solve the model and display every var."""
+    names = sorted(instance.active_components(pyomo.Var))
+    return 'solve;\ndisplay %s;\n' % ', '.join(names)
+
+
+def write_ampl(instance, basename):
+    """
+    Write the model, data and commands for instance to basename.mod,
+    basename.dat and basename.ampl.
+
+    Returns:
+
+        filenames: (tuple) Names of the model, data and commands files.
+
+    """
+    filenames = (basename + '.mod', basename + '.dat', basename + '.ampl')
+    for filename, text in zip(filenames, (ampl_model(instance), ampl_data(instance),
+                                          ampl_commands(instance))):
+        with open(filename, 'w') as f:
+            f.write(text)
+    return filenames
+
+
+def build_xml_string(neos, category, solver, instance, comments=''):
+    """
+    XML job for submitting instance to an AMPL solver on NEOS. The model,
+    data and commands are passed to BuildXmlStringAmpl as strings, so no
+    files are written.
+
+    Arguments:
+
+        neos:     (object) A connected instance of pyneos.NeosInterface.
+        category: (str) NEOS solver category (e.g., 'nco').
+        solver:   (str) NEOS solver name (e.g., 'KNITRO').
+        instance: (object) A constructed (concrete) instance of the model.
+        comments: (str) Comments sent along with the job.
+
+    Returns:
+
+        xml: (str) Job description for NeosInterface.SubmitJob.
+
+    """
+    return neos.BuildXmlStringAmpl(category, solver, ampl_model(instance),
+                                   ampl_data(instance), ampl_commands(instance),
+                                   comments)
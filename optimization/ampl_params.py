@@ -0,0 +1,243 @@
+from __future__ import division
+
+import numpy as np
+
+
+# rows formatted by a single % operation
+_chunk_size = 100000
+
+# shortest representation that reads back as the same float
+_value_format = '%r'
+
+
+def _check_finite(name, values):
+    """AMPL data sections have no literal for nan (inf is written as Infinity)."""
+    if np.any(np.isnan(values)):
+        raise ValueError("param %s has nan values" % name)
+
+
+def _value_literal(value):
+    """AMPL literal for a value, with Infinity for unbounded values."""
+    if value in (float('inf'), float('-inf')):
+        return 'Infinity' if value > 0 else '-Infinity'
+    return _value_format % value
+
+
+def _value_column(values):
+    """
+    printf style format and list of a column of values. Columns holding
+    infinite values are formatted value by value.
+
+    """
+    if np.all(np.isfinite(values)):
+        return _value_format, values.tolist()
+    return '%s', [_value_literal(value) for value in values.tolist()]
+
+
+def _column_format(index):
+    """printf style format for a column of indices or values."""
+    if np.issubdtype(index.dtype, np.integer):
+        return '%d'
+    if np.issubdtype(index.dtype, np.floating):
+        return _value_format
+    return "'%s'"
+
+
+def _format_rows(row_format, columns):
+    """
+    Format a table given as a list of columns. The columns are interleaved
+    by slice assignment and each chunk of rows is formatted with a single %
+    operation on a repeated row format, instead of row by row.
+
+    """
+    n, k = len(columns[0]), len(columns)
+    pieces = []
+    for start in range(0, n, _chunk_size):
+        stop = min(start + _chunk_size, n)
+        flat = [None] * ((stop - start) * k)
+        for j, column in enumerate(columns):
+            flat[j::k] = column[start:stop]
+        pieces.append((row_format * (stop - start)) % tuple(flat))
+    return ''.join(pieces)
+
+
+def format_scalar(name, value):
+    """AMPL data statement for a scalar param."""
+    _check_finite(name, value)
+    return 'param %s := %s;\n' % (name, _value_literal(float(value)))
+
+
+def format_vector(name, values, first_index=1):
+    """
+    AMPL data statement for a param indexed by consecutive integers.
+
+    Arguments:
+
+        name:        (str) Name of the param.
+        values:      (array) One dimensional array of values.
+        first_index: (int) Index of the first value. Default is 1, as in
+                     fprintAmplParamCLSU.m.
+
+    Returns:
+
+        statement: (str) AMPL data statement.
+
+    """
+    values = np.asarray(values, dtype=float).ravel()
+    _check_finite(name, values)
+    index = list(range(first_index, first_index + values.size))
+    value_format, column = _value_column(values)
+    body = _format_rows('\t%d\t' + value_format + '\n', [index, column])
+    return 'param %s :=\n%s;\n' % (name, body)
+
+
+def _format_matrix_body(values, first_index):
+    """Column header and rows of an AMPL two dimensional table."""
+    nrows, ncols = values.shape
+    columns = np.arange(first_index[1], first_index[1] + ncols)
+    header = ''.join('\t%d' % j for j in columns) + ' :=\n'
+    index = list(range(first_index[0], first_index[0] + nrows))
+    formats, columns = list(zip(*[_value_column(values[:, j]) for j in range(ncols)])) or ((), ())
+    row_format = '%d' + ''.join('\t' + f for f in formats) + '\n'
+    return header + _format_rows(row_format, [index] + list(columns))
+
+
+def format_matrix(name, values, first_index=(1, 1)):
+    """
+    AMPL data statement for a param indexed by two sets of consecutive
+    integers, written as a table whose rows are the first index and whose
+    columns are the second.
+
+    Arguments:
+
+        name:        (str) Name of the param.
+        values:      (array) Two dimensional array of values.
+        first_index: (tuple) Indices of the first row and column.
+
+    Returns:
+
+        statement: (str) AMPL data statement.
+
+    """
+    values = np.asarray(values, dtype=float)
+    _check_finite(name, values)
+    return 'param %s :\n%s;\n' % (name, _format_matrix_body(values, first_index))
+
+
+def format_array3(name, values, first_index=(1, 1, 1)):
+    """
+    AMPL data statement for a param indexed by three sets of consecutive
+    integers, written as one [*,*,k] table for each value of the last index.
+
+    """
+    values = np.asarray(values, dtype=float)
+    _check_finite(name, values)
+    pieces = ['param %s :=\n' % name]
+    for k in range(values.shape[2]):
+        pieces.append('[*,*,%d]:\n' % (first_index[2] + k))
+        pieces.append(_format_matrix_body(values[:, :, k], first_index[:2]))
+    pieces.append(';\n')
+    return ''.join(pieces)
+
+
+def _key_columns(keys):
+    """
+    Columns of indices of a list of dict keys. Tuple keys are split into
+    one array per position, so that a column of integers stays integer
+    even when another column holds strings.
+
+    """
+    if keys and isinstance(keys[0], tuple):
+        return tuple(np.array([key[j] for key in keys]) for j in range(len(keys[0])))
+    return np.array(keys)
+
+
+def format_table(name, index, values):
+    """
+    AMPL data statement for a param with arbitrary (sparse) indices, one row
+    of indices and value per line.
+
+    Arguments:
+
+        name:   (str) Name of the param.
+        index:  (array) Indices with shape (n,) or (n, d), a list of n keys
+                (tuples of d indices if d > 1), or a tuple of d arrays of
+                length n (e.g., the row and col of a COO matrix).
+        values: (array) Values with shape (n,).
+
+    Returns:
+
+        statement: (str) AMPL data statement.
+
+    """
+    if isinstance(index, list):
+        index = _key_columns(index)
+    if isinstance(index, tuple):
+        columns = [np.asarray(i) for i in index]
+    else:
+        index = np.asarray(index)
+        columns = [index] if index.ndim == 1 else list(index.T)
+    values = np.asarray(values, dtype=float).ravel()
+    _check_finite(name, values)
+
+    value_format, column = _value_column(values)
+    row_format = '\t'.join([_column_format(c) for c in columns] + [value_format]) + '\n'
+    body = _format_rows(row_format, [c.tolist() for c in columns] + [column])
+    return 'param %s :=\n%s;\n' % (name, body)
+
+
+def format_param(name, value, first_index=1):
+    """
+    AMPL data statement for a param, dispatching on the type of value:
+    scalars, vectors, matrices and three dimensional arrays are indexed by
+    consecutive integers starting at first_index, dicts are written as
+    tables keyed by their keys and (index, values) tuples are passed on to
+    format_table.
+
+    """
+    if isinstance(value, dict):
+        keys = sorted(value)
+        return format_table(name, keys, [value[key] for key in keys])
+    if isinstance(value, tuple):
+        return format_table(name, value[0], value[1])
+
+    value = np.asarray(value, dtype=float)
+    if value.ndim == 0:
+        return format_scalar(name, value)
+    elif value.ndim == 1:
+        return format_vector(name, value, first_index)
+    elif value.ndim == 2:
+        return format_matrix(name, value, (first_index,) * 2)
+    elif value.ndim == 3:
+        return format_array3(name, value, (first_index,) * 3)
+    else:
+        raise ValueError("param %s has %i dimensions, at most 3 are supported" % (name, value.ndim))
+
+
+def data_section(params, first_index=1):
+    """
+    In memory AMPL data section for a collection of params. The result can
+    be passed as the data argument of NeosInterface.BuildXmlStringAmpl in
+    place of a .dat file name, replacing fprintAmplParamCLSU.m.
+
+    Arguments:
+
+        params:      (list) (name, value) pairs, or a dict, of params (see
+                     format_param for the supported values).
+        first_index: (int) First index of array valued params.
+
+    Returns:
+
+        data: (str) AMPL data section.
+
+    """
+    if isinstance(params, dict):
+        params = sorted(params.items())
+    return 'data;\n\n' + ''.join(format_param(name, value, first_index)
+                                 for name, value in params)
+
+
+def write_data(filename, params, first_index=1):
+    """Write the data section for params (see data_section) to filename."""
+    with open(filename, 'w') as f:
+        f.write(data_section(params, first_index))
@@ -0,0 +1,193 @@
+from __future__ import division
+import sys
+import time
+
+import numpy as np
+
+import fpsb
+
+
+def piecewise_cdf_scalar(v, breaks, coefs):
+    """
+    CDF of a piecewise polynomial distribution at a single valuation,
+    evaluated piece by piece as in genpiecewiseCDFs_onecross.m. Reference
+    implementation for PiecewiseDistribution.cdf.
+
+    """
+    nparts = len(coefs)
+    for k in range(nparts):
+        if v < breaks[k + 1] or k == nparts - 1:
+            break
+    cdf = 0.0
+    for coef in coefs[k]:
+        cdf = cdf * (v - breaks[k]) + coef
+    return cdf
+
+
+def _chebyshev_scalar(a, z):
+    """Value at z of the Chebyshev series with coefficients a."""
+    t0, t1 = 1.0, z
+    value = a[0] + (a[1] * z if len(a) > 1 else 0.0)
+    for k in range(2, len(a)):
+        t0, t1 = t1, 2 * z * t1 - t0
+        value += a[k] * t1
+    return value
+
+
+def expected_payoff_scalar(auction, x, j, v, tol=1e-12):
+    """
+    Expected payoff of bidder j with valuation v, one valuation at a time:
+    the bid is found by bisection on the inverse bid function and each
+    rival's CDF is evaluated separately. Reference implementation for
+    expected_payoffs.
+
+    """
+    a, bhigh = auction.unpack(x)
+    vlow = auction.vlow
+    lo, hi = vlow, bhigh
+    while hi - lo > tol:
+        mid = (lo + hi) / 2
+        if _chebyshev_scalar(a[:, j], 2 * (mid - vlow) / (bhigh - vlow) - 1) < v:
+            lo = mid
+        else:
+            hi = mid
+    b = (lo + hi) / 2
+
+    z = 2 * (b - vlow) / (bhigh - vlow) - 1
+    prob = 1.0
+    for l, dist in enumerate(auction.distributions):
+        if l != j:
+            rival = _chebyshev_scalar(a[:, l], z)
+            if isinstance(dist, fpsb.PiecewiseDistribution):
+                F = piecewise_cdf_scalar(rival, dist.breaks, dist.coefs)
+            else:
+                F = float(dist.cdf(rival))
+            prob *= min(max(F, 0.0), 1.0)
+    return (v - b) * prob
+
+
+def bid_functions(auction, x, v, ngrid=10000):
+    """
+    Bids of every bidder at the valuations v, obtained by inverting the
+    inverse bid functions on a grid of ngrid bids (interp1 in
+    calcexppayoff.m).
+
+    Returns:
+
+        bids: (array) Bids with shape (p,) + v.shape.
+
+    """
+    _, bhigh = auction.unpack(x)
+    grid = np.linspace(auction.vlow, bhigh, ngrid)
+    phi = auction.inverse_bids(x, grid)
+    v = np.asarray(v, dtype=float)
+    return np.array([np.interp(v, phi[:, j], grid) for j in range(auction.p)])
+
+
+def win_probabilities(auction, x, bids, j):
+    """
+    Probability that bidder j wins with the bids (any shape), given that the
+    rivals follow the equilibrium: the product over rivals l of
+    F_l(phi_l(b)), with bids above bhigh winning for sure.
+
+    """
+    _, bhigh = auction.unpack(x)
+    bids = np.asarray(bids, dtype=float)
+    phi = auction.inverse_bids(x, np.minimum(bids, bhigh))
+    prob = np.ones(bids.shape)
+    for l, dist in enumerate(auction.distributions):
+        if l != j:
+            prob *= np.clip(dist.cdf(phi[..., l]), 0.0, 1.0)
+    return prob
+
+
+def interim_payoffs(auction, x, bids, v, j):
+    """
+    Expected payoff of bidder j with valuations v placing bids (arrays that
+    broadcast together), e.g., a grid of deviations for a grid of types.
+
+    """
+    bids, v = np.broadcast_arrays(np.asarray(bids, dtype=float), np.asarray(v, dtype=float))
+    return (v - bids) * win_probabilities(auction, x, bids, j)
+
+
+def expected_payoffs(auction, x, v, ngrid=10000):
+    """
+    Equilibrium expected payoffs of every bidder at the valuations v (the
+    Epayoff of calcexppayoff.m, for any number of bidders).
+
+    Returns:
+
+        payoffs: (array) Expected payoffs with shape (p,) + v.shape.
+
+    """
+    v = np.asarray(v, dtype=float)
+    bids = bid_functions(auction, x, v, ngrid)
+    return np.array([interim_payoffs(auction, x, bids[j], v, j) for j in range(auction.p)])
+
+
+def simulate_auctions(auction, x, n_auctions, seed=None, ngrid=10000):
+    """
+    Monte Carlo simulation of n_auctions auctions in which every bidder
+    draws a valuation from its distribution and bids according to the
+    equilibrium. Average realized payoffs estimate the ex ante expected
+    payoffs, for validating the equilibrium.
+
+    Returns:
+
+        valuations: (array) Valuations with shape (p, n_auctions).
+        bids:       (array) Bids with shape (p, n_auctions).
+        payoffs:    (array) Realized payoffs with shape (p, n_auctions).
+
+    """
+    prng = np.random.RandomState(seed)
+    quantiles = prng.uniform(size=(auction.p, n_auctions))
+    valuations = np.array([dist.ppf(q) for dist, q in zip(auction.distributions, quantiles)])
+    bids = np.array([bid_functions(auction, x, valuations[j], ngrid)[j]
+                     for j in range(auction.p)])
+
+    winners = np.argmax(bids, axis=0)
+    payoffs = np.zeros(bids.shape)
+    columns = np.arange(n_auctions)
+    payoffs[winners, columns] = valuations[winners, columns] - bids[winners, columns]
+    return valuations, bids, payoffs
+
+
+def benchmark(auction, x, n_points=1000, repeat=3):
+    """
+    Wall clock time (best of repeat) to evaluate the expected payoffs of all
+    bidders at n_points valuations with expected_payoff_scalar and with
+    expected_payoffs.
+
+    Returns:
+
+        timings: (list) (label, seconds) pairs.
+        error:   (float) Largest difference between the two paths.
+
+    """
+    v = np.linspace(auction.vlow, auction.vhigh, n_points)
+    timings = []
+    for label, evaluate in [('scalar', lambda: np.array([[expected_payoff_scalar(auction, x, j, vi)
+                                                           for vi in v]
+                                                          for j in range(auction.p)])),
+                            ('vectorized', lambda: expected_payoffs(auction, x, v))]:
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.time()
+            payoffs = evaluate()
+            best = min(best, time.time() - start)
+        timings.append((label, best))
+        if label == 'scalar':
+            reference = payoffs
+
+    return timings, np.max(np.abs(payoffs - reference))
+
+
+if __name__ == '__main__':
+
+    auction = fpsb.FirstPriceAuction([fpsb.UniformDistribution(), fpsb.onecross_distribution()])
+    a, bhigh, result = auction.solve()
+    timings, error = benchmark(auction, result.x)
+    for label, seconds in timings:
+        sys.stdout.write('%-12s %8.3f s\n' % (label, seconds))
+    sys.stdout.write('max difference %.2e\n' % error)
@@ -0,0 +1,150 @@
+from __future__ import division
+import multiprocessing
+
+import numpy as np
+from scipy import optimize, sparse
+
+from sparse_param import SparseParam
+
+
+# constraint matrix shared by the worker processes of solve_lp_batch
+_worker_A = None
+
+
+def lp_arrays(data):
+    """
+    Arrays of the LP of abstract.py, i.e.
+
+        min c'x subject to Ax >= b, x >= 0
+
+    from its data in the form returned by dat_loader.load_dat (preferably
+    with sparse=True, so that the coefficients are never held in dicts). The
+    indices of the .dat file start at 1.
+
+    Arguments:
+
+        data: (dict) Data for abstract.py, {None: {name: {index: value}}}.
+
+    Returns:
+
+        A: (object) Constraint matrix as a scipy.sparse.csr_matrix.
+        b: (array) Right hand side of the constraints.
+        c: (array) Objective coefficients.
+
+    """
+    data = data[None]
+    m, n = data['m'][None], data['n'][None]
+
+    a, b, c = [data[name] if isinstance(data[name], SparseParam) else
+               SparseParam.from_dict(data[name]) for name in ('a', 'b', 'c')]
+
+    return a.tocsr((m, n)), b.toarray(m), c.toarray(n)
+
+
+def _solve(neg_A, b, c):
+    """Solve min c'x s.t. -A x <= -b, x >= 0 with HiGHS."""
+    res = optimize.linprog(c, A_ub=neg_A, b_ub=-b, bounds=(0, None), method='highs')
+    if res.status == 0:
+        # marginals are sensitivities of the objective to -b
+        duals = -res.ineqlin.marginals
+        return res.x, res.fun, duals, res.status
+    return None, np.nan, None, res.status
+
+
+def solve_lp(A, b, c):
+    """
+    Solve the LP min c'x subject to Ax >= b, x >= 0 with the HiGHS solvers
+    in SciPy, passing A as a sparse matrix.
+
+    Arguments:
+
+        A: (object) Constraint matrix (dense array or scipy sparse matrix).
+        b: (array) Right hand side of the constraints.
+        c: (array) Objective coefficients.
+
+    Returns:
+
+        x:     (array) Optimal solution.
+        obj:   (float) Optimal value of the objective.
+        duals: (array) Nonnegative multipliers on the constraints Ax >= b.
+
+    """
+    neg_A = -sparse.csc_matrix(A)
+    x, obj, duals, status = _solve(neg_A, np.asarray(b, dtype=float),
+                                   np.asarray(c, dtype=float))
+    if status != 0:
+        raise RuntimeError("LP failed with HiGHS status %i." % status)
+    return x, obj, duals
+
+
+def _init_worker(neg_A):
+    global _worker_A
+    _worker_A = neg_A
+
+
+def _solve_variant(args):
+    return _solve(_worker_A, *args)
+
+
+def solve_lp_batch(A, B, C, processes=1):
+    """
+    Solve many variants of the LP min c'x subject to Ax >= b, x >= 0 that
+    share the constraint matrix A but differ in b and/or c. A is converted
+    (and negated) once, and with processes > 1 it is sent once to each
+    worker of a process pool rather than once per variant.
+
+    The HiGHS interface in SciPy does not accept an initial basis, so every
+    variant is solved from scratch; batching saves the set up of A and,
+    with a pool, runs the variants in parallel.
+
+    Arguments:
+
+        A:         (object) Constraint matrix with shape (m, n), dense or
+                   scipy sparse.
+        B:         (array) Right hand sides, shape (k, m), or (m,) if only c
+                   varies.
+        C:         (array) Objective coefficients, shape (k, n), or (n,) if
+                   only b varies.
+        processes: (int) Number of worker processes. Default is 1, i.e.,
+                   solve the variants in this process.
+
+    Returns:
+
+        X:      (array) Solutions with shape (k, n) (nan if not solved).
+        obj:    (array) Optimal objective values with shape (k,).
+        duals:  (array) Multipliers on Ax >= b with shape (k, m).
+        status: (array) HiGHS status of each variant (0 is optimal, 2
+                infeasible, 3 unbounded).
+
+    """
+    neg_A = -sparse.csc_matrix(A)
+    m, n = neg_A.shape
+
+    B = np.atleast_2d(np.asarray(B, dtype=float))
+    C = np.atleast_2d(np.asarray(C, dtype=float))
+    k = max(B.shape[0], C.shape[0])
+    B = np.broadcast_to(B, (k, m))
+    C = np.broadcast_to(C, (k, n))
+    variants = list(zip(B, C))
+
+    if processes > 1:
+        pool = multiprocessing.Pool(processes, _init_worker, (neg_A,))
+        try:
+            chunksize = max(1, k // (4 * processes))
+            results = pool.map(_solve_variant, variants, chunksize)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        results = [_solve(neg_A, b, c) for b, c in variants]
+
+    X = np.full((k, n), np.nan)
+    obj = np.full(k, np.nan)
+    duals = np.full((k, m), np.nan)
+    status = np.empty(k, dtype=int)
+    for v, (x, fun, y, s) in enumerate(results):
+        status[v] = s
+        if s == 0:
+            X[v], obj[v], duals[v] = x, fun, y
+
+    return X, obj, duals, status
@@ -0,0 +1,342 @@
+from __future__ import division
+import hashlib
+import os
+import re
+import tempfile
+import warnings
+
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+import numpy as np
+
+from sparse_param import SparseParam
+
+
+class UnsupportedDataError(ValueError):
+    """Raised when a .dat file uses constructs the fast loader does not handle."""
+    pass
+
+
+_comment = re.compile(r'#[^\n]*')
+_special_characters = '"\'[]{}()'
+_integer = re.compile(r'^[+-]?\d+$')
+
+# content hashes of files already seen by this process, keyed by path
+_digests = {}
+
+# part of every cache key: bump whenever load_dat (or the form of the data
+# it returns) changes so that entries written by older versions are ignored
+CACHE_VERSION = '2'
+
+
+def _convert(token):
+    """Convert a single token to an int or a float, else leave it a string."""
+    if _integer.match(token):
+        return int(token)
+    try:
+        return float(token)
+    except ValueError:
+        return token
+
+
+def _index_column(column):
+    """Use integer indices whenever a column of a numeric table is integral."""
+    if np.all(column == np.floor(column)):
+        return column.astype(int).tolist()
+    return column.tolist()
+
+
+def _numeric_table(body, nrows, ncols):
+    """
+    Read a table of numbers straight into an array. Returns None if the
+    body holds anything other than nrows * ncols numbers.
+
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        try:
+            values = np.fromstring(body, dtype=float, sep=' ')
+        except ValueError:
+            return None
+    if values.size != nrows * ncols:
+        return None
+    return values.reshape(nrows, ncols)
+
+
+def _parse_param(name, body, sparse=False):
+    """
+    Parse the data of a scalar or an indexed (one row per line) param. With
+    sparse=True numeric tables with integer indices become SparseParams.
+
+    """
+    body = body.strip()
+
+    if not body:
+        raise UnsupportedDataError("param %s has no data" % name)
+
+    # indexed param: every line is one row holding the index and the value
+    first_row = body.split('\n', 1)[0].split()
+    ncols = len(first_row)
+    nrows = body.count('\n') + 1
+
+    # scalar param
+    if nrows == 1 and ncols == 1:
+        return {None: _convert(first_row[0])}
+
+    if nrows == 1 and ncols > 2:
+        raise UnsupportedDataError("param %s has an ambiguous single row" % name)
+
+    table = _numeric_table(body, nrows, ncols)
+    if sparse and table is not None and ncols > 1:
+        index = table[:, :-1]
+        if np.all(index == np.floor(index)):
+            return SparseParam(index.astype(np.int64), table[:, -1])
+
+    if table is not None and ncols > 1:
+        columns = [_index_column(table[:, j]) for j in range(ncols - 1)]
+        columns.append(table[:, -1].tolist())
+    else:
+        # symbolic indices, blank lines, etc. are handled token by token
+        lines = [line.split() for line in body.split('\n')]
+        lines = [line for line in lines if line]
+        if ncols < 2 or any(len(line) != ncols for line in lines):
+            raise UnsupportedDataError("param %s is not a simple table" % name)
+        columns = [[_convert(line[j]) for line in lines] for j in range(ncols)]
+
+    if ncols == 2:
+        keys = columns[0]
+    else:
+        keys = zip(*columns[:-1])
+    return dict(zip(keys, columns[-1]))
+
+
+def _key_dimension(key):
+    """Number of indices in a key of param data (zero for a scalar)."""
+    if key is None:
+        return 0
+    if isinstance(key, tuple):
+        return len(key)
+    return 1
+
+
+def check_dimensions(model, data):
+    """
+    Check that every param in data has as many indices as the param of the
+    same name in model. A table is read by load_dat as one index and value
+    per row, so rows holding several index and value pairs (valid AMPL free
+    format) come out with too many indices; they are caught here and raise
+    UnsupportedDataError.
+
+    """
+    for name, values in data[None].items():
+        component = getattr(model, name, None)
+        if not hasattr(component, 'dim'):
+            continue
+        if isinstance(values, dict) and isinstance(values.get(None), list):
+            # members of a set
+            continue
+        if isinstance(values, SparseParam):
+            dims = set([values.dim])
+        else:
+            dims = set(_key_dimension(key) for key in values)
+        if dims - set([component.dim()]):
+            raise UnsupportedDataError("param %s has %s indices in the data but %i in the model"
+                                       % (name, '/'.join(map(str, sorted(dims))), component.dim()))
+
+
+def _parse_set(name, body):
+    """Parse the members of a simple one dimensional set."""
+    return [_convert(token) for token in body.split()]
+
+
+def load_dat(filename, sparse=False):
+    """
+    Fast loader for the subset of the AMPL data command syntax used by the
+    lifecycle .dat files, bypassing the PLY LALR parser. Supported
+    statements are
+
+        param X := value ;
+        param X := i v ;
+        param X :=
+        i j v
+        ... ;                   (one row of index and value per line)
+        set S := a b c ;
+
+    plus comments and the optional data ; and end ; statements. Anything else
+    raises UnsupportedDataError so that callers can fall back to the full
+    grammar (see create_instance).
+
+    Arguments:
+
+        filename: (str) Path to the .dat file.
+        sparse:   (boolean) Should numeric tables with integer indices be
+                  stored as SparseParams (contiguous COO arrays) rather
+                  than dicts? Use for large params such as the constraint
+                  matrix a{I,J} of abstract.py. Default is False.
+
+    Returns:
+
+        data: (dict) Data in the form expected by model.create, i.e.
+              {None: {name: {index: value}}} for params and
+              {None: {name: {None: members}}} for sets.
+
+    """
+    with open(filename, 'rb') as f:
+        raw = f.read()
+    try:
+        text = _comment.sub('', raw.decode('utf-8'))
+    except UnicodeDecodeError:
+        raise UnsupportedDataError("%s is not UTF-8 encoded" % filename)
+
+    if any(character in text for character in _special_characters):
+        raise UnsupportedDataError("%s uses unsupported data commands" % filename)
+
+    statements = text.split(';')
+    if statements[-1].strip():
+        raise UnsupportedDataError("%s has an unterminated statement" % filename)
+
+    data = {}
+    for statement in statements[:-1]:
+        statement = statement.strip()
+        if not statement or statement in ('data', 'end'):
+            continue
+
+        head, sep, body = statement.partition(':=')
+        head = head.split()
+        if not sep or len(head) != 2 or ':' in body:
+            raise UnsupportedDataError("unsupported statement %r" % statement[:40])
+
+        kind, name = head
+        if kind == 'param':
+            data[name] = _parse_param(name, body, sparse)
+        elif kind == 'set':
+            data[name] = {None: _parse_set(name, body)}
+        else:
+            raise UnsupportedDataError("unsupported statement %r" % statement[:40])
+
+    return {None: data}
+
+
+def file_digest(filename):
+    """
+    SHA-1 hash of the contents of filename. The hash is remembered together
+    with the modification time and size of the file so that unchanged files
+    are only hashed once per process.
+
+    """
+    path = os.path.abspath(filename)
+    stat = os.stat(path)
+    stamp = (stat.st_mtime, stat.st_size)
+
+    cached = _digests.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    sha = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            sha.update(block)
+    digest = sha.hexdigest()
+
+    _digests[path] = (stamp, digest)
+    return digest
+
+
+def cached_load_dat(filename, cache_dir=None, sparse=False):
+    """
+    Same as load_dat but the parsed data are pickled into cache_dir, keyed by
+    the hash of the file contents, so that loading an unchanged file again
+    (from this or any other process) skips parsing entirely. Editing the file
+    changes its hash and so invalidates the cache, and so does a new
+    CACHE_VERSION of the loader.
+
+    Only data read by the fast loader are cached: files that raise
+    UnsupportedDataError are parsed by the grammar inside model.create,
+    which does not hand the parsed data back.
+
+    Cache files are written to a temporary file and then renamed into place,
+    so concurrent workers never read a partially written entry.
+
+    Arguments:
+
+        filename:  (str) Path to the .dat file.
+        cache_dir: (str) Directory holding the cache. Default is a
+                   __datcache__ directory next to the .dat file.
+        sparse:    (boolean) Passed on to load_dat.
+
+    Returns:
+
+        data: (dict) Data in the form returned by load_dat.
+
+    """
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.dirname(os.path.abspath(filename)), '__datcache__')
+
+    suffix = '-sparse.pickle' if sparse else '.pickle'
+    cache_file = os.path.join(cache_dir, '%s-v%s%s' % (file_digest(filename), CACHE_VERSION, suffix))
+
+    try:
+        with open(cache_file, 'rb') as f:
+            return pickle.load(f)
+    except (IOError, OSError, EOFError, pickle.UnpicklingError):
+        pass
+
+    data = load_dat(filename, sparse)
+
+    try:
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+    except OSError:
+        # another process may have created it in the meantime
+        if not os.path.isdir(cache_dir):
+            raise
+
+    fd, tmp_file = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(data, f, pickle.HIGHEST_PROTOCOL)
+        getattr(os, 'replace', os.rename)(tmp_file, cache_file)
+    except Exception:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        raise
+
+    return data
+
+
+def create_instance(model, filename, cache=True, cache_dir=None):
+    """
+    Create an instance of an abstract model from a .dat file. The fast
+    loader is tried first and the full PLY grammar is used only when the
+    file contains unsupported constructs or when the indices it reads do
+    not match the dimensions of the params of the model.
+
+    The data are always read as dicts (load_dat with sparse=False), since
+    that is what Pyomo params are initialized from: SparseParams only pay
+    off when the arrays are used directly, as in batch_lp.lp_arrays.
+
+    Arguments:
+
+        model:     (object) An instance of the AbstractModel class.
+        filename:  (str) Path to the .dat file.
+        cache:     (boolean) Should parsed data be cached on disk? Default
+                   is True.
+        cache_dir: (str) Directory holding the cache (see cached_load_dat).
+
+    Returns:
+
+        instance: (object) Concrete instance of the model.
+
+    """
+    try:
+        if cache:
+            data = cached_load_dat(filename, cache_dir)
+        else:
+            data = load_dat(filename)
+        check_dimensions(model, data)
+    except UnsupportedDataError:
+        return model.create(filename=filename)
+    return model.create(data)
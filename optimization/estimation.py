@@ -0,0 +1,240 @@
+from __future__ import division
+import multiprocessing
+
+import numpy as np
+from scipy import optimize
+
+import instance_data
+import sensitivity
+from startup import opt
+
+
+# parameters shared by the worker processes of an NFXP estimator
+_worker_params = None
+
+
+def mpec_data(c_obs, l_obs, r, minimum_assets, R, w=None):
+    """
+    Data for an instance of lifecycle_mpec.model.
+
+    Arguments:
+
+        c_obs:          (array) Observed consumption in periods 0, ..., T.
+        l_obs:          (array) Observed labor supply in periods 0, ..., T.
+        r:              (float) Net interest rate.
+        minimum_assets: (float) Lower bound on assets.
+        R:              (int) Retirement age.
+        w:              (array) Path of real wages. Default is the
+                        wage_schedule of the model.
+
+    Returns:
+
+        data: (dict) Data in the form expected by model.create.
+
+    """
+    c_obs = np.asarray(c_obs, dtype=float)
+    data = instance_data.lifecycle_data(w, T=c_obs.size - 1, R=R, r=r,
+                                        minimum_assets=minimum_assets)
+    data[None]['c_obs'] = instance_data.indexed_param(c_obs)
+    data[None]['l_obs'] = instance_data.indexed_param(l_obs)
+    return data
+
+
+def estimate_mpec(model, c_obs, l_obs, r, minimum_assets, R, w=None,
+                  solver='ipopt', **kwargs):
+    """
+    Estimate beta, theta and eta of lifecycle_with_labor by mathematical
+    programming with equilibrium constraints (Su and Judd, 2012): the
+    agent's first order conditions enter as constraints of a single sparse
+    NLP whose objective is the distance to the data, so the model is never
+    solved for a given parameter vector.
+
+    Arguments:
+
+        model:  (object) lifecycle_mpec.model.
+        c_obs, l_obs, r, minimum_assets, R, w: see mpec_data.
+        solver: (str) Name of the NLP solver.
+        kwargs: Passed on to the solve method of the solver.
+
+    Returns:
+
+        estimates: (dict) Estimates of beta, theta and eta.
+        instance:  (object) The solved instance (fitted consumption, labor
+                   supply and assets, and the borrowing multipliers).
+        results:   (object) Results returned by the solver.
+
+    """
+    instance = model.create(mpec_data(c_obs, l_obs, r, minimum_assets, R, w))
+    results = opt.SolverFactory(solver).solve(instance, **kwargs)
+    instance.load(results)
+
+    estimates = dict((name, getattr(instance, name).value)
+                     for name in ('beta', 'theta', 'eta'))
+    return estimates, instance, results
+
+
+class SolutionCache(object):
+    """
+    Memoized inner solves keyed by the parameter vector. Besides exact hits,
+    the cache returns the solution for the nearest cached parameter vector,
+    which is used to warm start the inner solver.
+
+    """
+
+    def __init__(self, decimals=12):
+        self.decimals = decimals
+        self.points = []
+        self.solutions = {}
+
+    def _key(self, x):
+        return tuple(np.round(np.asarray(x, dtype=float), self.decimals))
+
+    def __len__(self):
+        return len(self.solutions)
+
+    def get(self, x):
+        """Cached solution for x, or None."""
+        return self.solutions.get(self._key(x))
+
+    def nearest(self, x):
+        """Cached solution for the parameter vector closest to x, or None."""
+        if not self.points:
+            return None
+        distances = np.sum((np.array(self.points) - x)**2, axis=1)
+        return self.solutions[self._key(self.points[np.argmin(distances)])]
+
+    def add(self, x, solution):
+        key = self._key(x)
+        if key not in self.solutions:
+            self.points.append(np.array(key))
+        self.solutions[key] = solution
+
+
+def _structural_params(params, x):
+    """Parameters of the lifecycle model with (beta, theta, eta) set to x."""
+    return dict(params, beta=x[0], theta=x[1], eta=x[2])
+
+
+def _init_worker(params):
+    global _worker_params
+    _worker_params = params
+
+
+def _solve_task(task):
+    x, start = task
+    z, active = start if start is not None else (None, None)
+    return sensitivity.solve_kkt(_structural_params(_worker_params, x), z, active)
+
+
+class NFXPEstimator(object):
+    """
+    Nested fixed point estimator of beta, theta and eta of
+    lifecycle_with_labor, for comparison with estimate_mpec. Each evaluation
+    of the objective solves the model for the trial parameters (the inner
+    solve, see sensitivity.solve_kkt). Inner solves are memoized by
+    parameter vector and warm started from the nearest cached solution,
+    and the 2k inner solves of a central difference gradient are run as
+    one parallel wave across a process pool.
+
+    Arguments:
+
+        c_obs, l_obs, r, minimum_assets, R, w: see mpec_data.
+        processes: (int) Number of worker processes for gradients.
+        step:      (float) Step size of the finite differences.
+
+    """
+
+    def __init__(self, c_obs, l_obs, r, minimum_assets, R, w=None, processes=1,
+                 step=1e-5):
+        self.c_obs = np.asarray(c_obs, dtype=float)
+        self.l_obs = np.asarray(l_obs, dtype=float)
+        periods = np.arange(self.c_obs.size)
+        if w is None:
+            w = np.where(periods < R, periods / R, 0.0)
+
+        self.params = {'r': r, 'minimum_assets': minimum_assets,
+                       'w': np.asarray(w, dtype=float)}
+        self.step = step
+        self.cache = SolutionCache()
+        self.inner_solves = 0
+
+        self.pool = None
+        if processes > 1:
+            self.pool = multiprocessing.Pool(processes, _init_worker, (self.params,))
+
+    def close(self):
+        """Shut down the process pool."""
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+
+    def solve_many(self, points):
+        """
+        Solve the model for every parameter vector in points that is not
+        cached yet, each warm started from the nearest cached solution.
+
+        """
+        points = [np.asarray(x, dtype=float) for x in points]
+        todo = [x for x in points if self.cache.get(x) is None]
+        tasks = [(x, self.cache.nearest(x)) for x in todo]
+
+        if self.pool is not None and len(tasks) > 1:
+            solutions = self.pool.map(_solve_task, tasks)
+        else:
+            _init_worker(self.params)
+            solutions = [_solve_task(task) for task in tasks]
+
+        self.inner_solves += len(tasks)
+        for x, solution in zip(todo, solutions):
+            self.cache.add(x, solution)
+
+        return [self.cache.get(x) for x in points]
+
+    def objective(self, x):
+        """Squared distance between the model's choices and the data."""
+        z, active = self.solve_many([x])[0]
+        c, l, A, _, _ = sensitivity.split_solution(z, self.c_obs.size)
+        return np.sum((c - self.c_obs)**2) + np.sum((l - self.l_obs)**2)
+
+    def gradient(self, x):
+        """Central difference gradient of objective (one wave of solves)."""
+        x = np.asarray(x, dtype=float)
+        steps = self.step * np.eye(x.size)
+        self.solve_many([x] + [x + h for h in steps] + [x - h for h in steps])
+        return np.array([(self.objective(x + h) - self.objective(x - h)) / (2 * self.step)
+                         for h in steps])
+
+    def estimate(self, x0=(0.95, 2.0, 2.0), bounds=((0.8, 0.999), (0.5, 10.0), (0.5, 10.0)),
+                 **kwargs):
+        """
+        Minimize the objective over (beta, theta, eta) with L-BFGS-B.
+
+        Returns:
+
+            estimates: (dict) Estimates of beta, theta and eta.
+            result:    (object) The OptimizeResult of scipy.optimize.minimize.
+
+        """
+        result = optimize.minimize(self.objective, x0, jac=self.gradient, bounds=bounds,
+                                   method='L-BFGS-B', **kwargs)
+        estimates = dict(zip(('beta', 'theta', 'eta'), result.x))
+        return estimates, result
+
+
+def estimate_nfxp(c_obs, l_obs, r, minimum_assets, R, w=None, processes=1, **kwargs):
+    """
+    Estimate beta, theta and eta of lifecycle_with_labor by nested fixed
+    point (see NFXPEstimator).
+
+    Returns:
+
+        estimates: (dict) Estimates of beta, theta and eta.
+        result:    (object) The OptimizeResult of scipy.optimize.minimize.
+
+    """
+    estimator = NFXPEstimator(c_obs, l_obs, r, minimum_assets, R, w, processes)
+    try:
+        return estimator.estimate(**kwargs)
+    finally:
+        estimator.close()
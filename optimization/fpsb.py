@@ -0,0 +1,425 @@
+from __future__ import division
+import os
+
+import numpy as np
+from scipy import interpolate, optimize
+
+import ampl_params
+
+
+# AMPL model of Hubbard, Kirkegaard and Paarsch (uniform vs. piecewise bidder)
+AMPL_MODEL = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir,
+                          'solving-auctions', 'hkpcode', 'fpsb_piecewise.md')
+
+
+class UniformDistribution(object):
+    """Uniform distribution of valuations on [vlow, vhigh]."""
+
+    def __init__(self, vlow=0.0, vhigh=1.0):
+        self.vlow = vlow
+        self.vhigh = vhigh
+
+    def cdf(self, v):
+        return (np.asarray(v) - self.vlow) / (self.vhigh - self.vlow)
+
+    def pdf(self, v):
+        return np.full(np.shape(v), 1 / (self.vhigh - self.vlow))
+
+    def pdf_derivative(self, v):
+        return np.zeros(np.shape(v))
+
+    def ppf(self, q):
+        return self.vlow + np.asarray(q) * (self.vhigh - self.vlow)
+
+
+class PiecewiseDistribution(object):
+    """
+    Distribution of valuations whose CDF is a piecewise polynomial in the
+    form returned by MATLAB's unmkpp: on [breaks[k], breaks[k+1]]
+
+        F(v) = sum_h coefs[k, h] * (v - breaks[k])**(n - 1 - h)
+
+    All methods evaluate whole arrays of valuations at once; the piece that
+    applies to each valuation is found with searchsorted.
+
+    """
+
+    def __init__(self, breaks, coefs):
+        self.breaks = np.asarray(breaks, dtype=float)
+        self.coefs = np.asarray(coefs, dtype=float)
+        self.nparts, self.ncoefs = self.coefs.shape
+
+    @classmethod
+    def from_spline(cls, x, y):
+        """Cubic spline CDF through (x, y), as MATLAB's spline (not-a-knot)."""
+        spline = interpolate.CubicSpline(x, y)
+        return cls(spline.x, spline.c.T)
+
+    def _pieces(self, v):
+        """Index of the piece and offset from its left break for each v."""
+        v = np.asarray(v, dtype=float)
+        k = np.clip(np.searchsorted(self.breaks, v, side='right') - 1, 0, self.nparts - 1)
+        return k, v - self.breaks[k]
+
+    def _evaluate(self, v, order):
+        """Horner evaluation of the order-th derivative of the CDF."""
+        k, dv = self._pieces(v)
+        n = self.ncoefs - 1
+        out = np.zeros(dv.shape)
+        for h in range(self.ncoefs - order):
+            power = n - h
+            factor = np.prod(np.arange(power - order + 1, power + 1)) if order else 1
+            out = out * dv + factor * self.coefs[k, h]
+        return out
+
+    def cdf(self, v):
+        return self._evaluate(v, 0)
+
+    def pdf(self, v):
+        return self._evaluate(v, 1)
+
+    def pdf_derivative(self, v):
+        return self._evaluate(v, 2)
+
+    def ppf(self, q, tol=1e-12):
+        """Inverse of the (monotone) CDF, by bisection on all of q at once."""
+        q = np.asarray(q, dtype=float)
+        lo = np.full(q.shape, self.breaks[0])
+        hi = np.full(q.shape, self.breaks[-1])
+        while np.max(hi - lo, initial=0.0) > tol:
+            mid = (lo + hi) / 2
+            below = self.cdf(mid) < q
+            lo = np.where(below, mid, lo)
+            hi = np.where(below, hi, mid)
+        return (lo + hi) / 2
+
+
+def onecross_distribution():
+    """Piecewise CDF that crosses the uniform CDF once (genpiecewiseCDFs_onecross.m)."""
+    x = [0, 1 / 6, 1 / 3, 1 / 2, 2 / 3, 5 / 6, 1]
+    y = [0, 1 / 9, 1 / 4, 1 / 2, 9 / 12, 16 / 18, 1]
+    return PiecewiseDistribution.from_spline(x, y)
+
+
+def twocross_distribution():
+    """Piecewise CDF that crosses the uniform CDF twice (genpiecewiseCDFs_twocross.m)."""
+    x = [0, 1 / 6, 1 / 3, 1 / 2, 2 / 3, 5 / 6, 1]
+    y = [0, 1 / 9, 1 / 3, 5 / 9, 2 / 3, 7 / 9, 1]
+    return PiecewiseDistribution.from_spline(x, y)
+
+
+def chebyshev_matrices(z, d):
+    """
+    Chebyshev polynomials T_0, ..., T_d and their derivatives at the points
+    z in [-1, 1], built by the recursions of evalchebypoly.m.
+
+    Returns:
+
+        T:  (array) T[i, k] = T_k(z[i]).
+        dT: (array) dT[i, k] = T_k'(z[i]).
+
+    """
+    z = np.asarray(z, dtype=float)
+    T = np.empty(z.shape + (d + 1,))
+    dT = np.empty(z.shape + (d + 1,))
+    T[..., 0], dT[..., 0] = 1.0, 0.0
+    if d > 0:
+        T[..., 1], dT[..., 1] = z, 1.0
+    for k in range(2, d + 1):
+        T[..., k] = 2 * z * T[..., k - 1] - T[..., k - 2]
+        dT[..., k] = 2 * T[..., k - 1] + 2 * z * dT[..., k - 1] - dT[..., k - 2]
+    return T, dT
+
+
+class FirstPriceAuction(object):
+    """
+    Asymmetric first-price, sealed-bid auction with independent private
+    values, solved as in Hubbard, Kirkegaard and Paarsch: the inverse bid
+    function of each bidder on [vlow, bhigh] is a Chebyshev polynomial of
+    degree d, and the coefficients and the common highest bid bhigh minimize
+    the sum of squared first order conditions at npts Chebyshev nodes
+    subject to the boundary conditions and shape constraints of
+    fpsb_piecewise.md.
+
+    The unknowns are stacked as x = (a[:, 0], ..., a[:, p - 1], bhigh).
+
+    Arguments:
+
+        distributions: (list) One distribution of valuations per bidder
+                       (objects with cdf, pdf and pdf_derivative methods).
+        vlow, vhigh:   (float) Support of the valuations.
+        d:             (int) Degree of the Chebyshev polynomials.
+        npts:          (int) Number of nodes for the first order conditions.
+        nconpts:       (int) Number of points for the shape constraints.
+
+    """
+
+    def __init__(self, distributions, vlow=0.0, vhigh=1.0, d=3, npts=60, nconpts=100):
+        self.distributions = list(distributions)
+        self.p = len(self.distributions)
+        self.vlow, self.vhigh = vlow, vhigh
+        self.d, self.npts, self.nconpts = d, npts, nconpts
+
+        # Chebyshev nodes and the uniform grid of the AMPL model, on [-1, 1]
+        i = np.arange(1, npts + 1)
+        self.z = -np.cos((2 * i - 1) / (2 * npts) * np.pi)
+        self.zcon = np.arange(nconpts) / nconpts - 1
+
+        # basis matrices do not depend on the unknowns, so build them once
+        self.T, self.dT = chebyshev_matrices(self.z, d)
+        self.Tcon, _ = chebyshev_matrices(self.zcon, d)
+        self.Tlow, self.dTlow = chebyshev_matrices(-1.0, d)
+        self.Thigh, self.dThigh = chebyshev_matrices(1.0, d)
+
+    @property
+    def n_unknowns(self):
+        return (self.d + 1) * self.p + 1
+
+    def unpack(self, x):
+        """Chebyshev coefficients (shape (d + 1, p)) and highest bid."""
+        return x[:-1].reshape(self.p, self.d + 1).T, x[-1]
+
+    def initial_guess(self):
+        """Linear inverse bids from (vlow, vlow) to (bhigh, vhigh), bhigh at the midpoint."""
+        a = np.zeros((self.d + 1, self.p))
+        a[0] = (self.vlow + self.vhigh) / 2
+        a[1] = (self.vhigh - self.vlow) / 2
+        bhigh = (self.vlow + self.vhigh) / 2
+        return np.append(a.T.ravel(), bhigh)
+
+    def bids(self, bhigh, z):
+        """Bids corresponding to points z in [-1, 1]."""
+        return (z + 1) * (bhigh - self.vlow) / 2 + self.vlow
+
+    def inverse_bids(self, x, b):
+        """
+        Inverse bid functions of every bidder at the bids b, evaluated as one
+        matrix product.
+
+        Returns:
+
+            v: (array) Valuations with shape b.shape + (p,).
+
+        """
+        a, bhigh = self.unpack(x)
+        z = 2 * (np.asarray(b, dtype=float) - self.vlow) / (bhigh - self.vlow) - 1
+        T, _ = chebyshev_matrices(z, self.d)
+        return T.dot(a)
+
+    def foc_residuals(self, x):
+        """
+        First order conditions at the nodes and their Jacobian with respect
+        to x. For bidder j at bid b the condition is
+
+            (phi_j(b) - b) * sum_{l != j} [f_l / F_l](phi_l(b)) phi_l'(b) = 1
+
+        Returns:
+
+            resid: (array) Residuals with shape (npts * p,), bidder major.
+            jac:   (array) Jacobian with shape (npts * p, n_unknowns).
+
+        """
+        a, bhigh = self.unpack(x)
+        p, n, d = self.p, self.npts, self.d
+        width = bhigh - self.vlow
+        scale = 2 / width
+
+        b = self.bids(bhigh, self.z)
+        phi = self.T.dot(a)
+        dphi = scale * self.dT.dot(a)
+
+        # hazard ratios f / F of each bidder at its inverse bid, and their slopes
+        ratio = np.empty((n, p))
+        dratio = np.empty((n, p))
+        for l, dist in enumerate(self.distributions):
+            F, f, df = dist.cdf(phi[:, l]), dist.pdf(phi[:, l]), dist.pdf_derivative(phi[:, l])
+            ratio[:, l] = f / F
+            dratio[:, l] = df / F - ratio[:, l]**2
+
+        terms = ratio * dphi
+        S = terms.sum(axis=1, keepdims=True) - terms
+        margin = phi - b[:, np.newaxis]
+        resid = -1 + margin * S
+
+        jac = np.zeros((n, p, self.n_unknowns))
+        for j in range(p):
+            for m in range(p):
+                cols = slice(m * (d + 1), (m + 1) * (d + 1))
+                if m == j:
+                    jac[:, j, cols] = S[:, j, np.newaxis] * self.T
+                else:
+                    dterm = (dratio[:, m] * dphi[:, m])[:, np.newaxis] * self.T + \
+                            ratio[:, m, np.newaxis] * scale * self.dT
+                    jac[:, j, cols] = margin[:, j, np.newaxis] * dterm
+            jac[:, j, -1] = -(self.z + 1) / 2 * S[:, j] - margin[:, j] * S[:, j] / width
+
+        return resid.T.ravel(), jac.transpose(1, 0, 2).reshape(p * n, -1)
+
+    def objective(self, x):
+        """Mean squared first order condition (the objective of fpsb_piecewise.md)."""
+        resid, jac = self.foc_residuals(x)
+        m = resid.size
+        return resid.dot(resid) / m, 2 * jac.T.dot(resid) / m
+
+    def _equality_constraints(self, x):
+        """LowCond, HighCond, Cond2a and Cond2b of fpsb_piecewise.md, with Jacobian."""
+        a, bhigh = self.unpack(x)
+        p, d = self.p, self.d
+        width = bhigh - self.vlow
+        scale = 2 / width
+
+        pdfhigh = np.array([dist.pdf(self.vhigh) for dist in self.distributions])
+        dhigh = scale * self.dThigh.dot(a)
+        dlow = scale * self.dTlow.dot(a)
+
+        values = np.concatenate((self.Tlow.dot(a) - self.vlow,
+                                 self.Thigh.dot(a) - self.vhigh,
+                                 pdfhigh.dot(dhigh) - pdfhigh * dhigh - 1 / (self.vhigh - bhigh),
+                                 dlow - p / (p - 1)))
+
+        jac = np.zeros((4 * p, self.n_unknowns))
+        for j in range(p):
+            cols = slice(j * (d + 1), (j + 1) * (d + 1))
+            jac[j, cols] = self.Tlow
+            jac[p + j, cols] = self.Thigh
+            for l in range(p):
+                if l != j:
+                    jac[2 * p + j, slice(l * (d + 1), (l + 1) * (d + 1))] = pdfhigh[l] * scale * self.dThigh
+            jac[3 * p + j, cols] = scale * self.dTlow
+            jac[2 * p + j, -1] = (-(pdfhigh.dot(dhigh) - pdfhigh[j] * dhigh[j]) / width -
+                                  1 / (self.vhigh - bhigh)**2)
+            jac[3 * p + j, -1] = -dlow[j] / width
+
+        return values, jac
+
+    def _inequality_constraints(self, x):
+        """Monotone and Rational constraints of fpsb_piecewise.md (>= 0), with Jacobian."""
+        a, bhigh = self.unpack(x)
+        p, d, m = self.p, self.d, self.nconpts
+
+        # Rational at zcon = -1 duplicates LowCond, and SLSQP rejects the
+        # degenerate pair, so it is dropped
+        phicon = self.Tcon.dot(a)
+        bcon = self.bids(bhigh, self.zcon)
+        values = np.concatenate((np.diff(phicon, axis=0).T.ravel(),
+                                 (phicon - bcon[:, np.newaxis])[1:].T.ravel()))
+
+        dTcon = np.diff(self.Tcon, axis=0)
+        jac = np.zeros((2 * p * (m - 1), self.n_unknowns))
+        for j in range(p):
+            cols = slice(j * (d + 1), (j + 1) * (d + 1))
+            jac[j * (m - 1):(j + 1) * (m - 1), cols] = dTcon
+            rows = slice((p + j) * (m - 1), (p + j + 1) * (m - 1))
+            jac[rows, cols] = self.Tcon[1:]
+            jac[rows, -1] = -(self.zcon[1:] + 1) / 2
+
+        return values, jac
+
+    def solve(self, x0=None, tol=1e-12, max_iter=500):
+        """
+        Solve the constrained least squares problem with SLSQP, using the
+        analytic gradients of the objective and the constraints.
+
+        Arguments:
+
+            x0:       (array) Initial guess, e.g., the solution of a nearby
+                      specification. Default is initial_guess().
+            tol:      (float) Tolerance passed to SLSQP.
+            max_iter: (int) Maximum number of SLSQP iterations.
+
+        Returns:
+
+            a:      (array) Chebyshev coefficients with shape (d + 1, p).
+            bhigh:  (float) Highest bid.
+            result: (object) The OptimizeResult of scipy.optimize.minimize.
+
+        """
+        if x0 is None:
+            x0 = self.initial_guess()
+
+        constraints = [{'type': 'eq',
+                        'fun': lambda x: self._equality_constraints(x)[0],
+                        'jac': lambda x: self._equality_constraints(x)[1]},
+                       {'type': 'ineq',
+                        'fun': lambda x: self._inequality_constraints(x)[0],
+                        'jac': lambda x: self._inequality_constraints(x)[1]}]
+        bounds = [(None, None)] * (self.n_unknowns - 1) + [(self.vlow, self.vhigh)]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result = optimize.minimize(self.objective, x0, jac=True, method='SLSQP',
+                                       bounds=bounds, constraints=constraints,
+                                       options={'ftol': tol, 'maxiter': max_iter})
+        if not result.success:
+            raise RuntimeError("SLSQP failed: %s" % result.message)
+
+        a, bhigh = self.unpack(result.x)
+        return a, bhigh, result
+
+    def ampl_data(self):
+        """
+        AMPL data section for fpsb_piecewise.md (the fpsb.dat written by
+        cheby_asymmetric_dr.m). The model requires bidder 1 to be uniform and
+        bidder 2 to have a piecewise cubic CDF with six pieces.
+
+        """
+        if (self.p != 2 or not isinstance(self.distributions[1], PiecewiseDistribution) or
+                self.distributions[1].coefs.shape != (6, 4)):
+            raise ValueError("fpsb_piecewise.md requires a uniform bidder and a "
+                             "piecewise cubic bidder with six pieces.")
+        piecewise = self.distributions[1]
+        return ampl_params.data_section([('d', self.d), ('p', self.p), ('npts', self.npts),
+                                         ('nconpts', self.nconpts), ('pi', np.pi),
+                                         ('vlow', self.vlow), ('vhigh', self.vhigh),
+                                         ('breaks', piecewise.breaks),
+                                         ('coefs', piecewise.coefs),
+                                         ('nparts', piecewise.nparts)])
+
+
+def solve_auctions(auctions, x0=None):
+    """
+    Solve a sequence of auction specifications (e.g., a sweep over
+    distributions), warm starting each one from the solution of the
+    previous one when they have the same number of unknowns.
+
+    Returns:
+
+        solutions: (list) (a, bhigh) for each auction.
+
+    """
+    solutions = []
+    for auction in auctions:
+        if x0 is not None and x0.size != auction.n_unknowns:
+            x0 = None
+        a, bhigh, result = auction.solve(x0)
+        solutions.append((a, bhigh))
+        x0 = result.x
+    return solutions
+
+
+# AMPL commands of fpsb_piecewise.dr, without the files that are sent separately
+AMPL_COMMANDS = """option snopt_options "outlev=1 feas_tol=1e-6";
+solve;
+display a, bhigh;
+"""
+
+
+def build_xml_string(neos, auction, category='nco', solver='SNOPT', comments=''):
+    """
+    XML job for solving auction with fpsb_piecewise.md on NEOS; submit it
+    with neos.SubmitJob.
+
+    Arguments:
+
+        neos:     (object) A connected instance of pyneos.NeosInterface.
+        auction:  (object) An instance of the FirstPriceAuction class.
+        category: (str) NEOS solver category.
+        solver:   (str) NEOS solver name.
+        comments: (str) Comments sent along with the job.
+
+    Returns:
+
+        xml: (str) Job description.
+
+    """
+    return neos.BuildXmlStringAmpl(category, solver, AMPL_MODEL, auction.ampl_data(),
+                                   AMPL_COMMANDS, comments)
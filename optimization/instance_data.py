@@ -0,0 +1,93 @@
+from __future__ import division
+
+import numpy as np
+
+
+def scalar_param(value):
+    """Data for a scalar param in the form expected by model.create."""
+    return {None: np.asarray(value).item()}
+
+
+def indexed_param(values, index=None):
+    """
+    Data for a param indexed by a single set from an array of values.
+
+    Arguments:
+
+        values: (array) Values of the param.
+        index:  (array) Index of each value. Default is 0, 1, ..., i.e., the
+                periods of the lifecycle models.
+
+    Returns:
+
+        data: (dict) Mapping from index to value.
+
+    """
+    values = np.asarray(values, dtype=float).ravel()
+    if index is None:
+        index = range(values.size)
+    else:
+        index = np.asarray(index).tolist()
+    return dict(zip(index, values.tolist()))
+
+
+def lifecycle_data(w=None, q=None, frame=None, **params):
+    """
+    Build the data for an instance of one of the lifecycle models directly
+    from arrays, without writing or parsing a .dat file.
+
+    Arguments:
+
+        w:        (array) Path of real wages, one value per period.
+        q:        (array) Path of asset prices (basic_lifecycle3), one value
+                  for each of the periods 0, ..., T + 1.
+        frame:    (object) A Pandas DataFrame whose columns (e.g., 'w' or
+                  'q') are indexed params and whose index are the periods.
+        params:   Scalar parameters (e.g., beta=0.95, theta=2.0). If T is
+                  not given it is inferred from the length of the wage path.
+
+    Returns:
+
+        data: (dict) Data in the form expected by model.create, i.e.
+              {None: {name: {index: value}}}.
+
+    """
+    data = {}
+
+    if frame is not None:
+        for column in frame.columns:
+            data[column] = indexed_param(frame[column].values, frame.index.values)
+
+    if w is not None:
+        data['w'] = indexed_param(w)
+
+    if q is not None:
+        data['q'] = indexed_param(q)
+
+    # the time horizon is implied by the wage path
+    if 'w' in data:
+        params.setdefault('T', len(data['w']) - 1)
+
+    for name, value in params.items():
+        data[name] = scalar_param(value)
+
+    return {None: data}
+
+
+def create_lifecycle_instance(model, w=None, q=None, frame=None, **params):
+    """
+    Create an instance of one of the lifecycle models from arrays (see
+    lifecycle_data). Params given here override their initialize rules,
+    e.g., an empirical wage profile replaces wage_schedule.
+
+    Arguments:
+
+        model: (object) The AbstractModel defined by one of the lifecycle
+               modules (e.g., lifecycle_with_labor.model).
+
+    Returns:
+
+        instance: (object) Concrete instance of the model.
+
+    """
+    return model.create(lifecycle_data(w, q, frame, **params))
@@ -0,0 +1,236 @@
+from __future__ import division
+from coopr import pyomo
+
+# define an abstract MPEC estimation problem for the life-cycle model with labor
+model = pyomo.AbstractModel()
+
+##### Define model parameters #####
+
+# time horizon
+model.T = pyomo.Param(doc="time horizon", within=pyomo.NonNegativeIntegers)
+model.periods = pyomo.RangeSet(0, model.T)
+
+# retirement age
+model.R = pyomo.Param(doc="retirement age", within=pyomo.NonNegativeIntegers)
+
+# net interest rate
+model.r = pyomo.Param(doc='interest rate', within=pyomo.NonNegativeReals)
+
+# wages
+def wage_schedule(model, t):
+    """Defines the path of wages. This should really go in the .dat file!"""
+    if t < model.R:
+        wage = t / model.R
+    else:
+        wage = 0.0
+    return wage
+
+model.w = pyomo.Param(model.periods, doc='real wages', within=pyomo.NonNegativeReals,
+                      initialize=wage_schedule)
+
+# define borrowing constraint
+model.minimum_assets = pyomo.Param(doc='lower bound on assets.')
+
+# observed data
+model.c_obs = pyomo.Param(model.periods, doc='observed consumption',
+                          within=pyomo.PositiveReals)
+model.l_obs = pyomo.Param(model.periods, doc='observed labor supply',
+                          within=pyomo.NonNegativeReals)
+
+##### Define structural parameters (these are estimated!) #####
+
+model.beta = pyomo.Var(doc='discount factor', bounds=(0.5, 0.999), initialize=0.95)
+model.theta = pyomo.Var(doc='inverse of elasticity of substitution for consumption',
+                        bounds=(0.1, 10.0), initialize=2.0)
+model.eta = pyomo.Var(doc='Frisch elasticity of substitution for labor',
+                      bounds=(0.1, 10.0), initialize=2.0)
+
+##### Define model variables #####
+
+# declare consumption variable
+def initial_consumption(model, t):
+    """Rule for initial choice of consumption: start from the data."""
+    return model.c_obs[t]
+
+model.consumption = pyomo.Var(model.periods,
+                              name='consumption',
+                              doc="agent's consumption choice is a flow variable!",
+                              domain=pyomo.PositiveReals,
+                              initialize=initial_consumption)
+
+# declare labor supply variable
+def initial_labor_supply(model, t):
+    """Rule for initial choice of labor supply: start from the data."""
+    if pyomo.value(model.w[t]) > 0:
+        return model.l_obs[t]
+    return 0.0
+
+def labor_supply_bounds(model, t):
+    """Agent does not work in periods without a wage (t = 0 and t >= R)."""
+    if pyomo.value(model.w[t]) > 0:
+        return (0.0, None)
+    return (0.0, 0.0)
+
+model.labor_supply = pyomo.Var(model.periods,
+                               name='labor supply',
+                               doc="agent's labor supply choice is a flow variable!",
+                               domain=pyomo.NonNegativeReals,
+                               bounds=labor_supply_bounds,
+                               initialize=initial_labor_supply)
+
+# declare assets variable
+def initial_assets(model, t):
+    """
+    Rule for initializing assets. Ideally this should be feasible given
+    rules for initializing consumption variable.
+
+    """
+    # extract variables
+    c = model.consumption
+    A = model.assets
+    l = model.labor_supply
+
+    # extract parameters
+    w = model.w
+    r = model.r
+
+    if t == 0:
+        assets = 0.0
+    else:
+        assets = w[t-1] * l[t-1] + (1 + r) * A[t-1] - c[t-1]
+
+    return assets
+
+model.assets = pyomo.Var(pyomo.RangeSet(0, model.T+1),
+                         name='assets',
+                         doc='agent assets are a stock variable!',
+                         initialize=initial_assets)
+
+# multipliers on the borrowing constraints
+model.borrowing_multiplier = pyomo.Var(model.periods,
+                                       doc='multiplier on the borrowing constraint',
+                                       domain=pyomo.NonNegativeReals,
+                                       initialize=0.0)
+
+##### define the objective function #####
+
+def sum_of_squares(model):
+    """Distance between the model's choices and the observed data."""
+    # extract variables
+    c = model.consumption
+    l = model.labor_supply
+
+    # extract parameters
+    c_obs = model.c_obs
+    l_obs = model.l_obs
+    T = model.periods
+
+    return sum((c[t] - c_obs[t])**2 + (l[t] - l_obs[t])**2 for t in T)
+
+model.sum_of_squares = pyomo.Objective(rule=sum_of_squares,
+                                       sense=pyomo.minimize)
+
+##### Define the model constraints (the agent's optimality conditions) #####
+
+def euler_equations(model, t):
+    """
+    Consumption Euler equation between t - 1 and t. The multiplier on the
+    borrowing constraint at t is scaled by beta**(1 - t) so that the equation
+    is written in current value terms.
+
+    """
+    # extract variables
+    c = model.consumption
+    mu = model.borrowing_multiplier
+    beta = model.beta
+    theta = model.theta
+
+    # extract parameters
+    r = model.r
+
+    if t == 0:
+        return pyomo.Constraint.Skip
+
+    return c[t-1]**(-theta) == beta * (1 + r) * c[t]**(-theta) + mu[t]
+
+model.euler_equations = pyomo.Constraint(model.periods,
+                                         rule=euler_equations,
+                                         doc='Intertemporal optimality condition.')
+
+def labor_supply_conditions(model, t):
+    """
+    Marginal disutility of work equals the marginal utility of the wage.
+    Only imposed in periods with a positive wage: elsewhere labor supply is
+    fixed at zero (see labor_supply_bounds), where l**eta has no derivative
+    with respect to the estimated eta (it involves log(l)).
+
+    """
+    # extract variables
+    c = model.consumption
+    l = model.labor_supply
+    theta = model.theta
+    eta = model.eta
+
+    # extract parameters
+    w = model.w
+
+    if pyomo.value(w[t]) <= 0:
+        return pyomo.Constraint.Skip
+
+    return l[t]**eta == w[t] * c[t]**(-theta)
+
+model.labor_supply_conditions = pyomo.Constraint(model.periods,
+                                                 rule=labor_supply_conditions,
+                                                 doc='Intratemporal optimality condition.')
+
+def flow_budget_constraints(model, t):
+    """Agent faces a sequence of flow budget constraints"""
+    # extract variables
+    c = model.consumption
+    l = model.labor_supply
+    A = model.assets
+
+    # extract parameters
+    r = model.r
+    w = model.w
+
+    return c[t] + A[t+1] == w[t] * l[t] + (1 + r) * A[t]
+
+model.budget_constraints = pyomo.Constraint(model.periods,
+                                            rule=flow_budget_constraints,
+                                            doc='Agent faces a sequence of flow budget constraints.')
+
+def borrowing_constraint(model, t):
+    """Agent's assets cannot fall below some minimum amount."""
+    return model.assets[t] >= model.minimum_assets
+
+model.borrowing_constraint = pyomo.Constraint(model.periods,
+                                              rule=borrowing_constraint,
+                                              doc='There is a lower bound on agent assets.')
+
+def complementary_slackness(model, t):
+    """
+    The multiplier is zero unless the borrowing constraint binds. Together
+    with the nonnegativity of both terms this is the NLP form of the
+    complementarity condition.
+
+    """
+    return model.borrowing_multiplier[t] * (model.assets[t] - model.minimum_assets) <= 0.0
+
+model.complementary_slackness = pyomo.Constraint(model.periods,
+                                                 rule=complementary_slackness,
+                                                 doc='Multiplier is zero when the constraint is slack.')
+
+def endowment(model):
+    """Agent has some initial assets."""
+    return model.assets[0] == 0.0
+
+model.endowment = pyomo.Constraint(rule=endowment,
+                                   doc='Agent has some initial endowment.')
+
+def no_bequests(model):
+    """Agent leaves no bequests."""
+    return model.assets[model.T+1] == 0.0
+
+model.no_bequests = pyomo.Constraint(rule=no_bequests,
+                                     doc='Agent makes no bequests.')
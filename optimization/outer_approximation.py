@@ -0,0 +1,282 @@
+from __future__ import division
+import sys
+
+import numpy as np
+from scipy import spatial
+
+import batch_lp
+
+
+def stage_game(payoffs1, payoffs2):
+    """
+    Payoffs and best response payoffs of a two player stage game, with the
+    action profiles ordered as in outer_bound.m (player 1's action varies
+    slowest).
+
+    Arguments:
+
+        payoffs1: (array) payoffs1[i, j] is player 1's payoff when player 1
+                  plays i and player 2 plays j.
+        payoffs2: (array) Player 2's payoffs, indexed the same way.
+
+    Returns:
+
+        pay: (array) Stage payoffs of the two players, shape (n_profiles, 2).
+        br:  (array) Best response payoffs at each profile (the most each
+             player can get by deviating), shape (n_profiles, 2).
+
+    """
+    payoffs1 = np.asarray(payoffs1, dtype=float)
+    payoffs2 = np.asarray(payoffs2, dtype=float)
+    n1, n2 = payoffs1.shape
+
+    pay = np.column_stack((payoffs1.ravel(), payoffs2.ravel()))
+    br = np.column_stack((np.repeat(payoffs1.max(axis=0)[np.newaxis], n1, axis=0).ravel(),
+                          np.repeat(payoffs2.max(axis=1)[:, np.newaxis], n2, axis=1).ravel()))
+    return pay, br
+
+
+def subgradients(n):
+    """n unit vectors at equally spaced angles, starting at 0 degrees."""
+    angles = 2 * np.pi * np.arange(n) / n
+    return np.column_stack((np.cos(angles), np.sin(angles)))
+
+
+def _level_rhs(H, C, pay, lower, delta):
+    """Right hand sides of -H u >= b, one row per profile (w = lower + u)."""
+    return H.dot(lower.T).T - delta * C - (1 - delta) * pay.dot(H.T)
+
+
+def _chebyshev_centers(H, B):
+    """
+    Centers and radii of the largest balls inside the feasible set of each
+    profile, {u >= 0 : -H u >= b}, solved as one batch of LPs in (u, r).
+
+    """
+    L = H.shape[0]
+    norms = np.sqrt(np.sum(H**2, axis=1))
+    A = np.vstack((np.column_stack((-H, -norms)),
+                   np.column_stack((np.eye(2), -np.ones(2)))))
+    B = np.hstack((B, np.zeros((B.shape[0], 2))))
+    X, _, _, status = batch_lp.solve_lp_batch(A, B, np.array([0.0, 0.0, -1.0]))
+    return X[:, :2], X[:, 2], status == 0
+
+
+def _support_lp(H, B, processes=1):
+    """
+    max_u h_l'u over {u >= 0 : -H u >= b_a} for every profile a and
+    subgradient l, as one batch of LPs sharing the constraint matrix -H.
+
+    Returns:
+
+        values: (array) Optimal values, shape (P, L) (-inf if infeasible).
+        U:      (array) Solutions, shape (P, L, 2).
+
+    """
+    P, L = B.shape
+    X, obj, _, status = batch_lp.solve_lp_batch(-H, np.repeat(B, L, axis=0),
+                                                np.tile(-H, (P, 1)), processes)
+    values = np.where(status == 0, -obj, -np.inf).reshape(P, L)
+    return values, X.reshape(P, L, 2)
+
+
+def _support_vertices(H, b, center):
+    """
+    max_u h_l'u over the polygon {u >= 0 : -H u >= b} for every subgradient
+    l, from the vertices of the polygon (found by qhull from an interior
+    point): one matrix product instead of L LPs.
+
+    """
+    halfspaces = np.vstack((np.column_stack((H, b)),
+                            np.column_stack((-np.eye(2), np.zeros(2)))))
+    vertices = spatial.HalfspaceIntersection(halfspaces, center).intersections
+    support = H.dot(vertices.T)
+    best = np.argmax(support, axis=1)
+    L = H.shape[0]
+    return support[np.arange(L), best], vertices[best]
+
+
+def outer_step(H, C, pay, br, delta, wmin, method='vertices', processes=1):
+    """
+    One iteration of the outer hyperplane approximation of Judd, Yeltekin
+    and Conklin (2003). For every subgradient h_l and action profile a,
+
+        max h_l'w s.t. H w <= delta C + (1 - delta) H pay_a,
+                       w >= (1 - delta) br_a + delta wmin
+
+    and the new level of each hyperplane is the best value over profiles.
+    Writing w = lower_a + u with u >= 0 turns the incentive constraints into
+    the bounds of batch_lp, so all the LPs share the constraint matrix -H.
+
+    With method='lp' the P x L LPs are solved as one batch by
+    batch_lp.solve_lp_batch (in parallel with processes > 1). All the LPs of
+    a profile have the same (two dimensional) feasible set, so
+    method='vertices' instead solves one batch of P Chebyshev center LPs,
+    computes the vertices of each nonempty feasible set with qhull and
+    evaluates all L subgradients at once. Profiles whose feasible set has no
+    interior fall back to the LPs.
+
+    Arguments:
+
+        H:         (array) Subgradients, shape (L, 2).
+        C:         (array) Levels of the current hyperplanes, shape (L,).
+        pay, br:   (array) Output of stage_game.
+        delta:     (float) Discount factor.
+        wmin:      (array) Lowest continuation value of each player.
+        method:    (str) 'vertices' or 'lp'.
+        processes: (int) Number of worker processes for the LPs.
+
+    Returns:
+
+        C: (array) New levels, shape (L,) (-inf if no profile is feasible).
+        Z: (array) Points attaining the new levels, shape (L, 2).
+
+    """
+    if method not in ('vertices', 'lp'):
+        raise ValueError("method must be 'vertices' or 'lp'.")
+
+    lower = (1 - delta) * br + delta * np.asarray(wmin, dtype=float)
+    B = _level_rhs(H, C, pay, lower, delta)
+    P, L = B.shape
+
+    if method == 'lp':
+        values, U = _support_lp(H, B, processes)
+    else:
+        values = np.full((P, L), -np.inf)
+        U = np.zeros((P, L, 2))
+        centers, radii, feasible = _chebyshev_centers(H, B)
+        thin = []
+        for a in np.flatnonzero(feasible):
+            if radii[a] > 1e-9:
+                values[a], U[a] = _support_vertices(H, B[a], centers[a])
+            else:
+                thin.append(a)
+        if thin:
+            values[thin], U[thin] = _support_lp(H, B[thin], processes)
+
+    # values of h_l'w = h_l'(lower_a + u)
+    values = values + lower.dot(H.T)
+    best = np.argmax(values, axis=0)
+    columns = np.arange(L)
+    return values[best, columns], U[best, columns] + lower[best]
+
+
+def hausdorff(A, B):
+    """
+    Hausdorff distance between the point sets A and B (hausdorff.m), with
+    the nearest neighbour queries answered by KD-trees rather than by the
+    full matrix of pairwise distances.
+
+    Arguments:
+
+        A: (array) Points with shape (n, d).
+        B: (array) Points with shape (m, d).
+
+    Returns:
+
+        distance: (float) Hausdorff distance.
+
+    """
+    A = np.asarray(A, dtype=float)
+    B = np.asarray(B, dtype=float)
+    from_A, _ = spatial.cKDTree(B).query(A)
+    from_B, _ = spatial.cKDTree(A).query(B)
+    return max(from_A.max(), from_B.max())
+
+
+def support_distance(A, B, directions=None, n_directions=360):
+    """
+    Hausdorff distance between the convex hulls of the point sets A and B,
+    computed as the largest difference of their support functions over a
+    set of unit directions (exact as the directions become dense). All
+    directions are evaluated with one matrix product per set.
+
+    Arguments:
+
+        A, B:         (array) Points with shape (n, 2) and (m, 2).
+        directions:   (array) Unit directions, shape (k, 2). Default is
+                      subgradients(n_directions).
+        n_directions: (int) Number of default directions.
+
+    Returns:
+
+        distance: (float) Largest difference of the support functions.
+
+    """
+    if directions is None:
+        directions = subgradients(n_directions)
+    support_A = np.max(directions.dot(np.asarray(A, dtype=float).T), axis=1)
+    support_B = np.max(directions.dot(np.asarray(B, dtype=float).T), axis=1)
+    return np.max(np.abs(support_A - support_B))
+
+
+def outer_approximation(payoffs1, payoffs2, delta, n_gradients=8, center=(3.0, 3.0),
+                        radius=5.0, wmin=(-10.0, -10.0), tol=1e-2, max_iter=1000,
+                        method='vertices', criterion='support', processes=1,
+                        verbose=False):
+    """
+    Outer hyperplane approximation of the set of subgame perfect equilibrium
+    payoffs of a two player repeated game (outer_bound.m). The iteration
+    starts from the hyperplanes tangent to a circle containing the set.
+
+    Arguments:
+
+        payoffs1, payoffs2: (array) Stage game payoffs, see stage_game.
+        delta:        (float) Discount factor.
+        n_gradients:  (int) Number of subgradients.
+        center:       (tuple) Center of the initial circle.
+        radius:       (float) Radius of the initial circle.
+        wmin:         (tuple) Initial lowest continuation values.
+        tol:          (float) Convergence tolerance.
+        max_iter:     (int) Maximum number of iterations.
+        method:       (str) How the LPs are solved, see outer_step.
+        criterion:    (str) Distance between successive approximations:
+                      'support' (largest change of the levels C, i.e., the
+                      support functions of the approximations along the
+                      subgradients), 'hausdorff' (between the point sets,
+                      see hausdorff) or 'relative' (largest relative change
+                      of the points, as in outer_bound.m). The points are
+                      maximizers of LPs with ties broken differently by
+                      the two methods, so only 'support' is guaranteed to
+                      stop both methods at the same iteration.
+        processes:    (int) Number of worker processes for the LPs.
+        verbose:      (bool) Report progress every 5 iterations.
+
+    Returns:
+
+        Z:          (array) Points on the boundary of the approximation,
+                    shape (n_gradients, 2).
+        H:          (array) Subgradients, shape (n_gradients, 2).
+        C:          (array) Levels of the hyperplanes H w <= C.
+        iterations: (int) Number of iterations.
+
+    """
+    if criterion not in ('relative', 'hausdorff', 'support'):
+        raise ValueError("criterion must be 'relative', 'hausdorff' or 'support'.")
+
+    pay, br = stage_game(payoffs1, payoffs2)
+    H = subgradients(n_gradients)
+    C = H.dot(center) + radius
+    wmin = np.asarray(wmin, dtype=float)
+    Z_old = np.zeros((n_gradients, 2))
+
+    for iteration in range(1, max_iter + 1):
+        C_old = C
+        C, Z = outer_step(H, C, pay, br, delta, wmin, method, processes)
+        if not np.all(np.isfinite(C)):
+            raise ValueError("The equilibrium set is empty for some subgradient.")
+        wmin = Z.min(axis=0)
+
+        if criterion == 'relative':
+            error = np.max(np.abs(Z - Z_old) / (1 + np.abs(Z_old)))
+        elif criterion == 'hausdorff':
+            error = hausdorff(Z, Z_old)
+        else:
+            error = np.max(np.abs(C - C_old))
+        if verbose and iteration % 5 == 0:
+            sys.stdout.write('iteration: %d \t tolerance: %f.\n' % (iteration, error))
+        if error < tol:
+            break
+        Z_old = Z
+
+    return Z, H, C, iteration
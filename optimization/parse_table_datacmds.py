@@ -1,5 +1,5 @@
 
-# /Users/clarissasweet/Dropbox/zice-2014/optimization/parse_table_datacmds.py
+# parse_table_datacmds.py
 # This file is automatically generated. Do not edit.
 _tabversion = '3.2'
 
@@ -26,138 +26,138 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> expr","S'",1,None,None,None),
-  ('expr -> statements','expr',1,'p_expr','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',175),
-  ('expr -> <empty>','expr',0,'p_expr','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',176),
-  ('statements -> statements statement','statements',2,'p_statements','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',190),
-  ('statements -> statement','statements',1,'p_statements','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',191),
-  ('statements -> statements NAMESPACE WORD LBRACE statements RBRACE','statements',6,'p_statements','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',192),
-  ('statements -> NAMESPACE WORD LBRACE statements RBRACE','statements',5,'p_statements','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',193),
-  ('statement -> SET WORD COLONEQ setdecl SEMICOLON','statement',5,'p_statement','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',215),
-  ('statement -> SET WORD COLONEQ SEMICOLON','statement',4,'p_statement','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',216),
-  ('statement -> SET WORD COLON items COLONEQ setdecl SEMICOLON','statement',7,'p_statement','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',217),
-  ('statement -> SET WORD COLON items COLONEQ SEMICOLON','statement',6,'p_statement','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',218),
-  ('statement -> SET WORDWITHINDEX COLONEQ setdecl SEMICOLON','statement',5,'p_statement','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',219),
-  ('statement -> SET WORDWITHINDEX COLONEQ SEMICOLON','statement',4,'p_statement','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',220),
-  ('statement -> SET WORDWITHSQUOTEDINDEX COLONEQ setdecl SEMICOLON','statement',5,'p_statement','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',221),
-  ('statement -> SET WORDWITHSQUOTEDINDEX COLONEQ SEMICOLON','statement',4,'p_statement','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',222),
-  ('statement -> PARAM items COLONEQ paramdecl SEMICOLON','statement',5,'p_statement','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',223),
-  ('statement -> IMPORT importdecl SEMICOLON','statement',3,'p_statement','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',224),
-  ('statement -> LOAD loaddecl SEMICOLON','statement',3,'p_statement','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',225),
-  ('statement -> STORE importdecl SEMICOLON','statement',3,'p_statement','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',226),
-  ('statement -> TABLE tabledecl SEMICOLON','statement',3,'p_statement','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',227),
-  ('statement -> INCLUDE WORD SEMICOLON','statement',3,'p_statement','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',228),
-  ('statement -> INCLUDE QUOTEDSTRING SEMICOLON','statement',3,'p_statement','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',229),
-  ('statement -> DATA SEMICOLON','statement',2,'p_statement','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',230),
-  ('statement -> END SEMICOLON','statement',2,'p_statement','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',231),
-  ('setdecl -> items','setdecl',1,'p_setdecl','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',250),
-  ('paramdecl -> items','paramdecl',1,'p_paramdecl','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',254),
-  ('loaddecl -> filename import_options table_indices labeled_table_values','loaddecl',4,'p_loaddecl','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',258),
-  ('loaddecl -> filename import_options WORD','loaddecl',3,'p_loaddecl','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',259),
-  ('loaddecl -> filename import_options','loaddecl',2,'p_loaddecl','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',260),
-  ('importdecl -> filename import_options','importdecl',2,'p_importdecl','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',274),
-  ('importdecl -> filename','importdecl',1,'p_importdecl','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',275),
-  ('importdecl -> filename import_options COLON WORD EQ bracket_indices variable_options','importdecl',7,'p_importdecl','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',276),
-  ('importdecl -> filename COLON WORD EQ bracket_indices variable_options','importdecl',6,'p_importdecl','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',277),
-  ('importdecl -> filename import_options COLON bracket_indices variable_options','importdecl',5,'p_importdecl','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',278),
-  ('importdecl -> filename COLON bracket_indices variable_options','importdecl',4,'p_importdecl','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',279),
-  ('importdecl -> filename import_options COLON variable_options','importdecl',4,'p_importdecl','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',280),
-  ('importdecl -> filename COLON variable_options','importdecl',3,'p_importdecl','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',281),
-  ('importdecl -> WORD import_options','importdecl',2,'p_importdecl','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',282),
-  ('importdecl -> WORD','importdecl',1,'p_importdecl','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',283),
-  ('importdecl -> WORD import_options COLON WORD EQ bracket_indices variable_options','importdecl',7,'p_importdecl','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',284),
-  ('importdecl -> WORD COLON WORD EQ bracket_indices variable_options','importdecl',6,'p_importdecl','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',285),
-  ('importdecl -> WORD import_options COLON bracket_indices variable_options','importdecl',5,'p_importdecl','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',286),
-  ('importdecl -> WORD COLON bracket_indices variable_options','importdecl',4,'p_importdecl','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',287),
-  ('importdecl -> WORD import_options COLON variable_options','importdecl',4,'p_importdecl','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',288),
-  ('importdecl -> WORD COLON variable_options','importdecl',3,'p_importdecl','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',289),
-  ('tabledecl -> import_options table_indices unlabeled_table_values COLONEQ paramdecl','tabledecl',5,'p_tabledecl','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',317),
-  ('tabledecl -> import_options table_indices labeled_table_values COLON table_labels COLONEQ paramdecl','tabledecl',7,'p_tabledecl','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',318),
-  ('tabledecl -> WORD COLONEQ paramdecl','tabledecl',3,'p_tabledecl','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',319),
-  ('unlabeled_table_values -> unlabeled_table_value unlabeled_table_values','unlabeled_table_values',2,'p_unlabeled_table_values','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',342),
-  ('unlabeled_table_values -> unlabeled_table_value','unlabeled_table_values',1,'p_unlabeled_table_values','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',343),
-  ('unlabeled_table_values -> <empty>','unlabeled_table_values',0,'p_unlabeled_table_values','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',344),
-  ('unlabeled_table_value -> WORDWITHLPAREN WORD index_list RPAREN EQ LBRACE WORD RBRACE','unlabeled_table_value',8,'p_unlabeled_table_value','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',355),
-  ('unlabeled_table_value -> WORDWITHLPAREN WORD RPAREN EQ LBRACE WORD RBRACE','unlabeled_table_value',7,'p_unlabeled_table_value','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',356),
-  ('unlabeled_table_value -> WORDWITHLPAREN RPAREN EQ LBRACE WORD RBRACE','unlabeled_table_value',6,'p_unlabeled_table_value','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',357),
-  ('labeled_table_values -> labeled_table_value labeled_table_values','labeled_table_values',2,'p_labeled_table_values','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',367),
-  ('labeled_table_values -> labeled_table_value','labeled_table_values',1,'p_labeled_table_values','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',368),
-  ('labeled_table_values -> <empty>','labeled_table_values',0,'p_labeled_table_values','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',369),
-  ('labeled_table_value -> WORDWITHLPAREN WORD index_list RPAREN','labeled_table_value',4,'p_labeled_table_value','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',380),
-  ('labeled_table_value -> WORDWITHLPAREN WORD RPAREN','labeled_table_value',3,'p_labeled_table_value','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',381),
-  ('labeled_table_value -> WORDWITHLPAREN RPAREN','labeled_table_value',2,'p_labeled_table_value','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',382),
-  ('table_indices -> WORDWITHEQBRACE WORD index_list RBRACE table_indices','table_indices',5,'p_table_indices','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',392),
-  ('table_indices -> WORDWITHEQBRACE WORD RBRACE table_indices','table_indices',4,'p_table_indices','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',393),
-  ('table_indices -> WORDWITHEQBRACE WORD index_list RBRACE','table_indices',4,'p_table_indices','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',394),
-  ('table_indices -> WORDWITHEQBRACE WORD RBRACE','table_indices',3,'p_table_indices','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',395),
-  ('table_indices -> <empty>','table_indices',0,'p_table_indices','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',396),
-  ('table_labels -> WORD table_labels','table_labels',2,'p_table_labels','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',413),
-  ('table_labels -> WORD','table_labels',1,'p_table_labels','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',414),
-  ('table_labels -> <empty>','table_labels',0,'p_table_labels','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',415),
-  ('import_options -> option import_options','import_options',2,'p_import_options','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',426),
-  ('import_options -> option','import_options',1,'p_import_options','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',427),
-  ('import_options -> <empty>','import_options',0,'p_import_options','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',428),
-  ('option -> WORD EQ WORD','option',3,'p_option','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',439),
-  ('option -> WORD EQ STRING','option',3,'p_option','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',440),
-  ('option -> WORD EQ QUOTEDSTRING','option',3,'p_option','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',441),
-  ('option -> WORD EQ PARAM','option',3,'p_option','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',442),
-  ('option -> WORD EQ SET','option',3,'p_option','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',443),
-  ('variable_options -> variable variable_options','variable_options',2,'p_variable_options','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',448),
-  ('variable_options -> variable','variable_options',1,'p_variable_options','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',449),
-  ('variable -> WORD','variable',1,'p_variable','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',458),
-  ('variable -> option','variable',1,'p_variable','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',459),
-  ('bracket_indices -> LBRACKET WORD index_list RBRACKET','bracket_indices',4,'p_bracket_indices','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',467),
-  ('bracket_indices -> LBRACKET WORD RBRACKET','bracket_indices',3,'p_bracket_indices','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',468),
-  ('index_list -> COMMA WORD index_list','index_list',3,'p_index_list','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',477),
-  ('index_list -> COMMA ASTERISK index_list','index_list',3,'p_index_list','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',478),
-  ('index_list -> COMMA WORD','index_list',2,'p_index_list','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',479),
-  ('index_list -> COMMA ASTERISK','index_list',2,'p_index_list','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',480),
-  ('set_template -> LPAREN WORD index_list RPAREN','set_template',4,'p_set_template','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',489),
-  ('set_template -> LPAREN ASTERISK index_list RPAREN','set_template',4,'p_set_template','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',490),
-  ('set_template -> LPAREN WORD RPAREN','set_template',3,'p_set_template','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',491),
-  ('set_template -> LPAREN ASTERISK RPAREN','set_template',3,'p_set_template','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',492),
-  ('param_template -> LBRACKET WORD index_list RBRACKET','param_template',4,'p_param_template','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',500),
-  ('param_template -> LBRACKET ASTERISK index_list RBRACKET','param_template',4,'p_param_template','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',501),
-  ('param_template -> LBRACKET WORD RBRACKET','param_template',3,'p_param_template','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',502),
-  ('param_template -> LBRACKET ASTERISK RBRACKET','param_template',3,'p_param_template','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',503),
-  ('items -> items WORD','items',2,'p_items','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',514),
-  ('items -> items WORDWITHINDEX','items',2,'p_items','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',515),
-  ('items -> items WORDWITHSQUOTEDINDEX','items',2,'p_items','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',516),
-  ('items -> items NONWORD','items',2,'p_items','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',517),
-  ('items -> items STRING','items',2,'p_items','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',518),
-  ('items -> items QUOTEDSTRING','items',2,'p_items','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',519),
-  ('items -> items COMMA','items',2,'p_items','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',520),
-  ('items -> items COLON','items',2,'p_items','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',521),
-  ('items -> items LBRACE','items',2,'p_items','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',522),
-  ('items -> items RBRACE','items',2,'p_items','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',523),
-  ('items -> items LBRACKET','items',2,'p_items','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',524),
-  ('items -> items RBRACKET','items',2,'p_items','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',525),
-  ('items -> items TR','items',2,'p_items','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',526),
-  ('items -> items LPAREN','items',2,'p_items','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',527),
-  ('items -> items RPAREN','items',2,'p_items','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',528),
-  ('items -> items ASTERISK','items',2,'p_items','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',529),
-  ('items -> items set_template','items',2,'p_items','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',530),
-  ('items -> items param_template','items',2,'p_items','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',531),
-  ('items -> WORD','items',1,'p_items','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',532),
-  ('items -> WORDWITHINDEX','items',1,'p_items','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',533),
-  ('items -> WORDWITHSQUOTEDINDEX','items',1,'p_items','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',534),
-  ('items -> NONWORD','items',1,'p_items','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',535),
-  ('items -> STRING','items',1,'p_items','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',536),
-  ('items -> QUOTEDSTRING','items',1,'p_items','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',537),
-  ('items -> COMMA','items',1,'p_items','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',538),
-  ('items -> COLON','items',1,'p_items','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',539),
-  ('items -> LBRACE','items',1,'p_items','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',540),
-  ('items -> RBRACE','items',1,'p_items','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',541),
-  ('items -> LBRACKET','items',1,'p_items','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',542),
-  ('items -> RBRACKET','items',1,'p_items','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',543),
-  ('items -> TR','items',1,'p_items','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',544),
-  ('items -> LPAREN','items',1,'p_items','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',545),
-  ('items -> RPAREN','items',1,'p_items','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',546),
-  ('items -> ASTERISK','items',1,'p_items','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',547),
-  ('items -> set_template','items',1,'p_items','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',548),
-  ('items -> param_template','items',1,'p_items','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',549),
-  ('filename -> WORD','filename',1,'p_filename','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',571),
-  ('filename -> STRING','filename',1,'p_filename','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',572),
-  ('filename -> QUOTEDSTRING','filename',1,'p_filename','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',573),
-  ('filename -> FILENAME','filename',1,'p_filename','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',574),
-  ('filename -> WORD COLON FILENAME','filename',3,'p_filename','/Users/clarissasweet/Library/Enthought/Canopy_32bit/User/lib/python2.7/site-packages/coopr/pyomo/data/parse_datacmds.py',575),
+  ('expr -> statements','expr',1,'p_expr','coopr/pyomo/data/parse_datacmds.py',175),
+  ('expr -> <empty>','expr',0,'p_expr','coopr/pyomo/data/parse_datacmds.py',176),
+  ('statements -> statements statement','statements',2,'p_statements','coopr/pyomo/data/parse_datacmds.py',190),
+  ('statements -> statement','statements',1,'p_statements','coopr/pyomo/data/parse_datacmds.py',191),
+  ('statements -> statements NAMESPACE WORD LBRACE statements RBRACE','statements',6,'p_statements','coopr/pyomo/data/parse_datacmds.py',192),
+  ('statements -> NAMESPACE WORD LBRACE statements RBRACE','statements',5,'p_statements','coopr/pyomo/data/parse_datacmds.py',193),
+  ('statement -> SET WORD COLONEQ setdecl SEMICOLON','statement',5,'p_statement','coopr/pyomo/data/parse_datacmds.py',215),
+  ('statement -> SET WORD COLONEQ SEMICOLON','statement',4,'p_statement','coopr/pyomo/data/parse_datacmds.py',216),
+  ('statement -> SET WORD COLON items COLONEQ setdecl SEMICOLON','statement',7,'p_statement','coopr/pyomo/data/parse_datacmds.py',217),
+  ('statement -> SET WORD COLON items COLONEQ SEMICOLON','statement',6,'p_statement','coopr/pyomo/data/parse_datacmds.py',218),
+  ('statement -> SET WORDWITHINDEX COLONEQ setdecl SEMICOLON','statement',5,'p_statement','coopr/pyomo/data/parse_datacmds.py',219),
+  ('statement -> SET WORDWITHINDEX COLONEQ SEMICOLON','statement',4,'p_statement','coopr/pyomo/data/parse_datacmds.py',220),
+  ('statement -> SET WORDWITHSQUOTEDINDEX COLONEQ setdecl SEMICOLON','statement',5,'p_statement','coopr/pyomo/data/parse_datacmds.py',221),
+  ('statement -> SET WORDWITHSQUOTEDINDEX COLONEQ SEMICOLON','statement',4,'p_statement','coopr/pyomo/data/parse_datacmds.py',222),
+  ('statement -> PARAM items COLONEQ paramdecl SEMICOLON','statement',5,'p_statement','coopr/pyomo/data/parse_datacmds.py',223),
+  ('statement -> IMPORT importdecl SEMICOLON','statement',3,'p_statement','coopr/pyomo/data/parse_datacmds.py',224),
+  ('statement -> LOAD loaddecl SEMICOLON','statement',3,'p_statement','coopr/pyomo/data/parse_datacmds.py',225),
+  ('statement -> STORE importdecl SEMICOLON','statement',3,'p_statement','coopr/pyomo/data/parse_datacmds.py',226),
+  ('statement -> TABLE tabledecl SEMICOLON','statement',3,'p_statement','coopr/pyomo/data/parse_datacmds.py',227),
+  ('statement -> INCLUDE WORD SEMICOLON','statement',3,'p_statement','coopr/pyomo/data/parse_datacmds.py',228),
+  ('statement -> INCLUDE QUOTEDSTRING SEMICOLON','statement',3,'p_statement','coopr/pyomo/data/parse_datacmds.py',229),
+  ('statement -> DATA SEMICOLON','statement',2,'p_statement','coopr/pyomo/data/parse_datacmds.py',230),
+  ('statement -> END SEMICOLON','statement',2,'p_statement','coopr/pyomo/data/parse_datacmds.py',231),
+  ('setdecl -> items','setdecl',1,'p_setdecl','coopr/pyomo/data/parse_datacmds.py',250),
+  ('paramdecl -> items','paramdecl',1,'p_paramdecl','coopr/pyomo/data/parse_datacmds.py',254),
+  ('loaddecl -> filename import_options table_indices labeled_table_values','loaddecl',4,'p_loaddecl','coopr/pyomo/data/parse_datacmds.py',258),
+  ('loaddecl -> filename import_options WORD','loaddecl',3,'p_loaddecl','coopr/pyomo/data/parse_datacmds.py',259),
+  ('loaddecl -> filename import_options','loaddecl',2,'p_loaddecl','coopr/pyomo/data/parse_datacmds.py',260),
+  ('importdecl -> filename import_options','importdecl',2,'p_importdecl','coopr/pyomo/data/parse_datacmds.py',274),
+  ('importdecl -> filename','importdecl',1,'p_importdecl','coopr/pyomo/data/parse_datacmds.py',275),
+  ('importdecl -> filename import_options COLON WORD EQ bracket_indices variable_options','importdecl',7,'p_importdecl','coopr/pyomo/data/parse_datacmds.py',276),
+  ('importdecl -> filename COLON WORD EQ bracket_indices variable_options','importdecl',6,'p_importdecl','coopr/pyomo/data/parse_datacmds.py',277),
+  ('importdecl -> filename import_options COLON bracket_indices variable_options','importdecl',5,'p_importdecl','coopr/pyomo/data/parse_datacmds.py',278),
+  ('importdecl -> filename COLON bracket_indices variable_options','importdecl',4,'p_importdecl','coopr/pyomo/data/parse_datacmds.py',279),
+  ('importdecl -> filename import_options COLON variable_options','importdecl',4,'p_importdecl','coopr/pyomo/data/parse_datacmds.py',280),
+  ('importdecl -> filename COLON variable_options','importdecl',3,'p_importdecl','coopr/pyomo/data/parse_datacmds.py',281),
+  ('importdecl -> WORD import_options','importdecl',2,'p_importdecl','coopr/pyomo/data/parse_datacmds.py',282),
+  ('importdecl -> WORD','importdecl',1,'p_importdecl','coopr/pyomo/data/parse_datacmds.py',283),
+  ('importdecl -> WORD import_options COLON WORD EQ bracket_indices variable_options','importdecl',7,'p_importdecl','coopr/pyomo/data/parse_datacmds.py',284),
+  ('importdecl -> WORD COLON WORD EQ bracket_indices variable_options','importdecl',6,'p_importdecl','coopr/pyomo/data/parse_datacmds.py',285),
+  ('importdecl -> WORD import_options COLON bracket_indices variable_options','importdecl',5,'p_importdecl','coopr/pyomo/data/parse_datacmds.py',286),
+  ('importdecl -> WORD COLON bracket_indices variable_options','importdecl',4,'p_importdecl','coopr/pyomo/data/parse_datacmds.py',287),
+  ('importdecl -> WORD import_options COLON variable_options','importdecl',4,'p_importdecl','coopr/pyomo/data/parse_datacmds.py',288),
+  ('importdecl -> WORD COLON variable_options','importdecl',3,'p_importdecl','coopr/pyomo/data/parse_datacmds.py',289),
+  ('tabledecl -> import_options table_indices unlabeled_table_values COLONEQ paramdecl','tabledecl',5,'p_tabledecl','coopr/pyomo/data/parse_datacmds.py',317),
+  ('tabledecl -> import_options table_indices labeled_table_values COLON table_labels COLONEQ paramdecl','tabledecl',7,'p_tabledecl','coopr/pyomo/data/parse_datacmds.py',318),
+  ('tabledecl -> WORD COLONEQ paramdecl','tabledecl',3,'p_tabledecl','coopr/pyomo/data/parse_datacmds.py',319),
+  ('unlabeled_table_values -> unlabeled_table_value unlabeled_table_values','unlabeled_table_values',2,'p_unlabeled_table_values','coopr/pyomo/data/parse_datacmds.py',342),
+  ('unlabeled_table_values -> unlabeled_table_value','unlabeled_table_values',1,'p_unlabeled_table_values','coopr/pyomo/data/parse_datacmds.py',343),
+  ('unlabeled_table_values -> <empty>','unlabeled_table_values',0,'p_unlabeled_table_values','coopr/pyomo/data/parse_datacmds.py',344),
+  ('unlabeled_table_value -> WORDWITHLPAREN WORD index_list RPAREN EQ LBRACE WORD RBRACE','unlabeled_table_value',8,'p_unlabeled_table_value','coopr/pyomo/data/parse_datacmds.py',355),
+  ('unlabeled_table_value -> WORDWITHLPAREN WORD RPAREN EQ LBRACE WORD RBRACE','unlabeled_table_value',7,'p_unlabeled_table_value','coopr/pyomo/data/parse_datacmds.py',356),
+  ('unlabeled_table_value -> WORDWITHLPAREN RPAREN EQ LBRACE WORD RBRACE','unlabeled_table_value',6,'p_unlabeled_table_value','coopr/pyomo/data/parse_datacmds.py',357),
+  ('labeled_table_values -> labeled_table_value labeled_table_values','labeled_table_values',2,'p_labeled_table_values','coopr/pyomo/data/parse_datacmds.py',367),
+  ('labeled_table_values -> labeled_table_value','labeled_table_values',1,'p_labeled_table_values','coopr/pyomo/data/parse_datacmds.py',368),
+  ('labeled_table_values -> <empty>','labeled_table_values',0,'p_labeled_table_values','coopr/pyomo/data/parse_datacmds.py',369),
+  ('labeled_table_value -> WORDWITHLPAREN WORD index_list RPAREN','labeled_table_value',4,'p_labeled_table_value','coopr/pyomo/data/parse_datacmds.py',380),
+  ('labeled_table_value -> WORDWITHLPAREN WORD RPAREN','labeled_table_value',3,'p_labeled_table_value','coopr/pyomo/data/parse_datacmds.py',381),
+  ('labeled_table_value -> WORDWITHLPAREN RPAREN','labeled_table_value',2,'p_labeled_table_value','coopr/pyomo/data/parse_datacmds.py',382),
+  ('table_indices -> WORDWITHEQBRACE WORD index_list RBRACE table_indices','table_indices',5,'p_table_indices','coopr/pyomo/data/parse_datacmds.py',392),
+  ('table_indices -> WORDWITHEQBRACE WORD RBRACE table_indices','table_indices',4,'p_table_indices','coopr/pyomo/data/parse_datacmds.py',393),
+  ('table_indices -> WORDWITHEQBRACE WORD index_list RBRACE','table_indices',4,'p_table_indices','coopr/pyomo/data/parse_datacmds.py',394),
+  ('table_indices -> WORDWITHEQBRACE WORD RBRACE','table_indices',3,'p_table_indices','coopr/pyomo/data/parse_datacmds.py',395),
+  ('table_indices -> <empty>','table_indices',0,'p_table_indices','coopr/pyomo/data/parse_datacmds.py',396),
+  ('table_labels -> WORD table_labels','table_labels',2,'p_table_labels','coopr/pyomo/data/parse_datacmds.py',413),
+  ('table_labels -> WORD','table_labels',1,'p_table_labels','coopr/pyomo/data/parse_datacmds.py',414),
+  ('table_labels -> <empty>','table_labels',0,'p_table_labels','coopr/pyomo/data/parse_datacmds.py',415),
+  ('import_options -> option import_options','import_options',2,'p_import_options','coopr/pyomo/data/parse_datacmds.py',426),
+  ('import_options -> option','import_options',1,'p_import_options','coopr/pyomo/data/parse_datacmds.py',427),
+  ('import_options -> <empty>','import_options',0,'p_import_options','coopr/pyomo/data/parse_datacmds.py',428),
+  ('option -> WORD EQ WORD','option',3,'p_option','coopr/pyomo/data/parse_datacmds.py',439),
+  ('option -> WORD EQ STRING','option',3,'p_option','coopr/pyomo/data/parse_datacmds.py',440),
+  ('option -> WORD EQ QUOTEDSTRING','option',3,'p_option','coopr/pyomo/data/parse_datacmds.py',441),
+  ('option -> WORD EQ PARAM','option',3,'p_option','coopr/pyomo/data/parse_datacmds.py',442),
+  ('option -> WORD EQ SET','option',3,'p_option','coopr/pyomo/data/parse_datacmds.py',443),
+  ('variable_options -> variable variable_options','variable_options',2,'p_variable_options','coopr/pyomo/data/parse_datacmds.py',448),
+  ('variable_options -> variable','variable_options',1,'p_variable_options','coopr/pyomo/data/parse_datacmds.py',449),
+  ('variable -> WORD','variable',1,'p_variable','coopr/pyomo/data/parse_datacmds.py',458),
+  ('variable -> option','variable',1,'p_variable','coopr/pyomo/data/parse_datacmds.py',459),
+  ('bracket_indices -> LBRACKET WORD index_list RBRACKET','bracket_indices',4,'p_bracket_indices','coopr/pyomo/data/parse_datacmds.py',467),
+  ('bracket_indices -> LBRACKET WORD RBRACKET','bracket_indices',3,'p_bracket_indices','coopr/pyomo/data/parse_datacmds.py',468),
+  ('index_list -> COMMA WORD index_list','index_list',3,'p_index_list','coopr/pyomo/data/parse_datacmds.py',477),
+  ('index_list -> COMMA ASTERISK index_list','index_list',3,'p_index_list','coopr/pyomo/data/parse_datacmds.py',478),
+  ('index_list -> COMMA WORD','index_list',2,'p_index_list','coopr/pyomo/data/parse_datacmds.py',479),
+  ('index_list -> COMMA ASTERISK','index_list',2,'p_index_list','coopr/pyomo/data/parse_datacmds.py',480),
+  ('set_template -> LPAREN WORD index_list RPAREN','set_template',4,'p_set_template','coopr/pyomo/data/parse_datacmds.py',489),
+  ('set_template -> LPAREN ASTERISK index_list RPAREN','set_template',4,'p_set_template','coopr/pyomo/data/parse_datacmds.py',490),
+  ('set_template -> LPAREN WORD RPAREN','set_template',3,'p_set_template','coopr/pyomo/data/parse_datacmds.py',491),
+  ('set_template -> LPAREN ASTERISK RPAREN','set_template',3,'p_set_template','coopr/pyomo/data/parse_datacmds.py',492),
+  ('param_template -> LBRACKET WORD index_list RBRACKET','param_template',4,'p_param_template','coopr/pyomo/data/parse_datacmds.py',500),
+  ('param_template -> LBRACKET ASTERISK index_list RBRACKET','param_template',4,'p_param_template','coopr/pyomo/data/parse_datacmds.py',501),
+  ('param_template -> LBRACKET WORD RBRACKET','param_template',3,'p_param_template','coopr/pyomo/data/parse_datacmds.py',502),
+  ('param_template -> LBRACKET ASTERISK RBRACKET','param_template',3,'p_param_template','coopr/pyomo/data/parse_datacmds.py',503),
+  ('items -> items WORD','items',2,'p_items','coopr/pyomo/data/parse_datacmds.py',514),
+  ('items -> items WORDWITHINDEX','items',2,'p_items','coopr/pyomo/data/parse_datacmds.py',515),
+  ('items -> items WORDWITHSQUOTEDINDEX','items',2,'p_items','coopr/pyomo/data/parse_datacmds.py',516),
+  ('items -> items NONWORD','items',2,'p_items','coopr/pyomo/data/parse_datacmds.py',517),
+  ('items -> items STRING','items',2,'p_items','coopr/pyomo/data/parse_datacmds.py',518),
+  ('items -> items QUOTEDSTRING','items',2,'p_items','coopr/pyomo/data/parse_datacmds.py',519),
+  ('items -> items COMMA','items',2,'p_items','coopr/pyomo/data/parse_datacmds.py',520),
+  ('items -> items COLON','items',2,'p_items','coopr/pyomo/data/parse_datacmds.py',521),
+  ('items -> items LBRACE','items',2,'p_items','coopr/pyomo/data/parse_datacmds.py',522),
+  ('items -> items RBRACE','items',2,'p_items','coopr/pyomo/data/parse_datacmds.py',523),
+  ('items -> items LBRACKET','items',2,'p_items','coopr/pyomo/data/parse_datacmds.py',524),
+  ('items -> items RBRACKET','items',2,'p_items','coopr/pyomo/data/parse_datacmds.py',525),
+  ('items -> items TR','items',2,'p_items','coopr/pyomo/data/parse_datacmds.py',526),
+  ('items -> items LPAREN','items',2,'p_items','coopr/pyomo/data/parse_datacmds.py',527),
+  ('items -> items RPAREN','items',2,'p_items','coopr/pyomo/data/parse_datacmds.py',528),
+  ('items -> items ASTERISK','items',2,'p_items','coopr/pyomo/data/parse_datacmds.py',529),
+  ('items -> items set_template','items',2,'p_items','coopr/pyomo/data/parse_datacmds.py',530),
+  ('items -> items param_template','items',2,'p_items','coopr/pyomo/data/parse_datacmds.py',531),
+  ('items -> WORD','items',1,'p_items','coopr/pyomo/data/parse_datacmds.py',532),
+  ('items -> WORDWITHINDEX','items',1,'p_items','coopr/pyomo/data/parse_datacmds.py',533),
+  ('items -> WORDWITHSQUOTEDINDEX','items',1,'p_items','coopr/pyomo/data/parse_datacmds.py',534),
+  ('items -> NONWORD','items',1,'p_items','coopr/pyomo/data/parse_datacmds.py',535),
+  ('items -> STRING','items',1,'p_items','coopr/pyomo/data/parse_datacmds.py',536),
+  ('items -> QUOTEDSTRING','items',1,'p_items','coopr/pyomo/data/parse_datacmds.py',537),
+  ('items -> COMMA','items',1,'p_items','coopr/pyomo/data/parse_datacmds.py',538),
+  ('items -> COLON','items',1,'p_items','coopr/pyomo/data/parse_datacmds.py',539),
+  ('items -> LBRACE','items',1,'p_items','coopr/pyomo/data/parse_datacmds.py',540),
+  ('items -> RBRACE','items',1,'p_items','coopr/pyomo/data/parse_datacmds.py',541),
+  ('items -> LBRACKET','items',1,'p_items','coopr/pyomo/data/parse_datacmds.py',542),
+  ('items -> RBRACKET','items',1,'p_items','coopr/pyomo/data/parse_datacmds.py',543),
+  ('items -> TR','items',1,'p_items','coopr/pyomo/data/parse_datacmds.py',544),
+  ('items -> LPAREN','items',1,'p_items','coopr/pyomo/data/parse_datacmds.py',545),
+  ('items -> RPAREN','items',1,'p_items','coopr/pyomo/data/parse_datacmds.py',546),
+  ('items -> ASTERISK','items',1,'p_items','coopr/pyomo/data/parse_datacmds.py',547),
+  ('items -> set_template','items',1,'p_items','coopr/pyomo/data/parse_datacmds.py',548),
+  ('items -> param_template','items',1,'p_items','coopr/pyomo/data/parse_datacmds.py',549),
+  ('filename -> WORD','filename',1,'p_filename','coopr/pyomo/data/parse_datacmds.py',571),
+  ('filename -> STRING','filename',1,'p_filename','coopr/pyomo/data/parse_datacmds.py',572),
+  ('filename -> QUOTEDSTRING','filename',1,'p_filename','coopr/pyomo/data/parse_datacmds.py',573),
+  ('filename -> FILENAME','filename',1,'p_filename','coopr/pyomo/data/parse_datacmds.py',574),
+  ('filename -> WORD COLON FILENAME','filename',3,'p_filename','coopr/pyomo/data/parse_datacmds.py',575),
 ]
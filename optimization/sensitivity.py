@@ -0,0 +1,458 @@
+from __future__ import division
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse import linalg
+
+
+def solver_duals(results, name, index):
+    """
+    Duals reported by the solver for the constraints name[i], i in index.
+    The instance must have been solved with suffixes=['dual'] (see
+    solve_with_duals). Constraints missing from the results have a dual of
+    zero.
+
+    Arguments:
+
+        results: (object) Results returned by the solver.
+        name:    (str) Name of an indexed constraint (e.g.,
+                 'budget_constraints').
+        index:   (list) Members of the index set (e.g., instance.periods).
+
+    Returns:
+
+        duals: (array) Dual of each constraint.
+
+    """
+    constraints = results.solution(0).constraint
+    keys = ['%s[%s]' % (name, i) for i in index]
+    return np.array([constraints[key].get('Dual', 0.0) if key in constraints else 0.0
+                     for key in keys])
+
+
+def solver_reduced_costs(results, name, index):
+    """Reduced costs reported by the solver for the vars name[i], i in index."""
+    variables = results.solution(0).variable
+    keys = ['%s[%s]' % (name, i) for i in index]
+    return np.array([variables[key].get('Rc', 0.0) if key in variables else 0.0
+                     for key in keys])
+
+
+def solve_with_duals(instance, solver='ipopt', **kwargs):
+    """
+    Solve instance asking the solver to return duals and reduced costs
+    along with the primal solution.
+
+    Returns:
+
+        results: (object) Results returned by the solver.
+
+    """
+    from coopr import opt
+    results = opt.SolverFactory(solver).solve(instance, suffixes=['dual', 'rc'], **kwargs)
+    instance.load(results)
+    return results
+
+
+def marginal_values(instance, results):
+    """
+    Shadow prices of the budget and borrowing constraints and reduced costs
+    of consumption, as reported by the solver, for an instance of one of
+    the lifecycle models solved with solve_with_duals.
+
+    Returns:
+
+        values: (dict) Arrays keyed by 'budget_constraints',
+                'borrowing_constraint' and 'consumption'.
+
+    """
+    periods = list(instance.periods)
+    return {'budget_constraints': solver_duals(results, 'budget_constraints', periods),
+            'borrowing_constraint': solver_duals(results, 'borrowing_constraint', periods),
+            'consumption': solver_reduced_costs(results, 'consumption', periods)}
+
+
+def lifecycle_params(instance):
+    """
+    Parameters of a constructed instance of lifecycle.py or
+    lifecycle_with_labor.py as a dict of floats (w is an array).
+
+    """
+    from coopr import pyomo
+    params = dict((name, pyomo.value(getattr(instance, name)))
+                  for name in ('beta', 'theta', 'r', 'minimum_assets'))
+    params['eta'] = pyomo.value(instance.eta) if hasattr(instance, 'eta') else None
+    params['w'] = np.array([pyomo.value(instance.w[t]) for t in instance.periods])
+    return params
+
+
+def lifecycle_solution(instance):
+    """
+    Primal solution of a solved instance of lifecycle.py or
+    lifecycle_with_labor.py.
+
+    Returns:
+
+        c: (array) Consumption in periods 0, ..., T.
+        l: (array) Labor supply in periods 0, ..., T (None for lifecycle.py).
+        A: (array) Assets in periods 0, ..., T + 1.
+
+    """
+    c = np.array([instance.consumption[t].value for t in instance.periods])
+    A = np.array([instance.assets[t].value for t in sorted(instance.assets.keys())])
+    if hasattr(instance, 'labor_supply'):
+        l = np.array([instance.labor_supply[t].value for t in instance.periods])
+    else:
+        l = None
+    return c, l, A
+
+
+def _constraint_matrices(params, active, labor):
+    """
+    Linear constraints of the lifecycle problem with variables
+    x = (c, l, A) (or x = (c, A) without labor supply):
+
+        J x + h0 = 0    budget constraints, endowment and no bequests
+        G x - A_min >= 0    borrowing constraints (active ones only)
+
+    """
+    w, r = params['w'], params['r']
+    n_periods = w.size
+    n_assets = n_periods + 1
+    n_labor = n_periods if labor else 0
+    n = n_periods + n_labor + n_assets
+
+    periods = np.arange(n_periods)
+    c_col = periods
+    l_col = n_periods + periods
+    A_col = n_periods + n_labor + np.arange(n_assets)
+
+    # w_t l_t + (1 + r) A_t - c_t - A_{t+1} = 0 (without labor w_t is a constant)
+    rows = [periods, periods, periods]
+    cols = [A_col[:-1], c_col, A_col[1:]]
+    vals = [np.full(n_periods, 1 + r), -np.ones(n_periods), -np.ones(n_periods)]
+    if labor:
+        rows.append(periods)
+        cols.append(l_col)
+        vals.append(w)
+
+    # A_0 = 0 and A_{T+1} = 0
+    rows.append(np.array([n_periods, n_periods + 1]))
+    cols.append(A_col[[0, -1]])
+    vals.append(np.ones(2))
+
+    J = sparse.csr_matrix((np.concatenate(vals), (np.concatenate(rows), np.concatenate(cols))),
+                          shape=(n_periods + 2, n))
+    h0 = np.zeros(n_periods + 2)
+    if not labor:
+        h0[:n_periods] = w
+
+    active_periods = np.flatnonzero(active)
+    G = sparse.csr_matrix((np.ones(active_periods.size), (np.arange(active_periods.size),
+                                                          A_col[active_periods])),
+                          shape=(active_periods.size, n))
+    return J, h0, G
+
+
+def _utility_derivatives(params, x, labor):
+    """
+    Gradient and (diagonal) Hessian of lifetime utility. In periods without
+    wages labor supply is zero at the optimum (a corner where the Hessian
+    vanishes), so there the stationarity condition is replaced by l_t = 0.
+
+    """
+    beta, theta, eta = params['beta'], params['theta'], params['eta']
+    n_periods = params['w'].size
+    discount = beta**np.arange(n_periods)
+
+    c = x[:n_periods]
+    grad = np.zeros(x.size)
+    hess = np.zeros(x.size)
+    grad[:n_periods] = discount * c**-theta
+    hess[:n_periods] = -theta * discount * c**(-theta - 1)
+    if labor:
+        l = x[n_periods:2 * n_periods]
+        retired = params['w'] == 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            grad[n_periods:2 * n_periods] = np.where(retired, l, -discount * l**eta)
+            hess[n_periods:2 * n_periods] = np.where(retired, 1.0, -eta * discount * l**(eta - 1))
+    return grad, hess
+
+
+def kkt_residual(params, z, active, labor=True):
+    """
+    Residual of the KKT conditions of the lifecycle problem for the stacked
+    primal-dual vector z = (x, lambda, mu), where lambda are the multipliers
+    on the budget constraints, endowment and no bequests and mu those on the
+    active borrowing constraints.
+
+    """
+    J, h0, G = _constraint_matrices(params, active, labor)
+    n, n_eq = J.shape[1], J.shape[0]
+    x, lam, mu = z[:n], z[n:n + n_eq], z[n + n_eq:]
+    grad, hess = _utility_derivatives(params, x, labor)
+    return np.concatenate((grad + J.T.dot(lam) + G.T.dot(mu),
+                           J.dot(x) + h0,
+                           G.dot(x) - params['minimum_assets']))
+
+
+def kkt_matrix(params, z, active, labor=True):
+    """Jacobian of kkt_residual with respect to z (a sparse matrix)."""
+    J, h0, G = _constraint_matrices(params, active, labor)
+    n = J.shape[1]
+    grad, hess = _utility_derivatives(params, z[:n], labor)
+    return sparse.bmat([[sparse.diags(hess), J.T, G.T],
+                        [J, None, None],
+                        [G, None, None]], format='csc')
+
+
+def kkt_multipliers(params, c, l, A, tol=1e-8):
+    """
+    Multipliers of the lifecycle problem implied by a primal solution,
+    found by solving the stationarity conditions. Unlike solver duals they
+    do not depend on the sign conventions of any particular solver: the
+    multipliers on the budget constraints are the (discounted) marginal
+    values of wealth and those on the borrowing constraints are
+    nonnegative.
+
+    Arguments:
+
+        params: (dict) Parameters (see lifecycle_params).
+        c:      (array) Consumption in periods 0, ..., T.
+        l:      (array) Labor supply (None for lifecycle.py).
+        A:      (array) Assets in periods 0, ..., T + 1.
+        tol:    (float) Borrowing constraints with A_t - A_min < tol are
+                treated as active.
+
+    Returns:
+
+        z:      (array) Stacked primal-dual vector (see kkt_residual).
+        active: (array) Boolean mask of the active borrowing constraints.
+
+    """
+    labor = l is not None
+    x = np.concatenate([c] + ([l] if labor else []) + [A])
+    active = A[:-1] - params['minimum_assets'] < tol
+
+    # A_0 is pinned by the endowment, so its borrowing constraint is redundant
+    active[0] = False
+
+    J, h0, G = _constraint_matrices(params, active, labor)
+    grad, hess = _utility_derivatives(params, x, labor)
+    M = sparse.hstack((J.T, G.T)).toarray()
+    multipliers = np.linalg.lstsq(M, -grad, rcond=None)[0]
+
+    return np.concatenate((x, multipliers)), active
+
+
+def _initial_guess(params, labor):
+    """
+    Starting point for solve_kkt: constant consumption equal to the annuity
+    value of wage income (working full time), the implied labor supply and
+    the assets that follow from the budget constraints.
+
+    """
+    w, r, theta, eta = params['w'], params['r'], params['theta'], params['eta']
+    discount = (1 + r)**-np.arange(w.size)
+    c = np.full(w.size, max(w.dot(discount) / discount.sum(), 1e-2))
+    if labor:
+        l = np.where(w > 0, (w * c**-theta)**(1 / eta), 0.0)
+        income = w * l
+    else:
+        l = None
+        income = w
+    A = np.zeros(w.size + 1)
+    for t in range(w.size):
+        A[t + 1] = income[t] + (1 + r) * A[t] - c[t]
+    return kkt_multipliers(params, c, l, A)
+
+
+def _interior(params, z, labor):
+    """Is z in the domain of the utility function?"""
+    n_periods = params['w'].size
+    if not np.all(z[:n_periods] > 0):
+        return False
+    if labor:
+        l = z[n_periods:2 * n_periods]
+        return bool(np.all(l[params['w'] > 0] > 0))
+    return True
+
+
+def _newton(params, z, active, labor, tol, max_iter):
+    """Damped Newton's method on the KKT conditions for a given active set."""
+    resid = kkt_residual(params, z, active, labor)
+    norm = np.max(np.abs(resid))
+    for n_iter in range(max_iter):
+        if norm < tol:
+            return z
+        step = linalg.spsolve(kkt_matrix(params, z, active, labor), -resid)
+
+        # backtrack until the residuals fall (and consumption stays positive)
+        size = 1.0
+        while size > 1e-10:
+            new_z = z + size * step
+            if _interior(params, new_z, labor):
+                new_resid = kkt_residual(params, new_z, active, labor)
+                new_norm = np.max(np.abs(new_resid))
+                if new_norm < norm:
+                    break
+            size /= 2
+        else:
+            raise RuntimeError("Newton step failed to reduce the KKT residuals.")
+
+        z, resid, norm = new_z, new_resid, new_norm
+
+    raise RuntimeError("Newton failed to converge after %i iterations." % max_iter)
+
+
+def solve_kkt(params, z=None, active=None, labor=True, tol=1e-10, max_iter=100):
+    """
+    Solve the lifecycle problem (lifecycle.py or lifecycle_with_labor.py)
+    directly from its KKT conditions: damped Newton's method for a given
+    set of binding borrowing constraints, inside an active set loop that
+    adds violated constraints and drops those with negative multipliers.
+
+    Starting from the solution for nearby parameters (z and active) usually
+    takes only a couple of Newton steps.
+
+    Arguments:
+
+        params:   (dict) Parameters (see lifecycle_params).
+        z:        (array) Starting primal-dual vector. Default is a guess
+                  based on constant consumption.
+        active:   (array) Starting active set matching z.
+        labor:    (boolean) Does the model include labor supply?
+        tol:      (float) Convergence criterion on the KKT residuals.
+        max_iter: (int) Maximum number of Newton steps per active set.
+
+    Returns:
+
+        z:      (array) Primal-dual solution (see split_solution).
+        active: (array) Boolean mask of the binding borrowing constraints.
+
+    """
+    if z is None:
+        z, active = _initial_guess(params, labor)
+
+    n_periods = params['w'].size
+    n = n_periods * (3 if labor else 2) + 1
+    n_eq = n_periods + 2
+
+    for _ in range(n_periods + 1):
+        z = _newton(params, z, active, labor, tol, max_iter)
+
+        assets = z[n - n_periods - 1:n - 1]
+        mu = np.zeros(n_periods)
+        mu[active] = z[n + n_eq:]
+
+        add = ~active & (assets < params['minimum_assets'] - tol)
+        add[0] = False
+        drop = active & (mu < -tol)
+        if not add.any() and not drop.any():
+            return z, active
+
+        new_active = (active | add) & ~drop
+        z = np.concatenate((z[:n + n_eq], mu[new_active]))
+        active = new_active
+
+    raise RuntimeError("Active set iterations failed to converge.")
+
+
+def _param_derivatives(params, z, active, labor, names, step=1e-6):
+    """Derivatives of kkt_residual with respect to the named parameters."""
+    columns = []
+    for name in names:
+        up, down = dict(params), dict(params)
+        up[name] = params[name] + step
+        down[name] = params[name] - step
+        columns.append((kkt_residual(up, z, active, labor) -
+                        kkt_residual(down, z, active, labor)) / (2 * step))
+    return np.column_stack(columns)
+
+
+def parametric_update(params, z, active, changes, labor=True, newton_steps=1):
+    """
+    Update a solution of the lifecycle problem for small changes in scalar
+    parameters (e.g., r, beta or minimum_assets) without re-solving. The
+    KKT matrix at the current solution is factored once; the first order
+    prediction dz = -K^{-1} dF/dp dp for every scenario comes from one solve
+    with many right hand sides, and each scenario is then refined by
+    newton_steps chord steps that reuse the same factorization.
+
+    The active set of borrowing constraints is held fixed, which is
+    accurate as long as the changes are small enough not to make a
+    constraint bind or go slack; valid flags the scenarios for which that
+    holds.
+
+    Arguments:
+
+        params:       (dict) Parameters at the current solution.
+        z:            (array) Current primal-dual solution and
+        active:       (array) active set, e.g., from kkt_multipliers.
+        changes:      (dict) Changes in parameters, name -> array of shape
+                      (k,) (or scalars), one entry per scenario.
+        labor:        (boolean) Does the model include labor supply?
+        newton_steps: (int) Number of corrector steps.
+
+    Returns:
+
+        Z:     (array) Updated primal-dual solutions with shape (k, z.size).
+        valid: (array) Boolean mask of scenarios whose active set is
+               unchanged.
+
+    """
+    names = sorted(changes)
+    dp = np.column_stack([np.atleast_1d(np.asarray(changes[name], dtype=float))
+                          for name in names])
+    dp = np.broadcast_to(dp, (max(dp.shape[0], 1), len(names)))
+
+    K = linalg.splu(kkt_matrix(params, z, active, labor))
+    dF = _param_derivatives(params, z, active, labor, names)
+    Z = z + K.solve(-dF.dot(dp.T)).T
+
+    n_periods = params['w'].size
+    n = 2 * n_periods + (n_periods if labor else 0) + 1
+    valid = np.ones(Z.shape[0], dtype=bool)
+    for k in range(Z.shape[0]):
+        new_params = dict(params)
+        for name, change in zip(names, dp[k]):
+            new_params[name] = params[name] + change
+        for _ in range(newton_steps):
+            Z[k] -= K.solve(kkt_residual(new_params, Z[k], active, labor))
+
+        # slack constraints must stay feasible and binding ones keep mu >= 0
+        assets = Z[k, n - n_periods - 1:n - 1]
+        mu = Z[k, Z.shape[1] - active.sum():]
+        slack = ~active
+        valid[k] = (np.all(assets[slack] >= new_params['minimum_assets']) and
+                    np.all(mu >= 0))
+
+    return Z, valid
+
+
+def split_solution(z, n_periods, labor=True):
+    """
+    Split a primal-dual vector into its parts.
+
+    Returns:
+
+        c:                (array) Consumption.
+        l:                (array) Labor supply (None without labor).
+        A:                (array) Assets.
+        budget_duals:     (array) Multipliers on the budget constraints,
+                          i.e., marginal (discounted) values of wealth.
+        borrowing_duals:  (array) Multipliers on the active borrowing
+                          constraints.
+
+    """
+    c = z[..., :n_periods]
+    offset = n_periods
+    l = None
+    if labor:
+        l = z[..., offset:offset + n_periods]
+        offset += n_periods
+    A = z[..., offset:offset + n_periods + 1]
+    offset += n_periods + 1
+    budget_duals = z[..., offset:offset + n_periods]
+    borrowing_duals = z[..., offset + n_periods + 2:]
+    return c, l, A, budget_duals, borrowing_duals
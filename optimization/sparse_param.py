@@ -0,0 +1,139 @@
+from __future__ import division
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+import numpy as np
+from scipy import sparse
+
+
+class SparseParam(Mapping):
+    """
+    Read-only mapping from integer indices to values for the data of an
+    indexed param, stored as contiguous COO arrays (one integer column per
+    index plus a column of values) instead of one dict entry per index.
+    Indices are kept sorted so that single entries can be looked up by
+    binary search, and the whole param converts to a scipy.sparse matrix
+    without copying element by element.
+
+    Attributes:
+
+        index:  (array) Indices with shape (nnz, dim), sorted.
+        values: (array) Values with shape (nnz,).
+
+    """
+
+    def __init__(self, index, values):
+        index = np.asarray(index)
+        if index.ndim == 1:
+            index = index[:, np.newaxis]
+        values = np.asarray(values, dtype=float).ravel()
+        if index.shape[0] != values.size:
+            raise ValueError("index and values must have the same length.")
+
+        # smallest integer type that holds the indices
+        dtype = np.int32 if index.size == 0 or np.abs(index).max() < 2**31 else np.int64
+        index = index.astype(dtype)
+
+        # row major position of each index within the bounding box
+        if index.shape[0] > 0:
+            self._lower = index.min(axis=0).astype(np.int64)
+            self._upper = index.max(axis=0).astype(np.int64)
+        else:
+            self._lower = self._upper = np.zeros(index.shape[1], dtype=np.int64)
+        extent = self._upper - self._lower + 1
+        self._strides = np.append(np.cumprod(extent[::-1])[::-1][1:], 1)
+
+        # sort by index, keeping the last of any duplicates as a dict would
+        linear = (index - self._lower).dot(self._strides)
+        order = np.argsort(linear, kind='mergesort')
+        linear = linear[order]
+        keep = np.append(linear[1:] != linear[:-1], True)
+
+        self.index = np.ascontiguousarray(index[order][keep])
+        self.values = np.ascontiguousarray(values[order][keep])
+        self._linear = linear[keep]
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create a SparseParam from a dict of param data."""
+        keys = list(data.keys())
+        return cls(np.array(keys), np.array([data[key] for key in keys], dtype=float))
+
+    @property
+    def dim(self):
+        """Number of indices of the param."""
+        return self.index.shape[1]
+
+    def _key(self, key):
+        """Row of the entry for key, or -1 if there is none."""
+        try:
+            key = np.atleast_1d(np.asarray(key))
+        except (TypeError, ValueError):
+            return -1
+        if (key.shape != (self.dim,) or not np.issubdtype(key.dtype, np.number) or
+                np.any(key < self._lower) or np.any(key > self._upper)):
+            return -1
+        linear = (key - self._lower).dot(self._strides)
+        pos = np.searchsorted(self._linear, linear)
+        if pos < self._linear.size and self._linear[pos] == linear:
+            return pos
+        return -1
+
+    def __len__(self):
+        return self.values.size
+
+    def __iter__(self):
+        if self.dim == 1:
+            return iter(self.index[:, 0].tolist())
+        return iter(map(tuple, self.index.tolist()))
+
+    def __getitem__(self, key):
+        pos = self._key(key)
+        if pos < 0:
+            raise KeyError(key)
+        return float(self.values[pos])
+
+    def __contains__(self, key):
+        return self._key(key) >= 0
+
+    def tocoo(self, shape=None, offset=1):
+        """
+        The data of a param with two indices as a scipy.sparse.coo_matrix.
+
+        Arguments:
+
+            shape:  (tuple) Shape of the matrix. Default is the smallest
+                    shape that holds every entry.
+            offset: (int) Index corresponding to the first row and column.
+                    Default is 1, as in the .dat files.
+
+        """
+        if self.dim != 2:
+            raise ValueError("Only params with two indices convert to a matrix.")
+        rows = self.index[:, 0] - offset
+        cols = self.index[:, 1] - offset
+        if shape is None:
+            shape = (rows.max() + 1, cols.max() + 1)
+        return sparse.coo_matrix((self.values, (rows, cols)), shape=shape)
+
+    def tocsr(self, shape=None, offset=1):
+        """The data of a param with two indices as a scipy.sparse.csr_matrix."""
+        return self.tocoo(shape, offset).tocsr()
+
+    def toarray(self, size=None, offset=1):
+        """
+        The data of a param with one index as a dense array, with zeros for
+        missing entries.
+
+        """
+        if self.dim != 1:
+            raise ValueError("Only params with one index convert to a vector.")
+        positions = self.index[:, 0] - offset
+        if size is None:
+            size = positions.max() + 1
+        out = np.zeros(size)
+        out[positions] = self.values
+        return out
@@ -0,0 +1,130 @@
+from __future__ import division
+import importlib
+import os
+import subprocess
+import sys
+import time
+import types
+
+import dat_loader
+
+
+class LazyModule(types.ModuleType):
+    """
+    Stand-in for a module that is only imported the first time one of its
+    attributes is used. Solver plugins (coopr.opt) are expensive to import
+    and are not needed until a model is actually solved.
+
+    Note that coopr.pyomo imports coopr.opt itself, so this only saves time
+    in processes that never import coopr.pyomo (e.g., ones that only read
+    data with dat_loader or solve with batch_lp). Building any Pyomo model
+    pays for coopr.opt anyway.
+
+    """
+
+    def __init__(self, name):
+        super(LazyModule, self).__init__(name)
+        self.__dict__['_module'] = None
+
+    def _load(self):
+        """Import the underlying module (once)."""
+        if self.__dict__['_module'] is None:
+            self.__dict__['_module'] = importlib.import_module(self.__name__)
+        return self.__dict__['_module']
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+
+def lazy_import(name):
+    """Return a LazyModule for the module name."""
+    return LazyModule(name)
+
+
+# solver plugins are only loaded when a solver is requested
+opt = lazy_import('coopr.opt')
+
+# directory holding the lifecycle models and their data
+_here = os.path.dirname(os.path.abspath(__file__))
+
+
+def solve_lifecycle(model_module, filename, solver='ipopt', cache=True, **kwargs):
+    """
+    Create and solve an instance of one of the lifecycle models with a
+    smaller start-up cost: data are read by the fast (and cached) loader so
+    the PLY parser tables are never built.
+
+    Arguments:
+
+        model_module: (str) Name of the module defining the abstract model
+                      (e.g., 'lifecycle_with_labor').
+        filename:     (str) Path to the .dat file.
+        solver:       (str) Name of the solver passed to SolverFactory.
+        cache:        (boolean) Should parsed data be cached on disk?
+
+    Returns:
+
+        instance: (object) The solved model instance.
+        results:  (object) Results returned by the solver.
+
+    """
+    model = importlib.import_module(model_module).model
+    instance = dat_loader.create_instance(model, filename, cache=cache)
+    results = opt.SolverFactory(solver).solve(instance, **kwargs)
+    instance.load(results)
+    return instance, results
+
+
+def time_statement(statement, repeat=3, python=sys.executable, cwd=None):
+    """
+    Wall clock time (best of repeat) to run statement in a fresh Python
+    interpreter started in the directory cwd, i.e., including the cold
+    start cost of every import.
+
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.time()
+        subprocess.check_call([python, '-c', statement], cwd=cwd)
+        best = min(best, time.time() - start)
+    return best
+
+
+def benchmark_startup(statements=None, repeat=3):
+    """
+    Benchmark the cold start of the pieces that make up a lifecycle solve.
+
+    Arguments:
+
+        statements: (list) (label, statement) pairs to time. Default times
+                    the bare interpreter, numpy, coopr.pyomo, coopr.opt,
+                    one of the lifecycle models and loading its data.
+                    Statements run in the directory of this module
+                    whatever the current working directory.
+        repeat:     (int) Number of runs of each statement.
+
+    Returns:
+
+        timings: (list) (label, seconds) pairs.
+
+    """
+    if statements is None:
+        statements = [('python', 'pass'),
+                      ('numpy', 'import numpy'),
+                      ('coopr.pyomo', 'from coopr import pyomo'),
+                      ('coopr.opt', 'from coopr import opt'),
+                      ('lifecycle_with_labor', 'import lifecycle_with_labor'),
+                      ('create instance', 'import lifecycle_with_labor, dat_loader; '
+                                          'dat_loader.create_instance(lifecycle_with_labor.model, '
+                                          '%r)' % os.path.join(_here, 'lifecycle_with_labor.dat'))]
+
+    timings = []
+    for label, statement in statements:
+        timings.append((label, time_statement(statement, repeat, cwd=_here)))
+    return timings
+
+
+if __name__ == '__main__':
+
+    for label, seconds in benchmark_startup():
+        sys.stdout.write('%-22s %8.3f s\n' % (label, seconds))